@@ -0,0 +1,24 @@
+"""
+Lazy package exports (PEP 562): public names resolve their submodule on first access,
+so importing a package does not pull in mlflow, joblib, pandas or sklearn until they are used.
+"""
+from __future__ import annotations
+
+import importlib
+from typing import Any, Callable
+
+
+def lazy_exports(package: str, exports: dict[str, str]) -> tuple[Callable[[str], Any], Callable[[], list[str]], list[str]]:
+    """Return (__getattr__, __dir__, __all__) for a package. exports maps public name -> relative submodule."""
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        setattr(importlib.import_module(package), name, value)  # cache: next access skips __getattr__
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(importlib.import_module(package))) | set(exports))
+
+    return __getattr__, __dir__, list(exports)
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """
-Foundation CLI: train, eval, validate, deploy (and rollback).
+Foundation CLI: train, eval, validate, profile (data stats), run-all (every model in parallel), export (compact
+variant), deploy (and rollback), loadtest (serving capacity gate), monitor (fleet KPIs).
 """
 from __future__ import annotations
 
@@ -15,32 +16,18 @@ if str(_REPO_ROOT) not in sys.path:
 
 
 def _load_config(model_name: str | None) -> dict:
-    import yaml
-    defaults = _REPO_ROOT / "foundation" / "config" / "defaults.yaml"
-    config = {}
-    if defaults.exists():
-        config = yaml.safe_load(defaults.read_text()) or {}
-    if model_name:
-        model_yaml = _REPO_ROOT / "models" / model_name / "model.yaml"
-        if model_yaml.exists():
-            model_cfg = yaml.safe_load(model_yaml.read_text()) or {}
-            for k, v in model_cfg.items():
-                if isinstance(v, dict) and k in config and isinstance(config[k], dict):
-                    config[k] = {**config[k], **v}
-                else:
-                    config[k] = v
-    return config
+    from foundation.core.config import load_config
+    return load_config(model_name)
 
 
 def cmd_validate(args: argparse.Namespace) -> int:
-    from foundation.data.validate import validate_dataframe, load_contract_from_dict
+    from foundation.core.config import load_contract
+    from foundation.data.validate import validate_dataframe
     import pandas as pd
-    config = _load_config(args.model)
-    contract_dict = config.get("data_contract", {})
-    if not contract_dict:
+    contract = load_contract(args.model)
+    if contract is None:
         print("No data_contract in model config", file=sys.stderr)
         return 1
-    contract = load_contract_from_dict(contract_dict)
     df = pd.read_csv(args.data)
     errors = validate_dataframe(df, contract)
     if errors:
@@ -51,6 +38,28 @@ def cmd_validate(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_profile(args: argparse.Namespace) -> int:
+    """One-pass column statistics for the contract fields; saved as runs/<run_id>/profile.json with --run-id."""
+    import json
+    from foundation.core.config import load_contract
+    from foundation.data.profile import profile_file, write_profile
+    config = _load_config(args.model)
+    contract = load_contract(args.model)
+    if contract is None:
+        print("No data_contract in model config", file=sys.stderr)
+        return 1
+    options = dict(config.get("profile", {}))
+    if args.workers is not None:
+        options["workers"] = args.workers
+    data = args.data or config.get("data", {}).get("train_path", "data/train.csv")
+    profile = profile_file(data, contract, options)
+    if args.run_id:
+        print(f"Profile: {write_profile(profile, _run_dir(config, args.run_id), source=str(data))}")
+    else:
+        print(json.dumps(profile.to_dict(), indent=2, default=str))
+    return 0
+
+
 def _run_dir(config: dict, run_id: str) -> Path:
     """Canonical run directory: runs/<run_id>/ (with artifact/ inside)."""
     runs_root = Path(config.get("runs", {}).get("root") or config.get("artifacts", {}).get("root", "./runs"))
@@ -80,15 +89,23 @@ def cmd_train(args: argparse.Namespace) -> int:
     )
     run_id = result.get("run_id", run_id)
     metrics = result.get("metrics") or {}
-    params = {"model": args.model, "dataset": dataset, "data_path": data_path, "run_id": run_id}
+    params = {"model": args.model, "dataset": dataset, "data_path": data_path, "run_id": run_id, **(result.get("params") or {})}
     meta = {"run_id": run_id, "model_name": args.model, "dataset": dataset, "artifact_path": str(output_path)}
     meta["timestamp"] = datetime.now().isoformat()
     (run_dir / "metrics.json").write_text(json.dumps(metrics, indent=2))
     (run_dir / "params.json").write_text(json.dumps(params, indent=2))
     (run_dir / "meta.json").write_text(json.dumps(meta, indent=2))
-    reg = Registry(backend=config.get("registry", {}).get("backend", "local"), uri=config.get("registry", {}).get("uri", "./registry"))
+    reg_cfg = config.get("registry", {})
+    reg = Registry(
+        backend=reg_cfg.get("backend", "local"),
+        uri=reg_cfg.get("uri", "./registry"),
+        async_logging=reg_cfg.get("async_logging", False),
+        log_queue_size=reg_cfg.get("log_queue_size", 1000),
+        log_retries=reg_cfg.get("log_retries", 3),
+    )
     reg.log_run(args.model, run_id, metrics=metrics, params=params, artifact_path=str(output_path))
     print(f"Run ID: {run_id}, run_dir: {run_dir}")
+    reg.close()  # async_logging: wait for queued MLflow uploads before exiting
     return 0
 
 
@@ -111,14 +128,41 @@ def cmd_eval(args: argparse.Namespace) -> int:
         model_path=model_path,
         eval_data_path=eval_data,
         config=config,
+        registry=reg,
+        force=getattr(args, "force", False),
     )
+    print("cached:", result["cached"])
     print("gate_passed:", result["gate_passed"])
     print("metrics:", result["metrics"])
+    if "intervals" in result:
+        print("intervals:", result["intervals"])
+    if "compact" in result:
+        print("compact delta:", result["compact"]["delta"])
     if not result["gate_passed"]:
         print("Eval gates failed; CI would block promotion.", file=sys.stderr)
     return 0 if result["gate_passed"] else EVAL_GATE_FAIL_EXIT_CODE
 
 
+def cmd_run_all(args: argparse.Namespace) -> int:
+    """validate -> train -> eval for every model (or --model ...) as parallel subprocesses; CI entrypoint."""
+    import json
+    from foundation.core.jobs import run_models
+    try:
+        result = run_models(models=args.model, jobs=args.jobs)
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    print(f"{'model':<24} {'status':<12} {'validate':>9} {'train':>9} {'eval':>9} {'total':>9}")
+    for name, rec in result["models"].items():
+        cols = [f"{rec['steps'][s]['duration_sec']:.2f}s" if s in rec["steps"] else "-" for s in ("validate", "train", "eval")]
+        print(f"{name:<24} {rec['status']:<12} {cols[0]:>9} {cols[1]:>9} {cols[2]:>9} {rec['duration_sec']:>8.2f}s")
+    serial = sum(rec["duration_sec"] for rec in result["models"].values())
+    print(f"Wall: {result['duration_sec']:.2f}s (sum of model chains: {serial:.2f}s), exit code {result['exit_code']}")
+    if args.summary:
+        Path(args.summary).write_text(json.dumps(result, indent=2))
+    return result["exit_code"]
+
+
 def cmd_register(args: argparse.Namespace) -> int:
     """Register a run in MLflow and set stage (dev/staging/prod)."""
     import json
@@ -141,6 +185,30 @@ def cmd_register(args: argparse.Namespace) -> int:
     return 1
 
 
+def cmd_export(args: argparse.Namespace) -> int:
+    """Write the compact variant (model.compact.npz + compact.json) next to a run's model.bin."""
+    from foundation.core.compact import export_compact
+    from foundation.core.registry import Registry
+    config = _load_config(args.model)
+    reg = Registry(backend=config.get("registry", {}).get("backend", "local"), uri=config.get("registry", {}).get("uri", "./registry"))
+    artifact_path = reg.get_run(args.model, args.run_id).get("artifact_path") or str(_run_dir(config, args.run_id) / "artifact")
+    max_loss = args.max_metric_loss if args.max_metric_loss is not None else config.get("compact", {}).get("max_metric_loss")
+    eval_data = args.eval_data or config.get("data", {}).get("eval_path", "data/eval.csv")
+    try:
+        info = export_compact(args.model, artifact_path, config, eval_data, max_metric_loss=max_loss, n_trees=args.trees)
+    except (ValueError, FileNotFoundError) as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    print(f"Compact variant: {info['trees']}/{info['trees_full']} trees, {info['nodes']} nodes ({info['pruned_nodes']} pruned)")
+    print(f"Size {info['bytes'] / 1024:.1f} KiB vs {info['bytes_full'] / 1024:.1f} KiB; "
+          f"load {info['load_ms']:.2f} ms vs {info['load_ms_full']:.2f} ms")
+    if info["selection"]:
+        sel = info["selection"]
+        print(f"{sel['metric']}: {sel['score']:.4f} (all trees {sel['score_all_trees']:.4f}, max loss {sel['max_loss']})")
+    print(f"Written to {Path(artifact_path) / 'model.compact.npz'}; foundation eval reports the metric delta")
+    return 0
+
+
 def cmd_deploy(args: argparse.Namespace) -> int:
     """Copy artifact to deployments/embedded/<model>/model.bin and optionally save baseline if stage=prod."""
     from foundation.core.registry import Registry
@@ -155,14 +223,107 @@ def cmd_deploy(args: argparse.Namespace) -> int:
     run_dir = _run_dir(config, run_id)
     artifact_path = run_info.get("artifact_path") or str(run_dir / "artifact")
     metrics = run_info.get("metrics")
-    deploy_to_target(args.model, run_id, artifact_path, target=args.stage, metrics=metrics, config=config)
-    embedded_path = _REPO_ROOT / "deployments" / "embedded" / args.model / "model.bin"
-    print(f"Deployed to deployments/embedded/{args.model}/model.bin (stage={args.stage})")
+    try:
+        deploy_to_target(args.model, run_id, artifact_path, target=args.stage, metrics=metrics, config=config, variant=args.variant)
+    except FileNotFoundError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    variant = args.variant or config.get("deploy", {}).get("variant", "full")
+    model_file = "model.bin" if variant == "full" else "model.compact.npz"
+    print(f"Deployed to deployments/embedded/{args.model}/{model_file} (stage={args.stage}, variant={variant})")
     if args.stage == "prod" and metrics:
         print("Baseline saved to baselines/ for regression protection.")
     return 0
 
 
+# Exit code for a capacity regression vs the stored load-test baseline (like eval gates for CI)
+LOADTEST_GATE_FAIL_EXIT_CODE = 13
+
+
+def cmd_loadtest(args: argparse.Namespace) -> int:
+    """Replay rows against the model (in-process or --url) and gate p99 / throughput on the stored baseline."""
+    import json
+    from foundation.core.config import load_contract
+    from foundation.core.registry import Registry
+    from foundation.deploy import loadtest as lt
+    config = _load_config(args.model)
+    lt_cfg = config.get("loadtest", {})
+    if args.url:
+        call = lt.http_target(args.url)
+    else:
+        if args.run_id:
+            reg = Registry(backend=config.get("registry", {}).get("backend", "local"), uri=config.get("registry", {}).get("uri", "./registry"))
+            model_path = reg.get_run(args.model, args.run_id).get("artifact_path") or str(_run_dir(config, args.run_id) / "artifact")
+        else:
+            model_path = str(_REPO_ROOT / "deployments" / "embedded" / args.model)
+        if not Path(model_path).exists():
+            print(f"No model at {model_path}; pass --run-id or deploy first.", file=sys.stderr)
+            return 1
+        call = lt.in_process_target(args.model, model_path)
+    source = args.data or lt_cfg.get("data") or config.get("data", {}).get("eval_path", "data/eval.csv")
+    rows = lt.load_rows(source, load_contract(args.model), n=lt_cfg.get("rows", 1000))
+    mode = args.mode or lt_cfg.get("mode", "closed")
+    try:
+        result = lt.run_loadtest(
+            call,
+            rows,
+            mode=mode,
+            rps=args.rps if args.rps is not None else lt_cfg.get("rps"),
+            concurrency=args.concurrency or lt_cfg.get("concurrency", 4),
+            duration_sec=args.duration or lt_cfg.get("duration_sec", 10),
+            warmup_requests=lt_cfg.get("warmup_requests", 20),
+            max_in_flight=lt_cfg.get("max_in_flight", 256),
+        )
+        if args.save_baseline:
+            # Re-baselining is not gated: the old baseline may not even be comparable (mode, rps, concurrency)
+            passed, details = None, {}
+        else:
+            passed, details = lt.compare_to_baseline(result, lt.load_baseline(args.model, args.baseline), config)
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    lat = result["latency_ms"]
+    print(f"{result['requests']} requests in {result['duration_sec']:.2f}s: {result['throughput_rps']:.1f} req/s, "
+          f"error rate {result['error_rate']:.2%}")
+    if lat.get("count"):
+        print("latency ms (corrected): " + "  ".join(f"{k} {lat[k]:.2f}" for k in ("p50", "p90", "p99", "p999", "max")))
+        print(f"service ms (uncorrected): p50 {result['service_ms']['p50']:.2f}  p99 {result['service_ms']['p99']:.2f}")
+    for b in result["histogram_ms"]:
+        label = f"<= {b['le_ms']:g}ms" if b["le_ms"] is not None else "> 10000ms"
+        print(f"  {label:>12} {b['count']:>8}")
+    if not args.save_baseline:
+        print("gates:", json.dumps(details))
+    if args.out:
+        Path(args.out).write_text(json.dumps({**result, "gate_passed": passed, "gate_details": details}, indent=2))
+    if args.save_baseline:
+        print(f"Baseline saved to {lt.save_baseline(args.model, result, args.baseline)}")
+        return 0
+    if not passed:
+        print("Load-test gates failed; capacity regressed vs baseline, promotion should be blocked.", file=sys.stderr)
+        return LOADTEST_GATE_FAIL_EXIT_CODE
+    return 0
+
+
+def cmd_monitor(args: argparse.Namespace) -> int:
+    """Merge monitor snapshots from a shared directory into fleet-wide KPIs per time window."""
+    import json
+    from foundation.observability.snapshot import merge_snapshots
+    try:
+        merged = merge_snapshots(args.dir, name=args.model)
+    except FileNotFoundError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    if args.out:
+        merged.write(args.out)
+    report = {
+        "sources": merged.sources,
+        "counters": merged.counters,
+        "windows": {f"{w:g}": merged.query(w) for w in (args.window or [60, 300, 3600])},
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(prog="foundation")
     sub = parser.add_subparsers(dest="command", required=True)
@@ -171,6 +332,13 @@ def main() -> int:
     p_val.add_argument("--model", required=True)
     p_val.add_argument("--data", required=True)
     p_val.set_defaults(func=cmd_validate)
+    # profile
+    p_prof = sub.add_parser("profile")
+    p_prof.add_argument("--model", required=True)
+    p_prof.add_argument("--data", default=None, help="CSV or Parquet file (default: data.train_path)")
+    p_prof.add_argument("--run-id", default=None, help="Save as runs/<run_id>/profile.json (default: print)")
+    p_prof.add_argument("--workers", type=int, default=None, help="Chunks profiled in parallel (default: profile.workers)")
+    p_prof.set_defaults(func=cmd_profile)
     # train
     p_train = sub.add_parser("train")
     p_train.add_argument("--model", required=True)
@@ -183,20 +351,60 @@ def main() -> int:
     p_eval.add_argument("--model", required=True)
     p_eval.add_argument("--run-id", required=True)
     p_eval.add_argument("--eval-data", default=None)
+    p_eval.add_argument("--force", action="store_true", help="Recompute even if a cached eval result matches")
     p_eval.set_defaults(func=cmd_eval)
+    # run-all (every model, parallel)
+    p_all = sub.add_parser("run-all")
+    p_all.add_argument("--model", action="append", help="Only these models (repeatable; their depends_on are added)")
+    p_all.add_argument("--jobs", type=int, default=None, help="Max concurrent subprocesses (default: CPU count)")
+    p_all.add_argument("--summary", default=None, help="Also write the per-model results as JSON")
+    p_all.set_defaults(func=cmd_run_all)
     # register (MLflow)
     p_reg = sub.add_parser("register")
     p_reg.add_argument("--model", required=True)
     p_reg.add_argument("--run", "--run-id", dest="run_id", required=True, help="Run ID (e.g. model_YYYYMMDD_HHMMSS)")
     p_reg.add_argument("--stage", default="dev", choices=["dev", "staging", "prod"])
     p_reg.set_defaults(func=cmd_register)
+    # export (compact bundle variant)
+    p_exp = sub.add_parser("export")
+    p_exp.add_argument("--model", required=True)
+    p_exp.add_argument("--run-id", required=True)
+    p_exp.add_argument("--max-metric-loss", type=float, default=None, help="Fewest trees within this eval-metric loss (default: compact.max_metric_loss)")
+    p_exp.add_argument("--trees", type=int, default=None, help="Keep exactly the first N trees")
+    p_exp.add_argument("--eval-data", default=None, help="Labelled rows for tree selection (default: data.eval_path)")
+    p_exp.set_defaults(func=cmd_export)
     # deploy (copy to deployments/embedded)
     p_dep = sub.add_parser("deploy")
     p_dep.add_argument("--model", required=True)
     p_dep.add_argument("--version", dest="version", required=True, help="Run ID to deploy (e.g. model_YYYYMMDD_HHMMSS)")
     p_dep.add_argument("--stage", default="staging", choices=["staging", "prod"])
+    p_dep.add_argument("--variant", default=None, choices=["full", "compact"], help="Default: deploy.variant")
     p_dep.set_defaults(func=cmd_deploy)
+    # loadtest (capacity benchmark + baseline gate)
+    p_lt = sub.add_parser("loadtest")
+    p_lt.add_argument("--model", required=True)
+    p_lt.add_argument("--run-id", default=None, help="Test this run's artifact (default: deployments/embedded/<model>)")
+    p_lt.add_argument("--url", default=None, help="POST rows as JSON to this local endpoint instead of scoring in-process")
+    p_lt.add_argument("--data", default=None, help='CSV to replay or "synthetic" (default: loadtest.data, then data.eval_path)')
+    p_lt.add_argument("--mode", choices=["open", "closed"], default=None)
+    p_lt.add_argument("--rps", type=float, default=None, help="Open loop: offered rate; closed loop: optional pacing")
+    p_lt.add_argument("--concurrency", type=int, default=None, help="Closed loop clients")
+    p_lt.add_argument("--duration", type=float, default=None, help="Seconds (default: loadtest.duration_sec)")
+    p_lt.add_argument("--baseline", default=None, help="Baseline file (default: baselines/<model>.loadtest.json)")
+    p_lt.add_argument("--save-baseline", action="store_true", help="Store this result as the baseline instead of gating")
+    p_lt.add_argument("--out", default=None, help="Also write the result and gate details as JSON")
+    p_lt.set_defaults(func=cmd_loadtest)
+    # monitor (fleet view from snapshot files)
+    p_mon = sub.add_parser("monitor")
+    p_mon.add_argument("--dir", default="./monitor_snapshots", help="Shared snapshot directory (observability.snapshot.dir)")
+    p_mon.add_argument("--model", default=None, help="Only merge <model>.*.monsnap")
+    p_mon.add_argument("--window", type=float, action="append", help="Window in seconds (repeatable; default 60, 300, 3600)")
+    p_mon.add_argument("--out", default=None, help="Also write the merged snapshot to this file")
+    p_mon.set_defaults(func=cmd_monitor)
     args = parser.parse_args()
+    from foundation.core.logging import configure_from_config
+    model = getattr(args, "model", None)
+    configure_from_config(_load_config(model if isinstance(model, str) else None))  # run-all: --model is a list
     return args.func(args)
 
 
@@ -1,3 +1,20 @@
-from .registry import Registry
-from .artifacts import save_bundle, load_bundle
-from .runner import run_train, run_predict, run_eval
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "Registry": ".registry",
+    "save_bundle": ".artifacts",
+    "load_bundle": ".artifacts",
+    "run_train": ".runner",
+    "run_predict": ".runner",
+    "run_eval": ".runner",
+    "load_config": ".config",
+    "load_contract": ".config",
+})
+
+if TYPE_CHECKING:
+    from .registry import Registry
+    from .artifacts import save_bundle, load_bundle
+    from .runner import run_train, run_predict, run_eval
+    from .config import load_config, load_contract
@@ -3,31 +3,98 @@ Save/load model bundles (serialized model + optional metadata).
 """
 from __future__ import annotations
 
-import joblib
 from pathlib import Path
 from typing import Any, Optional
 
 
+def _reset_n_jobs(model: Any) -> Any:
+    """
+    Drop the fit-time worker count (runner.train.n_jobs, often -1) from an estimator: predicting with every
+    core per call oversubscribes serving hosts and adds joblib dispatch to small batches.
+    """
+    get_params = getattr(model, "get_params", None)
+    if get_params is not None and get_params(deep=False).get("n_jobs") is not None:
+        model.set_params(n_jobs=None)
+    return model
+
+
 def save_bundle(path: str | Path, model: Any, metadata: Optional[dict] = None) -> Path:
-    """Save model and optional metadata to a directory. Writes model.joblib and model.bin (same content)."""
+    """
+    Save model and optional metadata to a directory. Writes model.joblib and model.bin (same content),
+    plus model.forest.npz (compiled inference arrays) when the model is a tree forest. The model's n_jobs is
+    reset to None (single-threaded predict) before it is written.
+    """
+    import joblib
+    from .forest import COMPILED_FILE, CompiledForest
     path = Path(path)
     path.mkdir(parents=True, exist_ok=True)
+    _reset_n_jobs(model)
     joblib.dump(model, path / "model.joblib")
     joblib.dump(model, path / "model.bin")  # Phase 1: deployments/embedded expects model.bin
+    compiled = CompiledForest.from_model(model)
+    if compiled is not None:
+        compiled.save(path / COMPILED_FILE)
+    elif (path / COMPILED_FILE).exists():
+        (path / COMPILED_FILE).unlink()  # never leave a stale engine next to a different model
     if metadata is not None:
         import json
         (path / "metadata.json").write_text(json.dumps(metadata, indent=2))
     return path
 
 
-def load_bundle(path: str | Path) -> tuple[Any, dict]:
-    """Load model and metadata from a bundle directory. Reads model.bin or model.joblib. Returns (model, metadata)."""
+def load_bundle(path: str | Path, prefer_compiled: bool = False, variant: Optional[str] = None) -> tuple[Any, dict]:
+    """
+    Load model and metadata from a bundle directory. Reads model.bin or model.joblib. Returns (model, metadata).
+    prefer_compiled: return the CompiledForest from model.forest.npz when present (same predict_proba/predict,
+    no sklearn overhead; used by predict paths).
+    variant="compact": load model.compact.npz (float32, possibly fewer trees; see foundation.core.compact).
+    A bundle deployed as the compact variant has no model.bin and always loads model.compact.npz.
+    """
+    import joblib
+    from .compact import COMPACT_FILE
+    from .forest import COMPILED_FILE, CompiledForest
     path = Path(path)
     model_file = path / "model.bin" if (path / "model.bin").exists() else path / "model.joblib"
-    model = joblib.load(model_file)
+    if variant == "compact" or (variant is None and not model_file.exists() and (path / COMPACT_FILE).exists()):
+        model = CompiledForest.load(path / COMPACT_FILE)
+    elif variant is not None:
+        raise ValueError(f"Unknown bundle variant {variant!r}")
+    elif prefer_compiled and (path / COMPILED_FILE).exists():
+        model = CompiledForest.load(path / COMPILED_FILE)
+    else:
+        model = _reset_n_jobs(joblib.load(model_file))  # bundles saved with the fit-time n_jobs
     metadata = {}
     meta_file = path / "metadata.json"
     if meta_file.exists():
         import json
         metadata = json.loads(meta_file.read_text())
     return model, metadata
+
+
+def bundle_files(path: str | Path, variant: Optional[str] = None) -> list[Path]:
+    """Files load_bundle reads for this variant: the model file, model.forest.npz when present, metadata.json."""
+    from .compact import COMPACT_FILE
+    from .forest import COMPILED_FILE
+    path = Path(path)
+    model_file = path / "model.bin" if (path / "model.bin").exists() else path / "model.joblib"
+    if variant == "compact" or (variant is None and not model_file.exists() and (path / COMPACT_FILE).exists()):
+        files = [path / COMPACT_FILE]
+    else:
+        files = [model_file, path / COMPILED_FILE]
+    return [f for f in (*files, path / "metadata.json") if f.exists()]
+
+
+def bundle_stamp(path: str | Path, variant: Optional[str] = None) -> tuple:
+    """
+    (name, mtime_ns, size) of each bundle file: changes whenever a deploy or export replaces what load_bundle
+    would read. Copies made with shutil.copy2 keep the stamp of their source, so a deployed bundle matches
+    the run artifact it came from.
+    """
+    out = []
+    for f in bundle_files(path, variant):
+        try:
+            st = f.stat()
+        except FileNotFoundError:
+            continue
+        out.append((f.name, st.st_mtime_ns, st.st_size))
+    return tuple(out)
@@ -0,0 +1,255 @@
+"""
+Compact model variant for size- and load-sensitive embedded targets: the compiled forest (model.forest.npz
+layout) with float32 thresholds and leaf values, narrow index types, nodes the data contract makes
+unreachable pruned, sibling leaves that became identical merged, and optionally only as many trees as a
+metric tolerance allows. Written next to model.bin as model.compact.npz plus compact.json (sizes, load
+times, tree selection); CompiledForest loads it unchanged.
+"""
+from __future__ import annotations
+
+import json
+import math
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from .forest import COMPILED_FILE, CompiledForest, compile_forest
+
+COMPACT_FILE = "model.compact.npz"
+COMPACT_META_FILE = "compact.json"
+
+
+def round_down_f32(values: Any) -> Any:
+    """
+    Largest float32 <= each float64 value. Inputs are scored as float32, and for a float32 x,
+    x <= t  <=>  x <= round_down_f32(t), so float32 thresholds keep every split decision exact.
+    """
+    import numpy as np
+
+    t64 = np.asarray(values, dtype=np.float64)
+    t32 = t64.astype(np.float32)
+    up = t32.astype(np.float64) > t64
+    t32[up] = np.nextafter(t32[up], np.float32(-np.inf))
+    return t32
+
+
+def _bounds_for(feature_columns: list[str], contract: Any) -> dict[int, tuple[float, float]]:
+    """Column index -> (min, max) from contract min_val / max_val, and [0, 1] for one-hot columns."""
+    out: dict[int, tuple[float, float]] = {}
+    if contract is None:
+        return out
+    specs = {f.name: f for f in contract.features}
+    for i, col in enumerate(feature_columns):
+        spec = specs.get(col)
+        if spec is not None and spec.dtype in ("int", "float"):
+            lo = spec.min_val if spec.min_val is not None else -math.inf
+            hi = spec.max_val if spec.max_val is not None else math.inf
+            if (lo, hi) != (-math.inf, math.inf):
+                out[i] = (float(lo), float(hi))
+        elif any(col.startswith(f"{f.name}_") for f in contract.features if f.dtype == "str"):
+            out[i] = (0.0, 1.0)
+    return out
+
+
+def _compact_tree(arrays: dict[str, Any], root: int, thresholds: Any, bounds: dict[int, tuple[float, float]]) -> dict[str, list]:
+    """
+    One tree rewritten in DFS preorder: splits whose outcome the path (and the feature bounds) already decide
+    are bypassed, and a split whose two sides are identical leaves becomes that leaf. Leaves point at themselves.
+    With missing_left (NaN routing), a split is only bypassed when NaN takes the forced branch too.
+    """
+    feature, left, right, value = arrays["feature"], arrays["left"], arrays["right"], arrays["value"]
+    missing = arrays.get("missing_left")
+    out: dict[str, list] = {"feature": [], "threshold": [], "left": [], "right": [], "value": [], "missing_left": []}
+    depth_seen = [0]
+    unbounded = (-math.inf, math.inf)
+
+    def add(f: int, t: float, li: int, ri: int, v: Any, m: bool = False) -> None:
+        for key, item in zip(("feature", "threshold", "left", "right", "value", "missing_left"), (f, t, li, ri, v, m)):
+            out[key].append(item)
+
+    def emit(node: int, lows: dict, highs: dict, depth: int) -> int:
+        """lows[f] = (value, strict): x >= value (x > value if strict) on this path; highs[f]: x <= value."""
+        while left[node] != node:  # follow forced branches without emitting nodes
+            f, t = int(feature[node]), float(thresholds[node])
+            lo, strict = lows.get(f, (bounds.get(f, unbounded)[0], False))
+            nan_left = None if missing is None else bool(missing[node])
+            if highs.get(f, bounds.get(f, unbounded)[1]) <= t and nan_left in (None, True):
+                node = int(left[node])
+            elif (lo > t or (strict and lo >= t)) and nan_left in (None, False):
+                node = int(right[node])
+            else:
+                break
+        idx = len(out["feature"])
+        depth_seen[0] = max(depth_seen[0], depth)
+        if left[node] == node:
+            add(0, 0.0, idx, idx, value[node])
+            return idx
+        f, t = int(feature[node]), float(thresholds[node])
+        add(f, t, idx, idx, value[node], missing is not None and bool(missing[node]))  # children filled in below
+        li = emit(int(left[node]), lows, {**highs, f: min(highs.get(f, bounds.get(f, unbounded)[1]), t)}, depth + 1)
+        ri = emit(int(right[node]), {**lows, f: max(lows.get(f, (bounds.get(f, unbounded)[0], False)), (t, True))}, highs, depth + 1)
+        if out["left"][li] == li and out["left"][ri] == ri and (out["value"][li] == out["value"][ri]).all():
+            # Both sides are the same leaf: the split is that leaf
+            merged = out["value"][li]
+            for key in out:
+                del out[key][idx + 1:]
+            out["feature"][idx], out["threshold"][idx], out["value"][idx] = 0, 0.0, merged
+            out["missing_left"][idx] = False
+            return idx
+        out["left"][idx], out["right"][idx] = li, ri
+        return idx
+
+    emit(root, {}, {}, 0)
+    out["depth"] = depth_seen
+    return out
+
+
+def compact_arrays(
+    arrays: dict[str, Any],
+    n_trees: Optional[int] = None,
+    bounds: Optional[dict[int, tuple[float, float]]] = None,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Compact compile_forest() arrays, keeping the first n_trees estimators (all by default). Returns (arrays
+    loadable by CompiledForest, stats: trees, nodes before/after, pruned_nodes).
+    """
+    import numpy as np
+
+    roots = arrays["roots"].tolist()
+    total_trees = len(roots)
+    n_trees = total_trees if n_trees is None else max(1, min(int(n_trees), total_trees))
+    ends = [*roots[1:], len(arrays["feature"])]
+    values32 = arrays["value"].astype(np.float32)
+    thresholds32 = round_down_f32(arrays["threshold"])
+    src = {**arrays, "value": values32}
+    parts: dict[str, list] = {"feature": [], "threshold": [], "left": [], "right": [], "value": [], "missing_left": []}
+    new_roots, offset, max_depth, kept_source_nodes = [], 0, 0, 0
+    for root, end in zip(roots[:n_trees], ends[:n_trees]):
+        tree = _compact_tree(src, root, thresholds32, bounds or {})
+        new_roots.append(offset)
+        parts["feature"].append(np.asarray(tree["feature"]))
+        parts["threshold"].append(np.asarray(tree["threshold"], dtype=np.float32))
+        parts["left"].append(np.asarray(tree["left"]) + offset)
+        parts["right"].append(np.asarray(tree["right"]) + offset)
+        parts["value"].append(np.asarray(tree["value"], dtype=np.float32))
+        parts["missing_left"].append(np.asarray(tree["missing_left"], dtype=bool))
+        offset += len(tree["feature"])
+        max_depth = max(max_depth, tree["depth"][0])
+        kept_source_nodes += end - root
+    n_features = int(arrays["n_features"])
+    out = {
+        "feature": np.concatenate(parts["feature"]).astype(np.int16 if n_features < 2**15 else np.int32),
+        "threshold": np.concatenate(parts["threshold"]),
+        "left": np.concatenate(parts["left"]).astype(np.int32),
+        "right": np.concatenate(parts["right"]).astype(np.int32),
+        "value": np.concatenate(parts["value"]),
+        "roots": np.asarray(new_roots, dtype=np.int32),
+        "classes": arrays["classes"],
+        "max_depth": np.asarray(max_depth),
+        "n_features": arrays["n_features"],
+    }
+    if "missing_left" in arrays:
+        out["missing_left"] = np.concatenate(parts["missing_left"])
+    if "feature_names" in arrays:
+        out["feature_names"] = arrays["feature_names"]
+    stats = {
+        "trees": n_trees,
+        "trees_full": total_trees,
+        "nodes": int(offset),
+        "nodes_full": int(len(arrays["feature"])),
+        "pruned_nodes": int(kept_source_nodes - offset),
+    }
+    return out, stats
+
+
+def select_trees(evaluate: Callable[[int], float], n_trees: int, full_score: float, max_loss: float) -> tuple[int, float]:
+    """
+    Fewest leading trees whose score is within max_loss of full_score (binary search: forest scores grow
+    roughly monotonically with trees). evaluate(k) scores the first k trees. Returns (k, score at k).
+    """
+    lo, hi, best = 1, n_trees, (n_trees, full_score)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        score = evaluate(mid)
+        if score >= full_score - max_loss:
+            hi, best = mid, (mid, score)
+        else:
+            lo = mid + 1
+    if best[0] != lo:
+        best = (lo, evaluate(lo))
+    return best
+
+
+def _load_ms(load: Callable[[], Any], repeat: int = 3) -> float:
+    best = math.inf
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        load()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def export_compact(
+    model_name: str,
+    artifact_path: str | Path,
+    config: dict,
+    eval_data_path: Optional[str | Path] = None,
+    max_metric_loss: Optional[float] = None,
+    n_trees: Optional[int] = None,
+) -> dict[str, Any]:
+    """
+    Write model.compact.npz and compact.json into the bundle directory. With max_metric_loss (and eval data),
+    the fewest leading trees whose eval metric (compact.metric, default auc) stays within the loss of the
+    all-trees compact model are kept; n_trees fixes the count instead. Returns the compact.json content.
+    Raises ValueError when the bundle's model is not a tree forest.
+    """
+    import joblib
+    import numpy as np
+
+    from .config import load_contract
+    from .runner import run_eval
+
+    path = Path(artifact_path)
+    metadata = json.loads((path / "metadata.json").read_text()) if (path / "metadata.json").exists() else {}
+    if (path / COMPILED_FILE).exists():
+        with np.load(path / COMPILED_FILE, allow_pickle=False) as data:
+            arrays = {k: data[k] for k in data.files}
+    else:
+        model_file = path / "model.bin" if (path / "model.bin").exists() else path / "model.joblib"
+        arrays = compile_forest(joblib.load(model_file))
+    if arrays is None:
+        raise ValueError(f"{model_name}: compact export needs a tree-forest classifier")
+    bounds = _bounds_for(metadata.get("feature_columns", []), load_contract(model_name))
+    cfg = config.get("compact", {})
+    metric = cfg.get("metric", "auc")
+
+    def write(k: Optional[int]) -> dict[str, Any]:
+        compact, stats = compact_arrays(arrays, n_trees=k, bounds=bounds)
+        CompiledForest(compact).save(path / COMPACT_FILE)
+        return stats
+
+    def score() -> float:
+        result = run_eval(model_name, str(path), str(eval_data_path), config, variant="compact")
+        return float(result.get("metrics", result)[metric])
+
+    selection = None
+    stats = write(n_trees)
+    if n_trees is None and max_metric_loss is not None and eval_data_path is not None and stats["trees_full"] > 1:
+        full_score = score()
+        k, k_score = select_trees(lambda k: (write(k), score())[1], stats["trees_full"], full_score, max_metric_loss)
+        stats = write(k)
+        selection = {"metric": metric, "max_loss": max_metric_loss, "score_all_trees": full_score, "score": k_score}
+    full_file = path / "model.bin" if (path / "model.bin").exists() else path / "model.joblib"
+    info = {
+        "model_name": model_name,
+        "source": full_file.name,
+        "precision": "float32",
+        **stats,
+        "bytes": (path / COMPACT_FILE).stat().st_size,
+        "bytes_full": full_file.stat().st_size,
+        "load_ms": _load_ms(lambda: CompiledForest.load(path / COMPACT_FILE)),
+        "load_ms_full": _load_ms(lambda: joblib.load(full_file)),
+        "selection": selection,
+    }
+    (path / COMPACT_META_FILE).write_text(json.dumps(info, indent=2))
+    return info
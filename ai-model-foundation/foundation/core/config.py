@@ -0,0 +1,129 @@
+"""
+Config service: parse defaults.yaml + models/<name>/model.yaml once, merge, and cache keyed by file mtimes.
+Shared by the CLI and pipelines so every entrypoint sees the same merged config and DataContract.
+"""
+from __future__ import annotations
+
+import copy
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+_DEFAULTS = _REPO_ROOT / "foundation" / "config" / "defaults.yaml"
+
+# (model_name) -> (source stamp, merged config, DataContract or None)
+_CACHE: dict[Optional[str], tuple[tuple, dict, Any]] = {}
+_LOCK = threading.Lock()
+
+
+def config_sources(model_name: Optional[str]) -> list[Path]:
+    """Files that make up a model's config, lowest precedence first."""
+    sources = [_DEFAULTS]
+    if model_name:
+        sources.append(_REPO_ROOT / "models" / model_name / "model.yaml")
+    return sources
+
+
+def _stamp(paths: list[Path]) -> tuple:
+    """Cache validity stamp: (path, mtime_ns, size) per source; missing files stamp as None."""
+    out = []
+    for p in paths:
+        try:
+            st = p.stat()
+            out.append((str(p), st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            out.append((str(p), None, None))
+    return tuple(out)
+
+
+def merge_config(base: dict, override: dict) -> dict:
+    """Merge override into base: dict sections merge one level deep, everything else is replaced."""
+    config = dict(base)
+    for k, v in override.items():
+        if isinstance(v, dict) and k in config and isinstance(config[k], dict):
+            config[k] = {**config[k], **v}
+        else:
+            config[k] = v
+    return config
+
+
+def _parse(model_name: Optional[str]) -> tuple[dict, Any]:
+    import yaml
+    from ..data.validate import load_contract_from_dict
+
+    config: dict = {}
+    for path in config_sources(model_name):
+        if path.exists():
+            config = merge_config(config, yaml.safe_load(path.read_text()) or {})
+    contract = load_contract_from_dict(config["data_contract"]) if config.get("data_contract") else None
+    return config, contract
+
+
+def _cached(model_name: Optional[str]) -> tuple[tuple, dict, Any]:
+    stamp = _stamp(config_sources(model_name))
+    with _LOCK:
+        entry = _CACHE.get(model_name)
+        if entry is not None and entry[0] == stamp:
+            return entry
+    config, contract = _parse(model_name)
+    entry = (stamp, config, contract)
+    with _LOCK:
+        _CACHE[model_name] = entry
+    return entry
+
+
+def load_config(model_name: Optional[str] = None) -> dict:
+    """Merged defaults + model config. Parsed once per source mtime; returns a copy callers may mutate."""
+    return copy.deepcopy(_cached(model_name)[1])
+
+
+def load_contract(model_name: str):
+    """DataContract for a model's data_contract (None if absent). Built once per config version; do not mutate."""
+    return _cached(model_name)[2]
+
+
+def clear_cache() -> None:
+    with _LOCK:
+        _CACHE.clear()
+
+
+def compile_config(model_name: Optional[str], path: str | Path) -> Path:
+    """Write the parsed config + contract as a pickle for fast reload in worker processes (atomic replace)."""
+    stamp, config, contract = _cached(model_name)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"model_name": model_name, "stamp": stamp, "config": config, "contract": contract}
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+    os.replace(tmp, path)  # readers see the old file or the new one, never a partial pickle
+    return path
+
+
+def load_compiled(path: str | Path, model_name: Optional[str] = None) -> dict:
+    """
+    Load a compiled config into this process's cache (skips YAML parsing). Returns the merged config (a copy).
+    When the source files changed since compile, or the file is unreadable (truncated, corrupt, another
+    model's), the config is re-parsed and the compiled file rebuilt. An unreadable file can only be rebuilt
+    when model_name is given; otherwise it raises ValueError.
+    """
+    path = Path(path)
+    try:
+        payload = pickle.loads(path.read_bytes())
+        name, stamp = payload["model_name"], payload["stamp"]
+        entry = (stamp, payload["config"], payload["contract"])
+    except Exception:  # never trust a file that does not unpickle to a complete payload
+        payload = None
+    if payload is None or (model_name is not None and name != model_name):
+        if model_name is None:
+            raise ValueError(f"Unreadable compiled config {path}; pass model_name to rebuild it")
+        compile_config(model_name, path)
+        return load_config(model_name)
+    if stamp == _stamp(config_sources(name)):
+        with _LOCK:
+            _CACHE[name] = entry
+    else:
+        compile_config(name, path)  # stale: re-parse once, and the next worker loads the fresh file
+    return load_config(name)
@@ -0,0 +1,150 @@
+"""
+Small DAG executor for pipeline steps: declared inputs/outputs, content-hash step caching, concurrent independent steps.
+State (timing, cache status, digests) is persisted to a JSON file, e.g. runs/<run_id>/pipeline.json.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+from .hashing import json_digest, path_digest
+
+
+@dataclass
+class Step:
+    """One pipeline node. fn returns an exit code (0 = success); downstream steps run only after success."""
+    name: str
+    fn: Callable[[], int]
+    inputs: list[Any] = field(default_factory=list)  # files/dirs whose content keys the cache
+    outputs: list[Any] = field(default_factory=list)  # files/dirs that must still match for a cache hit
+    params: dict[str, Any] = field(default_factory=dict)  # config slice that also keys the cache
+    deps: list[str] = field(default_factory=list)
+    cache: bool = True
+
+    def cache_key(self) -> str:
+        return json_digest({
+            "inputs": {str(p): path_digest(p) for p in self.inputs},
+            "params": self.params,
+        })
+
+
+def _output_digests(step: Step) -> dict[str, str]:
+    return {str(p): path_digest(p) for p in step.outputs}
+
+
+def _check_graph(steps: list[Step]) -> None:
+    names = {s.name for s in steps}
+    if len(names) != len(steps):
+        raise ValueError("Duplicate step names in DAG")
+    for s in steps:
+        missing = [d for d in s.deps if d not in names]
+        if missing:
+            raise ValueError(f"Step {s.name} depends on unknown steps: {missing}")
+    # Kahn's algorithm: every step must be reachable in topological order
+    indegree = {s.name: len(s.deps) for s in steps}
+    ready = [n for n, d in indegree.items() if d == 0]
+    seen = 0
+    while ready:
+        name = ready.pop()
+        seen += 1
+        for s in steps:
+            if name in s.deps:
+                indegree[s.name] -= 1
+                if indegree[s.name] == 0:
+                    ready.append(s.name)
+    if seen != len(steps):
+        raise ValueError("DAG has a cycle")
+
+
+def run_dag(
+    steps: list[Step],
+    state_path: str | Path,
+    max_workers: int = 4,
+    force: bool = False,
+) -> dict[str, Any]:
+    """
+    Run steps in dependency order; steps whose deps are done run concurrently on a thread pool.
+    A step is skipped (cached) when its input/param key and its output digests match the last successful run
+    recorded in state_path. Steps downstream of a failure are marked blocked.
+    Returns {"exit_code", "duration_sec", "steps": {name: record}}.
+    """
+    _check_graph(steps)
+    state_path = Path(state_path)
+    previous: dict[str, Any] = {}
+    if state_path.exists():
+        try:
+            previous = json.loads(state_path.read_text()).get("steps", {})
+        except (OSError, ValueError):
+            previous = {}
+    records: dict[str, dict[str, Any]] = {}
+    lock = threading.Lock()
+    start = time.perf_counter()
+
+    def persist() -> None:
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        with lock:
+            body = {"updated": datetime.now().isoformat(), "steps": dict(records)}
+        state_path.write_text(json.dumps(body, indent=2))
+
+    def execute(step: Step) -> dict[str, Any]:
+        t0 = time.perf_counter()
+        key = step.cache_key()
+        prev = previous.get(step.name, {})
+        if (
+            step.cache
+            and not force
+            and prev.get("status") in ("ok", "cached")
+            and prev.get("key") == key
+            and prev.get("outputs") == _output_digests(step)
+        ):
+            return {**prev, "status": "cached", "cached": True, "duration_sec": time.perf_counter() - t0}
+        started = datetime.now().isoformat()
+        try:
+            exit_code = int(step.fn() or 0)
+            error = None
+        except Exception as e:  # step failure must not take down sibling steps
+            exit_code, error = 1, f"{type(e).__name__}: {e}"
+        record = {
+            "status": "ok" if exit_code == 0 else "failed",
+            "cached": False,
+            "exit_code": exit_code,
+            "key": key,
+            "outputs": _output_digests(step) if exit_code == 0 else {},
+            "started_at": started,
+            "duration_sec": time.perf_counter() - t0,
+        }
+        if error:
+            record["error"] = error
+        return record
+
+    by_name = {s.name: s for s in steps}
+    pending = dict(by_name)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        running: dict[Any, str] = {}
+        while pending or running:
+            for name, step in list(pending.items()):
+                dep_status = [records.get(d, {}).get("status") for d in step.deps]
+                if any(st in ("failed", "blocked") for st in dep_status):
+                    with lock:
+                        records[name] = {"status": "blocked", "cached": False, "duration_sec": 0.0}
+                    del pending[name]
+                elif all(st in ("ok", "cached") for st in dep_status):
+                    running[pool.submit(execute, step)] = name
+                    del pending[name]
+            if not running:
+                continue
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for fut in done:
+                name = running.pop(fut)
+                with lock:
+                    records[name] = fut.result()
+                persist()
+    persist()
+    exit_code = next((r.get("exit_code", 1) for r in records.values() if r["status"] == "failed"), 0)
+    return {"exit_code": exit_code, "duration_sec": time.perf_counter() - start, "steps": records}
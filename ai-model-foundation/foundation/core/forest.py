@@ -0,0 +1,185 @@
+"""
+Compiled tree-ensemble inference: a fitted sklearn forest flattened into NumPy arrays (feature, threshold,
+left, right, value) and evaluated for a whole batch at once, without sklearn's per-call validation and
+joblib dispatch. Saved next to model.bin as model.forest.npz. It wins on single rows and small batches, where
+sklearn's per-call overhead dominates; sklearn's Cython traversal is faster on large batches, so predict paths
+pick the engine per call (use_compiled).
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Optional
+
+COMPILED_FILE = "model.forest.npz"
+# (tree x row) node indices traversed per chunk: small enough that the gathers stay in cache
+_CHUNK_NODES = 65536
+# engine="auto": batches above this many rows go to the sklearn model (override with compiled_max_rows=)
+COMPILED_MAX_ROWS = 4096
+
+
+def use_compiled(engine: str = "auto", n_rows: int = 1, max_rows: Optional[int] = None) -> bool:
+    """
+    Whether a predict call should load the CompiledForest: engine "compiled" always, "sklearn" never, "auto"
+    for batches of at most max_rows rows (default COMPILED_MAX_ROWS).
+    """
+    if engine not in ("auto", "compiled", "sklearn"):
+        raise ValueError(f"engine must be auto, compiled or sklearn, got {engine!r}")
+    if engine != "auto":
+        return engine == "compiled"
+    return n_rows <= (COMPILED_MAX_ROWS if max_rows is None else max_rows)
+
+
+def compile_forest(model: Any) -> Optional[dict[str, Any]]:
+    """
+    Flatten a fitted single-output forest classifier (e.g. RandomForestClassifier) into arrays.
+    Returns None for anything else (the predict path then keeps using the sklearn model).
+    """
+    import numpy as np
+
+    estimators = getattr(model, "estimators_", None)
+    if not estimators or not hasattr(model, "classes_") or getattr(model, "n_outputs_", 1) != 1:
+        return None
+    if not all(hasattr(e, "tree_") for e in estimators):
+        return None
+    n_classes = len(model.classes_)
+    features, thresholds, lefts, rights, values, roots, missing = [], [], [], [], [], [], []
+    offset = 0
+    max_depth = 0
+    for est in estimators:
+        tree = est.tree_
+        n = tree.node_count
+        leaf = tree.children_left == -1
+        idx = np.arange(n, dtype=np.int64) + offset
+        # Leaves point at themselves, so every row can take max_depth steps without a leaf check
+        features.append(np.where(leaf, 0, tree.feature).astype(np.int64))
+        thresholds.append(np.where(leaf, 0.0, tree.threshold))
+        lefts.append(np.where(leaf, idx, tree.children_left + offset))
+        rights.append(np.where(leaf, idx, tree.children_right + offset))
+        # Where a NaN goes at each split (sklearn >= 1.3; trained without NaN: the child with more samples)
+        missing.append(getattr(tree, "missing_go_to_left", None))
+        value = tree.value[:, 0, :n_classes].astype(np.float64)
+        # Same per-tree probabilities as DecisionTreeClassifier.predict_proba: sklearn >= 1.4 stores
+        # leaf fractions already; older versions store counts normalized at predict time
+        totals = value.sum(axis=1, keepdims=True)
+        if not np.allclose(totals[leaf], 1.0):
+            totals[totals == 0.0] = 1.0
+            value = value / totals
+        values.append(value)
+        roots.append(offset)
+        offset += n
+        max_depth = max(max_depth, int(tree.max_depth))
+    arrays = {
+        "feature": np.concatenate(features),
+        "threshold": np.concatenate(thresholds),
+        "left": np.concatenate(lefts),
+        "right": np.concatenate(rights),
+        "value": np.concatenate(values),
+        "roots": np.asarray(roots, dtype=np.int64),
+        "classes": np.asarray(model.classes_),
+        "max_depth": np.asarray(max_depth),
+        "n_features": np.asarray(int(model.n_features_in_)),
+    }
+    if all(m is not None for m in missing):
+        arrays["missing_left"] = np.concatenate(missing).astype(bool)
+    names = getattr(model, "feature_names_in_", None)
+    if names is not None:
+        arrays["feature_names"] = np.asarray(names, dtype=str)
+    return arrays
+
+
+class CompiledForest:
+    """
+    Drop-in for a forest's predict_proba/predict on dense input; probabilities match sklearn bit for bit.
+    NaN inputs follow sklearn's missing-value routing when the arrays carry missing_left (full and compact
+    variants), and are rejected otherwise (bundles compiled by older versions).
+    """
+
+    def __init__(self, arrays: dict[str, Any]):
+        import numpy as np
+        self.arrays = arrays
+        self.feature = arrays["feature"]
+        self.threshold = arrays["threshold"]
+        self.left = arrays["left"]
+        self.right = arrays["right"]
+        self.value = np.asarray(arrays["value"], dtype=np.float64)  # compact bundles store float32
+        self.roots = arrays["roots"]
+        self.classes_ = arrays["classes"]
+        self.max_depth = int(arrays["max_depth"])
+        self.n_features_in_ = int(arrays["n_features"])
+        self.feature_names_in_ = arrays.get("feature_names")
+        self.missing_left = arrays.get("missing_left")
+        # Interleaved (right, left) per node: next = children[2 * node + go_left], one gather per level
+        self._children = np.stack([self.right, self.left], axis=1).ravel()
+
+    @classmethod
+    def from_model(cls, model: Any) -> Optional["CompiledForest"]:
+        arrays = compile_forest(model)
+        return cls(arrays) if arrays is not None else None
+
+    @classmethod
+    def load(cls, path: str | Path) -> "CompiledForest":
+        import numpy as np
+        with np.load(path, allow_pickle=False) as data:
+            return cls({k: data[k] for k in data.files})
+
+    def save(self, path: str | Path) -> Path:
+        import numpy as np
+        path = Path(path)
+        with open(path, "wb") as f:
+            np.savez(f, **self.arrays)  # uncompressed: load is a straight read
+        return path
+
+    def _as_array(self, X: Any):
+        import numpy as np
+        if hasattr(X, "columns"):
+            if self.feature_names_in_ is not None and list(X.columns) != list(self.feature_names_in_):
+                raise ValueError("Input columns do not match the trained feature order")
+            X = X.to_numpy(dtype=np.float32)
+        # sklearn trees compare float32 inputs against float64 thresholds; do the same
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+            raise ValueError(f"Expected 2D input with {self.n_features_in_} features, got shape {X.shape}")
+        return X
+
+    def _leaves(self, X: Any):
+        """Leaf node index per (tree, row); tree-major so per-tree accumulation reads contiguous rows."""
+        import numpy as np
+        X = self._as_array(X)
+        has_nan = bool(np.isnan(X).any())
+        if has_nan and self.missing_left is None:
+            raise ValueError("This compiled forest has no missing-value routing; use the sklearn model")
+        n_rows, n_trees = X.shape[0], len(self.roots)
+        out = np.empty((n_trees, n_rows), dtype=np.int64)
+        flat = X.ravel()
+        step = max(1, _CHUNK_NODES // n_trees)
+        for start in range(0, n_rows, step):
+            stop = min(start + step, n_rows)
+            row_base = np.arange(start, stop, dtype=np.int64) * self.n_features_in_
+            nodes = np.repeat(self.roots[:, None], stop - start, axis=1)
+            for _ in range(self.max_depth):
+                x = flat.take(row_base + self.feature.take(nodes))
+                go_left = x <= self.threshold.take(nodes)
+                if has_nan:  # NaN compares False: send it where the training split did
+                    go_left |= np.isnan(x) & self.missing_left.take(nodes)
+                nodes = self._children.take(2 * nodes + go_left)
+            out[:, start:stop] = nodes
+        return out
+
+    def apply(self, X: Any):
+        """Leaf node index per (row, tree), as global indices into the flattened arrays."""
+        return self._leaves(X).T
+
+    def predict_proba(self, X: Any):
+        import numpy as np
+        leaves = self._leaves(X)
+        proba = np.zeros((leaves.shape[1], self.value.shape[1]), dtype=np.float64)
+        buf = np.empty_like(proba)
+        # Accumulate tree by tree in estimator order, then divide, exactly like ForestClassifier.predict_proba
+        for tree_leaves in leaves:
+            proba += self.value.take(tree_leaves, axis=0, out=buf)
+        proba /= leaves.shape[0]
+        return proba
+
+    def predict(self, X: Any):
+        import numpy as np
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1), axis=0)
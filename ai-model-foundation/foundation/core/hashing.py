@@ -0,0 +1,40 @@
+"""
+Content hashing for cache keys (model bundles, datasets, config sections).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+_CHUNK = 1 << 20
+
+
+def file_digest(path: str | Path) -> str:
+    """SHA-256 hex digest of a file's bytes (streamed in 1 MiB chunks)."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def path_digest(path: str | Path) -> str:
+    """Digest of a file, or of every file under a directory (relative names + contents, sorted). Missing -> ""."""
+    path = Path(path)
+    if path.is_file():
+        return file_digest(path)
+    if not path.is_dir():
+        return ""
+    h = hashlib.sha256()
+    for f in sorted(p for p in path.rglob("*") if p.is_file()):
+        h.update(f.relative_to(path).as_posix().encode())
+        h.update(file_digest(f).encode())
+    return h.hexdigest()
+
+
+def json_digest(obj: Any) -> str:
+    """Digest of a JSON-serializable object with sorted keys (stable across dict ordering)."""
+    line = json.dumps(obj, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(line.encode()).hexdigest()
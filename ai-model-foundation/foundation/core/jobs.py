@@ -0,0 +1,136 @@
+"""
+Run validate -> train -> eval for many models at once: each step is a `foundation` CLI subprocess, at most
+`jobs` run concurrently (asyncio + semaphore), a model starts once the models in its depends_on succeeded,
+and every output line is streamed with a [model:step] prefix. Total time tracks the slowest model chain.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional, TextIO
+
+from .dag import Step, _check_graph
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+STEPS = ("validate", "train", "eval")
+
+
+def step_args(model: str, step: str, run_id: str, config: dict) -> list[str]:
+    """CLI arguments for one step of a model's chain."""
+    if step == "validate":
+        return ["validate", "--model", model, "--data", str(config.get("data", {}).get("train_path", "data/train.csv"))]
+    if step == "train":
+        return ["train", "--model", model, "--run-id", run_id]
+    if step == "eval":
+        return ["eval", "--model", model, "--run-id", run_id]
+    raise ValueError(f"Unknown step {step}")
+
+
+async def _run_step(
+    model: str, step: str, argv: list[str], sem: asyncio.Semaphore, out: TextIO, cwd: Path
+) -> tuple[int, float]:
+    async with sem:
+        t0 = time.perf_counter()
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, str(_REPO_ROOT / "foundation" / "cli.py"), *argv,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            cwd=cwd,
+            env={**os.environ, "PYTHONUNBUFFERED": "1"},
+        )
+        prefix = f"[{model}:{step}] "
+        while True:
+            line = await proc.stdout.readline()
+            if not line:
+                break
+            out.write(prefix + line.decode(errors="replace").rstrip("\n") + "\n")
+            out.flush()
+        code = await proc.wait()
+        return code, time.perf_counter() - t0
+
+
+async def _run_all(
+    models: dict[str, dict], steps: tuple[str, ...], jobs: int, run_stamp: str, out: TextIO, cwd: Path
+) -> dict[str, dict[str, Any]]:
+    sem = asyncio.Semaphore(jobs)
+    results: dict[str, dict[str, Any]] = {}
+    done: dict[str, asyncio.Event] = {name: asyncio.Event() for name in models}
+
+    async def chain(name: str, config: dict) -> None:
+        rec = results[name] = {"status": "pending", "exit_code": None, "steps": {}, "run_id": f"{name}_{run_stamp}"}
+        t0 = time.perf_counter()
+        try:
+            deps = config.get("depends_on", [])
+            for dep in deps:
+                await done[dep].wait()
+            failed = [d for d in deps if results[d]["status"] != "ok"]
+            if failed:
+                rec.update(status="blocked", blocked_by=failed)
+                return
+            for step in steps:
+                code, sec = await _run_step(name, step, step_args(name, step, rec["run_id"], config), sem, out, cwd)
+                rec["steps"][step] = {"exit_code": code, "duration_sec": round(sec, 3)}
+                if code != 0:
+                    rec.update(status="gate_failed" if step == "eval" and code == _gate_code() else "failed", exit_code=code)
+                    return
+            rec.update(status="ok", exit_code=0)
+        finally:
+            rec["duration_sec"] = round(time.perf_counter() - t0, 3)
+            done[name].set()
+
+    await asyncio.gather(*(chain(name, cfg) for name, cfg in models.items()))
+    return results
+
+
+def _gate_code() -> int:
+    from ..cli import EVAL_GATE_FAIL_EXIT_CODE
+
+    return EVAL_GATE_FAIL_EXIT_CODE
+
+
+def aggregate_exit_code(results: dict[str, dict[str, Any]]) -> int:
+    """0 if every model passed; EVAL_GATE_FAIL_EXIT_CODE if the only failures are eval gates; else 1."""
+    statuses = {rec["status"] for rec in results.values()}
+    if statuses <= {"ok"}:
+        return 0
+    if statuses <= {"ok", "gate_failed", "blocked"} and "gate_failed" in statuses:
+        return _gate_code()
+    return 1
+
+
+def run_models(
+    models: Optional[list[str]] = None,
+    jobs: Optional[int] = None,
+    steps: tuple[str, ...] = STEPS,
+    out: TextIO = sys.stdout,
+    cwd: Optional[str | Path] = None,
+) -> dict[str, Any]:
+    """
+    Run the step chain for every discovered model (or `models`, plus their depends_on). jobs defaults to the
+    CPU count. Returns {"exit_code", "duration_sec", "models": {name: {status, exit_code, run_id, steps}}}.
+    """
+    from .config import load_config
+    from .runner import discover_models
+
+    names = list(models) if models else list(discover_models())
+    configs: dict[str, dict] = {}
+    while names:
+        name = names.pop(0)
+        if name not in configs:
+            if not (_REPO_ROOT / "models" / name / "model.yaml").exists():
+                raise ValueError(f"Missing models/{name}/model.yaml")
+            configs[name] = load_config(name)
+            names += configs[name].get("depends_on", [])
+    _check_graph([Step(n, lambda: 0, deps=list(c.get("depends_on", []))) for n, c in configs.items()])
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    t0 = time.perf_counter()
+    results = asyncio.run(_run_all(configs, tuple(steps), jobs or os.cpu_count() or 1, stamp, out, Path(cwd or Path.cwd())))
+    return {
+        "exit_code": aggregate_exit_code(results),
+        "duration_sec": round(time.perf_counter() - t0, 3),
+        "models": results,
+    }
@@ -1,25 +1,198 @@
 """
 Structured logging for pipelines and services.
+Sync mode writes each JSON line as it is logged. Async mode (logging.async: true) only enqueues the record on the
+calling thread; a QueueListener thread encodes (orjson when installed) and writes lines in batches. Per-event
+sampling and a drop counter (queue full) keep per-prediction logging off the request path.
 """
 from __future__ import annotations
 
+import atexit
 import json
 import logging
+import queue
+import random
 import sys
-from typing import Any
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Optional, TextIO
 
+# event -> fraction of log_structured calls kept (missing = 1.0)
+_SAMPLE_RATES: dict[str, float] = {}
+_STATS = {"enqueued": 0, "dropped": 0, "sampled_out": 0, "written": 0, "batches": 0}
+_STATS_LOCK = threading.Lock()
+_LISTENER: Optional["_BatchingListener"] = None
+_QUEUE_HANDLER: Optional["_DroppingQueueHandler"] = None
 
-def configure_logging(level: str = "INFO", structured: bool = True) -> None:
-    """Configure root logger with optional JSON-structured output."""
-    logging.basicConfig(
-        level=getattr(logging, level.upper(), logging.INFO),
-        stream=sys.stdout,
-        format="%(message)s" if structured else "%(levelname)s %(name)s %(message)s",
+
+def _json_encoder() -> Callable[[Any], str]:
+    """orjson when installed (several times faster), else compact stdlib json. Non-JSON values become str."""
+    try:
+        import orjson
+    except ImportError:
+        return lambda obj: json.dumps(obj, separators=(",", ":"), default=str)
+    return lambda obj: orjson.dumps(obj, default=str).decode()
+
+
+def _count(key: str, n: int = 1) -> None:
+    with _STATS_LOCK:
+        _STATS[key] += n
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """Never blocks the caller: when the queue is full the record is dropped and counted."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record  # formatting happens on the listener thread
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+            _count("enqueued")
+        except queue.Full:
+            _count("dropped")
+
+
+class _BatchingListener(QueueListener):
+    """Drains up to batch_size records per wakeup and writes them with one write + flush."""
+
+    def __init__(self, q: queue.Queue, stream: TextIO, batch_size: int, flush_interval_sec: float, formatter: logging.Formatter):
+        super().__init__(q, respect_handler_level=False)
+        self.stream = stream
+        self.batch_size = batch_size
+        self.flush_interval_sec = flush_interval_sec
+        self.formatter = formatter
+        self.encode = _json_encoder()
+
+    def _line(self, record: logging.LogRecord) -> str:
+        fields = getattr(record, "fields", None)
+        if fields is not None:
+            return self.encode({"message": record.msg, **fields})
+        return self.formatter.format(record)
+
+    def _write(self, records: list[logging.LogRecord]) -> None:
+        lines = []
+        for record in records:
+            try:
+                lines.append(self._line(record))
+            except Exception:  # one bad record must not lose the batch
+                lines.append(self.encode({"message": str(record.msg), "log_error": "unencodable fields"}))
+        self.stream.write("\n".join(lines) + "\n")
+        self.stream.flush()
+        _count("written", len(lines))
+        _count("batches")
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)  # blocking: stop() must not fail on a full queue
+
+    def _monitor(self) -> None:
+        q = self.queue
+        stopping = False
+        while not stopping:
+            try:
+                first = q.get(timeout=self.flush_interval_sec)
+            except queue.Empty:
+                continue
+            batch = [first]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            if self._sentinel in batch:
+                stopping = True
+                batch = [r for r in batch if r is not self._sentinel]
+            if batch:
+                self._write(batch)
+            for _ in range(len(batch) + (1 if stopping else 0)):
+                q.task_done()
+
+
+def configure_logging(
+    level: str = "INFO",
+    structured: bool = True,
+    async_mode: bool = False,
+    queue_size: int = 10000,
+    batch_size: int = 256,
+    flush_interval_sec: float = 0.2,
+    sample_rates: Optional[dict[str, float]] = None,
+    stream: Optional[TextIO] = None,
+) -> None:
+    """Configure root logger with optional JSON-structured output, async batched writes and sampling."""
+    global _LISTENER, _QUEUE_HANDLER
+    shutdown_logging()
+    stream = stream or sys.stdout
+    fmt = "%(message)s" if structured else "%(levelname)s %(name)s %(message)s"
+    _SAMPLE_RATES.clear()
+    _SAMPLE_RATES.update(sample_rates or {})
+    root = logging.getLogger()
+    for h in list(root.handlers):
+        root.removeHandler(h)
+    root.setLevel(getattr(logging, level.upper(), logging.INFO))
+    if not async_mode:
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(logging.Formatter(fmt))
+        root.addHandler(handler)
+        return
+    q: queue.Queue = queue.Queue(maxsize=queue_size)
+    _QUEUE_HANDLER = _DroppingQueueHandler(q)
+    root.addHandler(_QUEUE_HANDLER)
+    _LISTENER = _BatchingListener(q, stream, batch_size, flush_interval_sec, logging.Formatter(fmt))
+    _LISTENER.start()
+
+
+def configure_from_config(config: dict, stream: Optional[TextIO] = None) -> None:
+    """configure_logging from runner.log_level and the logging section of defaults.yaml / model.yaml."""
+    log_cfg = config.get("logging", {})
+    configure_logging(
+        level=config.get("runner", {}).get("log_level", "INFO"),
+        structured=log_cfg.get("structured", True),
+        async_mode=log_cfg.get("async", False),
+        queue_size=log_cfg.get("queue_size", 10000),
+        batch_size=log_cfg.get("batch_size", 256),
+        flush_interval_sec=log_cfg.get("flush_interval_sec", 0.2),
+        sample_rates=log_cfg.get("sample_rates") or {},
+        stream=stream,
     )
 
 
+def shutdown_logging() -> None:
+    """Flush queued records and stop the async writer (no-op in sync mode). Runs at exit."""
+    global _LISTENER, _QUEUE_HANDLER
+    if _LISTENER is not None:
+        logging.getLogger().removeHandler(_QUEUE_HANDLER)
+        _LISTENER.stop()
+        _LISTENER = None
+        _QUEUE_HANDLER = None
+
+
+def logging_stats() -> dict[str, int]:
+    """Counters: enqueued, dropped (queue full), sampled_out, written, batches."""
+    with _STATS_LOCK:
+        return dict(_STATS)
+
+
 def log_structured(level: int, msg: str, **kwargs: Any) -> None:
-    """Emit one structured log line (JSON)."""
+    """
+    Emit one structured log line (JSON). kwargs["event"] (default: msg) selects the sampling rate.
+    In async mode the JSON encoding happens on the writer thread.
+    """
+    root = logging.getLogger()
+    if not root.isEnabledFor(level):
+        return
+    rate = _SAMPLE_RATES.get(kwargs.get("event", msg))
+    if rate is not None and random.random() >= rate:
+        _count("sampled_out")
+        return
+    handler = _QUEUE_HANDLER
+    if handler is not None:
+        # Straight to the queue: skips Logger.findCaller and handler dispatch on the request thread
+        record = logging.LogRecord(root.name, level, "", 0, msg, None, None)
+        record.fields = kwargs
+        handler.enqueue(record)
+        return
     record = {"message": msg, **kwargs}
-    line = json.dumps(record)
+    line = json.dumps(record, default=str)
     logging.log(level, line)
+
+
+atexit.register(shutdown_logging)
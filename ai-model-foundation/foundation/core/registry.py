@@ -5,23 +5,37 @@ from __future__ import annotations
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
-# Optional MLflow
-try:
-    import mlflow
-    _MLFLOW_AVAILABLE = True
-except ImportError:
-    _MLFLOW_AVAILABLE = False
-    mlflow = None
+
+@lru_cache(maxsize=None)
+def _load_mlflow():
+    """Optional MLflow, imported on first use (it takes seconds to import). Returns None when not installed."""
+    try:
+        import mlflow
+    except ImportError:
+        return None
+    return mlflow
 
 
 class Registry:
     """MLflow backend (Registry Hall) or local file index."""
 
-    def __init__(self, backend: str = "local", uri: str = "./registry"):
+    def __init__(
+        self,
+        backend: str = "local",
+        uri: str = "./registry",
+        async_logging: bool = False,
+        log_queue_size: int = 1000,
+        log_retries: int = 3,
+    ):
         self.backend = backend
+        self.async_logging = async_logging
+        self._log_queue_size = log_queue_size
+        self._log_retries = log_retries
+        self._tracker = None
         self.uri = uri.rstrip("/") if backend == "mlflow" else uri
         # Local index: when mlflow, use ./registry for run_id -> mlflow_run_id and artifact_path
         self._local_uri = Path("./registry") if backend == "mlflow" else Path(uri)
@@ -29,7 +43,8 @@ class Registry:
             self._local_uri.mkdir(parents=True, exist_ok=True)
         else:
             self._local_uri.mkdir(parents=True, exist_ok=True)
-        if backend == "mlflow" and _MLFLOW_AVAILABLE:
+        mlflow = _load_mlflow() if backend == "mlflow" else None
+        if mlflow is not None:
             mlflow.set_tracking_uri(self.uri)
 
     def log_run(
@@ -54,15 +69,28 @@ class Registry:
             if artifact_path is not None:
                 (run_dir / "artifact_path.txt").write_text(artifact_path)
             return None
-        if self.backend == "mlflow" and _MLFLOW_AVAILABLE:
-            with mlflow.start_run(run_name=run_id) as run:
+        mlflow = _load_mlflow() if self.backend == "mlflow" else None
+        if mlflow is not None:
+            if self.async_logging:
+                # Only run creation is synchronous; params/metrics/artifacts go through the background queue
+                tracker = self._get_tracker()
+                mlflow_run_id = tracker.start_run(run_id)
                 if params:
-                    mlflow.log_params({k: str(v) for k, v in params.items()})
+                    tracker.log_params(mlflow_run_id, params)
                 if metrics:
-                    mlflow.log_metrics(metrics)
+                    tracker.log_metrics(mlflow_run_id, metrics)
                 if artifact_path and Path(artifact_path).exists():
-                    mlflow.log_artifacts(artifact_path, artifact_path="artifact")
-                mlflow_run_id = run.info.run_id
+                    tracker.log_artifacts(mlflow_run_id, artifact_path, artifact_path="artifact")
+                tracker.end_run(mlflow_run_id)
+            else:
+                with mlflow.start_run(run_name=run_id) as run:
+                    if params:
+                        mlflow.log_params({k: str(v) for k, v in params.items()})
+                    if metrics:
+                        mlflow.log_metrics(metrics)
+                    if artifact_path and Path(artifact_path).exists():
+                        mlflow.log_artifacts(artifact_path, artifact_path="artifact")
+                    mlflow_run_id = run.info.run_id
             # Store MLflow run_id and copy metadata locally so get_run works
             local_dir = Path(self._local_uri) / model_name / run_id
             local_dir.mkdir(parents=True, exist_ok=True)
@@ -76,6 +104,21 @@ class Registry:
             return mlflow_run_id
         return None
 
+    def _get_tracker(self):
+        if self._tracker is None:
+            from .tracking import AsyncTracker
+            self._tracker = AsyncTracker(self.uri, max_queue=self._log_queue_size, max_retries=self._log_retries)
+        return self._tracker
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued MLflow writes (async_logging). Returns False on timeout; no-op otherwise."""
+        return self._tracker.flush(timeout) if self._tracker is not None else True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Flush and stop the background MLflow writer, if one was started."""
+        if self._tracker is not None:
+            self._tracker.close(timeout)
+
     def get_run(self, model_name: str, run_id: str) -> dict[str, Any]:
         """Load run metadata and artifact path. Resolves from local index (and MLflow run_id if needed)."""
         run_dir = self._local_uri / model_name / run_id
@@ -90,6 +133,22 @@ class Registry:
             out["mlflow_run_id"] = (run_dir / "mlflow_run_id.txt").read_text().strip()
         return out
 
+    def get_cached_eval(self, model_name: str, key: str) -> Optional[dict[str, Any]]:
+        """Return a cached eval result (metrics, optional intervals) for key, or None."""
+        cache_file = self._local_uri / "_eval_cache" / model_name / f"{key}.json"
+        if not cache_file.exists():
+            return None
+        try:
+            return json.loads(cache_file.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def put_cached_eval(self, model_name: str, key: str, entry: dict[str, Any]) -> None:
+        """Store an eval result under the local index (_eval_cache/<model_name>/<key>.json)."""
+        cache_dir = self._local_uri / "_eval_cache" / model_name
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / f"{key}.json").write_text(json.dumps(entry, indent=2))
+
     def list_runs(self, model_name: str, limit: int = 100) -> list[str]:
         """List run IDs for a model (from local index)."""
         if self.backend != "local":
@@ -111,13 +170,15 @@ class Registry:
         Requires backend=mlflow and run to have been logged (so mlflow_run_id exists).
         Returns version string (e.g. "1") or None.
         """
-        if not _MLFLOW_AVAILABLE or self.backend != "mlflow":
+        mlflow = _load_mlflow() if self.backend == "mlflow" else None
+        if mlflow is None:
             return None
         run_dir = self._local_uri / model_name / run_id
         mlflow_run_id_file = run_dir / "mlflow_run_id.txt"
         if not mlflow_run_id_file.exists():
             return None
         mlflow_run_id = mlflow_run_id_file.read_text().strip()
+        self.flush()  # artifacts must be uploaded before the version can reference them
         mlflow.set_tracking_uri(self.uri)
         try:
             result = mlflow.register_model(f"runs:/{mlflow_run_id}/artifact", model_name)
@@ -3,31 +3,136 @@ Common pipeline runner: load config, resolve model entrypoints, run train/eval/p
 """
 from __future__ import annotations
 
+import importlib
 import importlib.util
+import os
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterable, Optional
 
+_MODELS_ROOT = Path(__file__).resolve().parent.parent.parent / "models"
+ENTRYPOINTS = ("train", "predict", "eval")
 
-def load_model_module(model_name: str, entrypoint: str) -> Optional[Callable]:
-    """Load a callable from models/<model_name>/<entrypoint>.py (e.g. train, predict, eval)."""
-    models_root = Path(__file__).resolve().parent.parent.parent / "models"
-    module_path = models_root / model_name / f"{entrypoint}.py"
-    if not module_path.exists():
-        return None
+
+class _Entry:
+    """One imported entrypoint module and the source mtime it was imported from."""
+
+    __slots__ = ("module", "mtime_ns", "import_sec")
+
+    def __init__(self, module: Any, mtime_ns: int, import_sec: float):
+        self.module = module
+        self.mtime_ns = mtime_ns
+        self.import_sec = import_sec
+
+
+# (model_name, entrypoint) -> _Entry; modules are executed once and re-executed only when the file changes
+_ENTRIES: dict[tuple[str, str], _Entry] = {}
+_ENTRIES_LOCK = threading.Lock()
+# (models root mtime_ns, (dir name, mtime_ns) per subdirectory) -> {model_name: [entrypoints]}
+_DISCOVERY: Optional[tuple[tuple, dict[str, list[str]]]] = None
+
+
+def _import_entrypoint(model_name: str, entrypoint: str, module_path: Path, mtime_ns: int) -> _Entry:
     # Ensure model package is loaded so relative imports (e.g. "from . import features") work
     parent_pkg = f"models.{model_name}"
     if parent_pkg not in sys.modules:
         importlib.import_module(parent_pkg)
     spec = importlib.util.spec_from_file_location(f"{parent_pkg}.{entrypoint}", module_path)
     if spec is None or spec.loader is None:
-        return None
+        raise ImportError(f"Cannot load {module_path}")
+    t0 = time.perf_counter()
     mod = importlib.util.module_from_spec(spec)
     sys.modules[spec.name] = mod
-    spec.loader.exec_module(mod)
+    try:
+        spec.loader.exec_module(mod)
+    except BaseException:
+        sys.modules.pop(spec.name, None)
+        raise
+    return _Entry(mod, mtime_ns, time.perf_counter() - t0)
+
+
+def entrypoint_module(model_name: str, entrypoint: str) -> Optional[Any]:
+    """
+    Imported models/<model_name>/<entrypoint>.py, or None when the file does not exist. Imported once per
+    process and cached; a changed source file (mtime) is re-imported on the next call.
+    """
+    module_path = _MODELS_ROOT / model_name / f"{entrypoint}.py"
+    try:
+        mtime_ns = module_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    key = (model_name, entrypoint)
+    entry = _ENTRIES.get(key)
+    if entry is not None and entry.mtime_ns == mtime_ns:
+        return entry.module
+    with _ENTRIES_LOCK:
+        entry = _ENTRIES.get(key)
+        if entry is None or entry.mtime_ns != mtime_ns:
+            entry = _ENTRIES[key] = _import_entrypoint(model_name, entrypoint, module_path, mtime_ns)
+    return entry.module
+
+
+def load_model_module(model_name: str, entrypoint: str, fn_name: Optional[str] = None) -> Optional[Callable]:
+    """Load a callable from models/<model_name>/<entrypoint>.py (default run_<entrypoint>, e.g. run_train)."""
+    mod = entrypoint_module(model_name, entrypoint)
+    if mod is None:
+        return None
     # Convention: run_train, run_predict, run_eval
-    fn_name = f"run_{entrypoint}"
-    return getattr(mod, fn_name, None)
+    return getattr(mod, fn_name or f"run_{entrypoint}", None)
+
+
+def discover_models(refresh: bool = False) -> dict[str, list[str]]:
+    """
+    {model_name: entrypoints present} for every package under models/ (skipping _-prefixed templates).
+    Cached until models/ or one of its model directories changes (a model added or removed, an entrypoint or
+    __init__.py created or deleted), or refresh=True. Checking costs one directory scan per call.
+    """
+    global _DISCOVERY
+    with os.scandir(_MODELS_ROOT) as entries:
+        dirs = sorted((e.name, e.stat().st_mtime_ns) for e in entries if e.is_dir())
+    stamp = (_MODELS_ROOT.stat().st_mtime_ns, tuple(dirs))
+    if not refresh and _DISCOVERY is not None and _DISCOVERY[0] == stamp:
+        return _DISCOVERY[1]
+    found = {}
+    for d in sorted(_MODELS_ROOT.iterdir()):
+        if d.is_dir() and not d.name.startswith(("_", ".")) and (d / "__init__.py").exists():
+            found[d.name] = [ep for ep in ENTRYPOINTS if (d / f"{ep}.py").exists()]
+    _DISCOVERY = (stamp, found)
+    return found
+
+
+def preload(
+    model_names: Optional[Iterable[str]] = None,
+    entrypoints: Iterable[str] = ("predict",),
+) -> dict[str, dict[str, float]]:
+    """
+    Import entrypoints ahead of the first request (serving warm-up). Defaults to predict for every discovered
+    model. Returns import_timings() for the preloaded models.
+    """
+    names = list(model_names) if model_names is not None else list(discover_models())
+    for name in names:
+        for entrypoint in entrypoints:
+            entrypoint_module(name, entrypoint)
+    timings = import_timings()
+    return {name: timings[name] for name in names if name in timings}
+
+
+def import_timings() -> dict[str, dict[str, float]]:
+    """{model_name: {entrypoint: import seconds}} for the modules currently cached (latest import)."""
+    out: dict[str, dict[str, float]] = {}
+    for (name, entrypoint), entry in list(_ENTRIES.items()):
+        out.setdefault(name, {})[entrypoint] = entry.import_sec
+    return out
+
+
+def clear_entrypoint_cache() -> None:
+    """Forget imported entrypoints and discovery; the next load re-imports from disk."""
+    global _DISCOVERY
+    with _ENTRIES_LOCK:
+        _ENTRIES.clear()
+        _DISCOVERY = None
 
 
 def run_train(
@@ -57,6 +162,20 @@ def run_predict(
     return run_fn(model_path=model_path, input_data=input_data, **kwargs)
 
 
+def load_scorer(model_name: str, model_path: str, **kwargs: Any) -> Callable[[Any], Any]:
+    """
+    Load a model once for repeated single-row scoring. Uses predict.py's load_scorer when the model
+    provides one; otherwise falls back to calling run_predict per row (reloads the bundle each call).
+    """
+    load_fn = load_model_module(model_name, "predict", "load_scorer")
+    if load_fn is not None:
+        return load_fn(model_path, **kwargs)
+    run_fn = load_model_module(model_name, "predict")
+    if run_fn is None:
+        raise RuntimeError(f"No run_predict in models/{model_name}/predict.py")
+    return lambda row: run_fn(model_path=model_path, input_data=row, **kwargs)
+
+
 def run_eval(
     model_name: str,
     model_path: str,
@@ -0,0 +1,206 @@
+"""
+Asynchronous MLflow tracking: a background worker drains a bounded queue, batches params/metrics into
+log_batch calls, and uploads artifacts with retry so training never blocks on tracking I/O.
+"""
+from __future__ import annotations
+
+import atexit
+import logging
+import numbers
+import queue
+import threading
+import time
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# MLflow log_batch limits per request
+_MAX_PARAMS_PER_BATCH = 100
+_MAX_METRICS_PER_BATCH = 1000
+
+
+class AsyncTracker:
+    """
+    Background MLflow writer. start_run is synchronous (callers need the run id); everything else is queued.
+    put() blocks when the queue is full (back-pressure) instead of growing memory without bound.
+    A bad item is recorded in errors / stats["failures"] and skipped; the worker keeps draining the queue.
+    client: an MlflowClient-like object (default: MlflowClient(tracking_uri)).
+    """
+
+    def __init__(
+        self,
+        tracking_uri: str,
+        experiment_name: Optional[str] = None,
+        max_queue: int = 1000,
+        max_retries: int = 3,
+        retry_backoff_sec: float = 0.5,
+        client: Any = None,
+    ):
+        if client is None:
+            from mlflow.tracking import MlflowClient
+
+            client = MlflowClient(tracking_uri=tracking_uri)
+        self.tracking_uri = tracking_uri
+        self.experiment_name = experiment_name or "Default"
+        self.max_retries = max_retries
+        self.retry_backoff_sec = retry_backoff_sec
+        self._client = client
+        self._experiment_id: Optional[str] = None
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._closed = False
+        self.stats = {"enqueued": 0, "batches": 0, "artifact_uploads": 0, "retries": 0, "failures": 0}
+        self.errors: list[str] = []
+        self._worker = threading.Thread(target=self._run, name="mlflow-tracker", daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+
+    # --- producer API (called from training code) ---
+
+    def start_run(self, run_name: str, tags: Optional[dict[str, str]] = None) -> str:
+        """Create the MLflow run synchronously and return its id."""
+        if self._experiment_id is None:
+            exp = self._client.get_experiment_by_name(self.experiment_name)
+            self._experiment_id = exp.experiment_id if exp else self._client.create_experiment(self.experiment_name)
+        run = self._client.create_run(self._experiment_id, tags=tags, run_name=run_name)
+        return run.info.run_id
+
+    def log_params(self, run_id: str, params: dict[str, Any]) -> None:
+        self._put(("params", run_id, {k: str(v) for k, v in params.items()}))
+
+    def log_metrics(self, run_id: str, metrics: dict[str, float], step: int = 0) -> None:
+        self._put(("metrics", run_id, (dict(metrics), step, int(time.time() * 1000))))
+
+    def log_artifacts(self, run_id: str, local_dir: str, artifact_path: Optional[str] = None) -> None:
+        self._put(("artifacts", run_id, (local_dir, artifact_path)))
+
+    def end_run(self, run_id: str, status: str = "FINISHED") -> None:
+        self._put(("end", run_id, status))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued item is written. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Flush pending writes and stop the worker. Safe to call more than once."""
+        if self._closed:
+            return
+        self.flush(timeout)
+        self._closed = True
+        self._queue.put(None)
+        self._worker.join(timeout)
+
+    def _put(self, item: tuple) -> None:
+        if self._closed:
+            raise RuntimeError("AsyncTracker is closed")
+        self._queue.put(item)  # blocks while full: back-pressure on the producer
+        self.stats["enqueued"] += 1
+
+    # --- worker ---
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            items = [item]
+            # Drain whatever else is already queued so params/metrics coalesce into few log_batch calls
+            while True:
+                try:
+                    nxt = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    self._queue.put(None)  # re-queue the stop sentinel after this batch
+                    self._queue.task_done()
+                    break
+                items.append(nxt)
+            try:
+                self._process(items)
+            except Exception as e:  # never let one bad batch end the worker (flush/close would wait forever)
+                self._record_failure("process", e)
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+
+    def _record_failure(self, what: str, e: BaseException) -> None:
+        self.stats["failures"] += 1
+        self.errors.append(f"{what}: {type(e).__name__}: {e}")
+        logger.warning("MLflow tracking %s failed: %s: %s", what, type(e).__name__, e)
+
+    def _process(self, items: list[tuple]) -> None:
+        pending: dict[str, dict[str, Any]] = {}
+        for item in items:
+            try:
+                self._process_item(item, pending)
+            except Exception as e:  # malformed item: record it, keep the rest of the batch
+                self._record_failure(str(item[0]) if isinstance(item, tuple) and item else "item", e)
+        for run_id, batch in pending.items():
+            try:
+                self._write_batch(run_id, batch)
+            except Exception as e:
+                self._record_failure("log_batch", e)
+
+    def _process_item(self, item: tuple, pending: dict[str, dict[str, Any]]) -> None:
+        kind, run_id, payload = item
+        if kind == "params":
+            pending.setdefault(run_id, {"params": {}, "metrics": []})["params"].update(payload)
+        elif kind == "metrics":
+            metrics, step, ts = payload
+            rows = pending.setdefault(run_id, {"params": {}, "metrics": []})["metrics"]
+            for k, v in metrics.items():
+                value = _as_metric(v)
+                if value is None:
+                    logger.warning("Skipping non-numeric MLflow metric %r=%r (run %s)", k, v, run_id)
+                    self.errors.append(f"metrics: non-numeric {k}={v!r} skipped")
+                    continue
+                rows.append((k, value, ts, step))
+        else:
+            # Keep per-run ordering: batched writes land before this run's artifacts / end
+            if run_id in pending:
+                self._write_batch(run_id, pending.pop(run_id))
+            if kind == "artifacts":
+                local_dir, artifact_path = payload
+                if self._with_retry(self._client.log_artifacts, run_id, local_dir, artifact_path):
+                    self.stats["artifact_uploads"] += 1
+            elif kind == "end":
+                self._with_retry(self._client.set_terminated, run_id, payload)
+
+    def _write_batch(self, run_id: str, batch: dict[str, Any]) -> None:
+        from mlflow.entities import Metric, Param
+
+        params = [Param(k, v) for k, v in batch["params"].items()]
+        metrics = [Metric(k, v, ts, step) for k, v, ts, step in batch["metrics"]]
+        while params or metrics:
+            p_chunk, params = params[:_MAX_PARAMS_PER_BATCH], params[_MAX_PARAMS_PER_BATCH:]
+            m_chunk, metrics = metrics[: _MAX_METRICS_PER_BATCH - len(p_chunk)], metrics[_MAX_METRICS_PER_BATCH - len(p_chunk):]
+            if self._with_retry(self._client.log_batch, run_id, metrics=m_chunk, params=p_chunk):
+                self.stats["batches"] += 1
+
+    def _with_retry(self, fn, *args: Any, **kwargs: Any) -> bool:
+        for attempt in range(self.max_retries + 1):
+            try:
+                fn(*args, **kwargs)
+                return True
+            except Exception as e:  # network / server errors: back off and retry
+                if attempt == self.max_retries:
+                    self._record_failure(str(getattr(fn, "__name__", fn)), e)
+                    return False
+                self.stats["retries"] += 1
+                time.sleep(self.retry_backoff_sec * (2 ** attempt))
+        return False
+
+
+
+def _as_metric(value: Any) -> Optional[float]:
+    """Float for an MLflow metric, or None for values MLflow rejects (str, None, bool, other non-numbers)."""
+    if isinstance(value, bool) or not isinstance(value, numbers.Real):
+        return None
+    return float(value)
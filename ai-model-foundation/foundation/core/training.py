@@ -0,0 +1,134 @@
+"""
+Training resources for model train entrypoints: n_jobs, BLAS/OpenMP thread caps, seed and estimator params
+from runner.train (defaults.yaml) overridden by the model's train: section, plus wall/CPU usage metrics and
+training-set metrics from one predict_proba pass (stratified sample, out-of-bag, or full).
+"""
+from __future__ import annotations
+
+import contextlib
+import os
+import time
+from typing import Any, Iterator, Optional
+
+
+def train_resources(config: dict) -> dict[str, Any]:
+    """Effective resources: runner.train defaults, then model.yaml train: keys (estimator params merged)."""
+    base = dict(config.get("runner", {}).get("train", {}))
+    model = config.get("train", {})
+    out = {
+        "n_jobs": model.get("n_jobs", base.get("n_jobs", -1)),
+        "max_threads": model.get("max_threads", base.get("max_threads")),
+        "seed": model.get("seed", base.get("seed", 42)),
+        "metrics": {**base.get("metrics", {}), **model.get("metrics", {})},
+    }
+    out["estimator"] = {**base.get("estimator", {}), **model.get("estimator", {})}
+    # Calibration (foundation.eval.calibration) fits on out-of-bag scores of bootstrapped forests
+    out["oob"] = config.get("calibration", {}).get("enabled", True) and out["estimator"].get("bootstrap", True)
+    return out
+
+
+def estimator_params(resources: dict[str, Any], **defaults: Any) -> dict[str, Any]:
+    """
+    Keyword arguments for the estimator: the entrypoint's defaults, overridden by configured estimator params,
+    with n_jobs and random_state from the resources (a fixed seed keeps fits identical for any n_jobs).
+    """
+    params = {**defaults, **resources["estimator"], "n_jobs": resources["n_jobs"], "random_state": resources["seed"]}
+    if resources.get("metrics", {}).get("mode") == "oob" or resources.get("oob"):
+        params["oob_score"] = True  # OOB predictions are collected during fit
+    return params
+
+
+@contextlib.contextmanager
+def thread_limits(max_threads: Optional[int]) -> Iterator[None]:
+    """
+    Cap BLAS/OpenMP pools (numpy, sklearn's Cython) while fitting, so n_jobs workers do not each spawn a full
+    pool and oversubscribe the node. Needs threadpoolctl (a scikit-learn dependency); no-op without it or a cap.
+    """
+    if not max_threads:
+        yield
+        return
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        yield
+        return
+    with threadpool_limits(limits=int(max_threads)):
+        yield
+
+
+@contextlib.contextmanager
+def resource_usage(resources: Optional[dict[str, Any]] = None) -> Iterator[dict[str, Any]]:
+    """
+    Measure the enclosed block; on exit the yielded dict holds train_wall_sec, train_cpu_sec (all threads of
+    this process) and train_cpu_utilization (cores kept busy on average, cpu / wall) for right-sizing nodes.
+    """
+    usage: dict[str, Any] = {}
+    wall0, cpu0 = time.perf_counter(), time.process_time()
+    try:
+        yield usage
+    finally:
+        wall = time.perf_counter() - wall0
+        cpu = time.process_time() - cpu0
+        usage["train_wall_sec"] = round(wall, 4)
+        usage["train_cpu_sec"] = round(cpu, 4)
+        usage["train_cpu_utilization"] = round(cpu / wall, 3) if wall > 0 else 0.0
+        usage["train_cpu_count"] = os.cpu_count() or 1
+        if resources is not None:
+            usage["train_n_jobs"] = resources["n_jobs"]
+
+
+def _stratified_sample(y: Any, n: int, seed: int) -> Any:
+    """Row positions of a class-proportional sample of about n rows (every class keeps at least one)."""
+    import numpy as np
+
+    y = np.asarray(y)
+    rng = np.random.default_rng(seed)
+    picks = []
+    for cls in np.unique(y):
+        idx = np.flatnonzero(y == cls)
+        k = min(len(idx), max(1, round(n * len(idx) / len(y))))
+        picks.append(rng.choice(idx, size=k, replace=False))
+    return np.sort(np.concatenate(picks))
+
+
+def training_metrics(model: Any, X: Any, y: Any, resources: dict[str, Any]) -> tuple[dict[str, float], dict[str, Any]]:
+    """
+    Training accuracy/AUC from a single predict_proba pass; labels are the argmax class, as model.predict does.
+    runner.train.metrics.mode: sample (stratified, sample_rows rows; full set when smaller), oob (the forest's
+    oob_decision_function_, fit with oob_score; rows never out-of-bag are skipped) or full.
+    Returns (metrics, info): metrics are numeric (run metrics, logged to MLflow); info holds train_metrics_mode
+    and train_metrics_rows, which describe how they were computed (run params / bundle metadata).
+    """
+    import numpy as np
+    from sklearn.metrics import accuracy_score, roc_auc_score
+
+    cfg = resources.get("metrics", {})
+    mode = cfg.get("mode", "sample")
+    y = np.asarray(y)
+    if mode == "oob":
+        proba = model.oob_decision_function_
+        keep = ~np.isnan(proba).any(axis=1)
+        proba, y = proba[keep], y[keep]
+    elif not hasattr(model, "predict_proba"):
+        proba = None
+    else:
+        rows = cfg.get("sample_rows", 10000)
+        if mode == "sample" and len(y) > rows:
+            idx = _stratified_sample(y, rows, resources.get("seed", 42))
+            X = X.iloc[idx] if hasattr(X, "iloc") else X[idx]
+            y = y[idx]
+        else:
+            mode = "full"
+        proba = model.predict_proba(X)
+    if proba is None:
+        pred = model.predict(X)
+        score = pred
+        mode = "full"
+    else:
+        pred = model.classes_[proba.argmax(axis=1)]
+        score = proba[:, -1]
+    metrics = {
+        "accuracy": float(accuracy_score(y, pred)),
+        "auc": float(roc_auc_score(y, score)) if len(set(y)) > 1 else 0.0,
+    }
+    return metrics, {"train_metrics_mode": mode, "train_metrics_rows": int(len(y))}
@@ -1,2 +1,18 @@
-from .contracts import DataContract, FieldSpec
-from .validate import validate_dataframe, validate_row, load_contract_from_dict
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "DataContract": ".contracts",
+    "FieldSpec": ".contracts",
+    "validate_dataframe": ".validate",
+    "validate_row": ".validate",
+    "load_contract_from_dict": ".validate",
+    "DataProfile": ".profile",
+    "profile_file": ".profile",
+})
+
+if TYPE_CHECKING:
+    from .contracts import DataContract, FieldSpec
+    from .validate import validate_dataframe, validate_row, load_contract_from_dict
+    from .profile import DataProfile, profile_file
@@ -0,0 +1,264 @@
+"""
+Local feature store (SQLite): windowed aggregates (count / sum / mean of a value per entity key over e.g.
+1h / 24h / 7d) for training and online predict. Events are stored with per-entity running totals, so any
+window at any time is two indexed lookups (no re-aggregation of raw history):
+- point-in-time (training, batch backfill): aggregates over events strictly before each row's timestamp (no
+  leakage of the row itself or anything later), vectorised with merge_asof;
+- online (predict): one primary-key read of the materialised row per entity, refreshed on ingest/materialize.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+DEFAULT_WINDOWS: dict[str, int] = {"1h": 3600, "24h": 86400, "7d": 604800}
+STATS = ("count", "sum", "mean")
+
+
+def feature_names(spec: dict[str, Any]) -> list[str]:
+    """Feature columns for a feature_store config section, e.g. amount_count_1h_by_merchant_id."""
+    value = spec.get("value", "amount")
+    windows = spec.get("windows") or DEFAULT_WINDOWS
+    return [f"{value}_{stat}_{w}_by_{key}" for key in spec.get("keys", ["merchant_id"]) for w in windows for stat in STATS]
+
+
+def _epoch(values: Any) -> Any:
+    """Timestamps (ISO strings, datetimes or epoch seconds) -> float epoch seconds."""
+    import pandas as pd
+
+    series = pd.Series(values)
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype(float).to_numpy()
+    ts = pd.to_datetime(series, utc=True)
+    return (ts - pd.Timestamp(0, tz="UTC")).dt.total_seconds().to_numpy()
+
+
+def _asof_totals(keys: Any, events: Any, at: Any, strict: bool) -> Any:
+    """
+    (cum_count, cum_sum) per row: the running totals of the row's key as of time at[i] (events sorted by ts,
+    cum_count); strict excludes events at exactly at[i]. Rows with no earlier event get 0.
+    """
+    import pandas as pd
+
+    left = pd.DataFrame({"key": keys, "ts": at, "_row": range(len(at))}).sort_values("ts", kind="stable")
+    joined = pd.merge_asof(left, events, on="ts", by="key", allow_exact_matches=not strict)
+    return joined.sort_values("_row")[["cum_count", "cum_sum"]].fillna(0.0).to_numpy()
+
+
+class FeatureStore:
+    """
+    Windowed aggregates of `value` per entity `keys` over `windows` ({name: seconds}). One SQLite file;
+    connections are per thread, so a store can back concurrent predict workers.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        keys: Iterable[str] = ("merchant_id",),
+        value: str = "amount",
+        windows: Optional[dict[str, int]] = None,
+        timestamp: str = "timestamp",
+    ):
+        self.path = Path(path)
+        self.keys = list(keys)
+        self.value = value
+        self.windows = dict(windows or DEFAULT_WINDOWS)
+        self.timestamp = timestamp
+        self.spec = {"keys": self.keys, "value": value, "windows": self.windows, "timestamp": timestamp}
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_schema()
+
+    @classmethod
+    def from_config(cls, config: dict) -> Optional["FeatureStore"]:
+        """Store for config["feature_store"] when enabled (model.yaml or bundle metadata), else None."""
+        spec = config.get("feature_store", {})
+        if not spec.get("enabled", False):
+            return None
+        return cls(
+            spec.get("path", "./feature_store/features.sqlite"),
+            keys=spec.get("keys", ["merchant_id"]),
+            value=spec.get("value", "amount"),
+            windows=spec.get("windows"),
+            timestamp=spec.get("timestamp", "timestamp"),
+        )
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")  # readers (predict) do not block the ingest writer
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _columns(self) -> list[str]:
+        return [f"{stat}_{w}" for w in self.windows for stat in STATS]
+
+    def _init_schema(self) -> None:
+        cols = ", ".join(f'"{c}" REAL' for c in self._columns())
+        with self.conn:
+            self.conn.execute("CREATE TABLE IF NOT EXISTS meta (k TEXT PRIMARY KEY, v TEXT)")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS events (key_name TEXT, key TEXT, ts REAL, value REAL, "
+                "cum_count INTEGER, cum_sum REAL)"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS events_key_ts ON events (key_name, key, ts)")
+            self.conn.execute(
+                f"CREATE TABLE IF NOT EXISTS online (key_name TEXT, key TEXT, as_of REAL, {cols}, "
+                "PRIMARY KEY (key_name, key)) WITHOUT ROWID"
+            )
+            layout = json.dumps({"value": self.value, "windows": self.windows}, sort_keys=True)
+            row = self.conn.execute("SELECT v FROM meta WHERE k = 'layout'").fetchone()
+            if row is None:
+                self.conn.execute("INSERT INTO meta VALUES ('layout', ?)", (layout,))
+            elif row[0] != layout:
+                raise ValueError(f"{self.path} was built for {row[0]}; rebuild it or point feature_store.path elsewhere")
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # --- ingest ---
+
+    def ingest(self, df: Any) -> int:
+        """
+        Append raw events (timestamp, keys, value columns) and refresh the online rows of touched entities.
+        Late events (older than an entity's latest) rewrite that entity's running totals. Returns rows added.
+        """
+        import numpy as np
+        import pandas as pd
+
+        if not len(df):
+            return 0
+        events = pd.DataFrame({"ts": _epoch(df[self.timestamp].to_numpy()), "value": df[self.value].astype(float).to_numpy()})
+        touched: list[tuple[str, str]] = []
+        with self.conn:
+            for key_name in self.keys:
+                events["key"] = df[key_name].astype(str).to_numpy()
+                for key, group in events.sort_values("ts", kind="stable").groupby("key", sort=False):
+                    ts, values = group["ts"].to_numpy(), group["value"].to_numpy()
+                    last = self.conn.execute(
+                        "SELECT ts, cum_count, cum_sum FROM events WHERE key_name = ? AND key = ? "
+                        "ORDER BY ts DESC, cum_count DESC LIMIT 1",
+                        (key_name, key),
+                    ).fetchone()
+                    if last is not None and ts[0] < last[0]:
+                        # Late data: merge with the entity's events from that point on and recompute totals
+                        tail = self.conn.execute(
+                            "SELECT ts, value FROM events WHERE key_name = ? AND key = ? AND ts >= ? ORDER BY ts, cum_count",
+                            (key_name, key, ts[0]),
+                        ).fetchall()
+                        base = self.conn.execute(
+                            "SELECT cum_count, cum_sum FROM events WHERE key_name = ? AND key = ? AND ts < ? "
+                            "ORDER BY ts DESC, cum_count DESC LIMIT 1",
+                            (key_name, key, ts[0]),
+                        ).fetchone() or (0, 0.0)
+                        self.conn.execute("DELETE FROM events WHERE key_name = ? AND key = ? AND ts >= ?", (key_name, key, ts[0]))
+                        merged = sorted([*tail, *zip(ts.tolist(), values.tolist())], key=lambda e: e[0])
+                        ts = np.array([e[0] for e in merged])
+                        values = np.array([e[1] for e in merged])
+                    else:
+                        base = last[1:] if last is not None else (0, 0.0)
+                    cum_count = base[0] + np.arange(1, len(ts) + 1)
+                    cum_sum = base[1] + np.cumsum(values)
+                    self.conn.executemany(
+                        "INSERT INTO events VALUES (?, ?, ?, ?, ?, ?)",
+                        zip([key_name] * len(ts), [key] * len(ts), ts.tolist(), values.tolist(), cum_count.tolist(), cum_sum.tolist()),
+                    )
+                    touched.append((key_name, key))
+        self._materialize(touched, as_of=None)
+        return len(df)
+
+    # --- reads ---
+
+    def _window_stats(self, key_name: str, key: str, as_of: float) -> list[float]:
+        """Aggregates over (as_of - w, as_of) for each window: two indexed running-total lookups per window."""
+        q = (
+            "SELECT cum_count, cum_sum FROM events WHERE key_name = ? AND key = ? AND ts {op} ? "
+            "ORDER BY ts DESC, cum_count DESC LIMIT 1"
+        )
+        end = self.conn.execute(q.format(op="<"), (key_name, key, as_of)).fetchone() or (0, 0.0)
+        out = []
+        for seconds in self.windows.values():
+            start = self.conn.execute(q.format(op="<="), (key_name, key, as_of - seconds)).fetchone() or (0, 0.0)
+            count, total = end[0] - start[0], end[1] - start[1]
+            out += [count, total, total / count if count else 0.0]
+        return out
+
+    def _materialize(self, entities: Iterable[tuple[str, str]], as_of: Optional[float]) -> None:
+        as_of = time.time() if as_of is None else as_of
+        placeholders = ", ".join("?" * (3 + len(self._columns())))
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO online VALUES ({placeholders})",
+                [(k, key, as_of, *self._window_stats(k, key, as_of)) for k, key in entities],
+            )
+
+    def materialize(self, as_of: Optional[float] = None) -> int:
+        """Recompute every online row as of `as_of` (default now) so windows slide; run on a schedule."""
+        entities = self.conn.execute("SELECT DISTINCT key_name, key FROM events").fetchall()
+        self._materialize(entities, as_of)
+        return len(entities)
+
+    def online_features(self, row: dict) -> dict[str, float]:
+        """Latest materialised features for the row's entity keys (primary-key reads); unknown keys -> 0."""
+        out: dict[str, float] = {}
+        columns = self._columns()
+        for key_name in self.keys:
+            found = self.conn.execute(
+                f"SELECT {', '.join(columns)} FROM online WHERE key_name = ? AND key = ?",
+                (key_name, str(row[key_name])),
+            ).fetchone()
+            values = found or (0.0,) * len(columns)
+            for col, v in zip(columns, values):
+                out[f"{self.value}_{col}_by_{key_name}"] = float(v)
+        return out
+
+    def features_at(self, row: dict, as_of: Any) -> dict[str, float]:
+        """Point-in-time features for one row at `as_of` (timestamp or epoch seconds)."""
+        t = float(_epoch([as_of])[0])
+        out: dict[str, float] = {}
+        for key_name in self.keys:
+            values = self._window_stats(key_name, str(row[key_name]), t)
+            for col, v in zip(self._columns(), values):
+                out[f"{self.value}_{col}_by_{key_name}"] = float(v)
+        return out
+
+    def point_in_time(self, df: Any) -> Any:
+        """
+        Copy of df with the store features joined as of each row's timestamp column, using only events strictly
+        earlier than that timestamp. Vectorised: running totals are matched with merge_asof, not per-row queries.
+        """
+        import numpy as np
+        import pandas as pd
+
+        out = df.copy()
+        t = _epoch(df[self.timestamp].to_numpy())
+        for key_name in self.keys:
+            keys = df[key_name].astype(str).to_numpy()
+            wanted = sorted(set(keys.tolist()))
+            marks = ", ".join("?" * len(wanted))
+            events = pd.read_sql_query(
+                f"SELECT key, ts, cum_count, cum_sum FROM events WHERE key_name = ? AND key IN ({marks}) ORDER BY ts, cum_count",
+                self.conn,
+                params=[key_name, *wanted],
+            ) if wanted else pd.DataFrame(columns=["key", "ts", "cum_count", "cum_sum"])
+            events["ts"] = events["ts"].astype(float)
+            # merge_asof keeps the last match per timestamp, i.e. the highest running total among ties
+            events = events.sort_values(["ts", "cum_count"], kind="stable")
+            end = _asof_totals(keys, events, t, strict=True)
+            for w, seconds in self.windows.items():
+                start = _asof_totals(keys, events, t - seconds, strict=False)
+                count = end[:, 0] - start[:, 0]
+                total = end[:, 1] - start[:, 1]
+                out[f"{self.value}_count_{w}_by_{key_name}"] = count
+                out[f"{self.value}_sum_{w}_by_{key_name}"] = total
+                out[f"{self.value}_mean_{w}_by_{key_name}"] = np.divide(total, count, out=np.zeros_like(total), where=count > 0)
+        return out
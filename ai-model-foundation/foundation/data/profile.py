@@ -0,0 +1,363 @@
+"""
+One-pass data profiling for the data contract: per-field null rate, min/max, mean/std (Welford/Chan), approximate
+distinct count (HyperLogLog), top-k categories (space-saving) and histograms. Every piece of state is fixed-size
+and mergeable, so chunks stream in constant memory and are profiled in parallel, then merged.
+"""
+from __future__ import annotations
+
+import json
+import math
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+import numpy as np
+
+from .contracts import DataContract, FieldSpec
+
+PROFILE_FILE = "profile.json"
+_NUMERIC = ("float", "int")
+_MAX_VALUE_BINS = 256  # int fields with min_val/max_val spanning at most this many values get one bin per value
+
+
+class RunningStats:
+    """count/mean/M2/min/max; chunks are summarised with NumPy and combined with Chan's parallel update."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update(self, values: np.ndarray) -> None:
+        if len(values):
+            other = RunningStats()
+            other.count = len(values)
+            other.mean = float(values.mean())
+            other.m2 = float(((values - other.mean) ** 2).sum())
+            other.min, other.max = float(values.min()), float(values.max())
+            self.merge(other)
+
+    def merge(self, other: "RunningStats") -> None:
+        if not other.count:
+            return
+        n = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / n
+        self.m2 += other.m2 + delta * delta * self.count * other.count / n
+        self.count = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+
+class HyperLogLog:
+    """Approximate distinct count over 64-bit hashes; 2**precision registers, ~1.04/sqrt(2**precision) error."""
+
+    def __init__(self, precision: int = 12):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update_hashes(self, hashes: np.ndarray) -> None:
+        if not len(hashes):
+            return
+        p = self.precision
+        hashes = hashes.astype(np.uint64, copy=False)
+        idx = (hashes >> np.uint64(64 - p)).astype(np.intp)
+        rest = hashes << np.uint64(p)  # remaining 64 - p bits, left-aligned
+        hi = (rest >> np.uint64(32)).astype(np.float64)
+        lo = (rest & np.uint64(0xFFFFFFFF)).astype(np.float64)
+        with np.errstate(divide="ignore"):
+            # bit length via exact float64 log2 of 32-bit halves; rank = leading zeros + 1
+            bits = np.where(hi > 0, 33 + np.floor(np.log2(hi)), np.where(lo > 0, 1 + np.floor(np.log2(lo)), 0))
+        rank = (65 - bits).clip(max=64 - p + 1).astype(np.uint8)
+        np.maximum.at(self.registers, idx, rank)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / float(np.ldexp(1.0, -self.registers.astype(np.int64)).sum())
+        zeros = int((self.registers == 0).sum())
+        if raw <= 2.5 * m and zeros:
+            return int(round(m * math.log(m / zeros)))  # linear counting for small cardinalities
+        return int(round(raw))
+
+
+class SpaceSaving:
+    """
+    Top-k heavy hitters in bounded memory (space-saving, merged as in Agarwal et al.'s mergeable summaries):
+    at most `capacity` counters. A value missing from a full summary may have occurred up to that summary's
+    smallest count, so merges add it as both count and error. Reported counts overestimate by at most `error`.
+    """
+
+    def __init__(self, capacity: int = 100):
+        self.capacity = capacity
+        self.counts: dict[Any, int] = {}
+        self.errors: dict[Any, int] = {}
+
+    def _floor(self) -> int:
+        return min(self.counts.values()) if len(self.counts) >= self.capacity else 0
+
+    def _merge(self, counts: dict[Any, int], errors: dict[Any, int], floor: int) -> None:
+        mine = self._floor()
+        merged = {}
+        for value in self.counts.keys() | counts.keys():
+            merged[value] = (
+                self.counts.get(value, mine) + counts.get(value, floor),
+                self.errors.get(value, mine) + errors.get(value, floor),
+            )
+        kept = sorted(merged.items(), key=lambda kv: -kv[1][0])[: self.capacity]
+        self.counts = {v: c for v, (c, _) in kept}
+        self.errors = {v: e for v, (_, e) in kept}
+
+    def update_counts(self, counts: Any) -> None:
+        """Add one chunk's exact counts (a value_counts Series, sorted descending)."""
+        head = counts.iloc[: self.capacity]
+        floor = int(counts.iloc[self.capacity]) if len(counts) > self.capacity else 0
+        self._merge({v: int(c) for v, c in head.items()}, {v: floor for v in head.index}, floor)
+
+    def merge(self, other: "SpaceSaving") -> None:
+        self._merge(other.counts, other.errors, other._floor())
+
+    def top(self, k: int) -> list[dict[str, Any]]:
+        ranked = sorted(self.counts.items(), key=lambda kv: (-kv[1], str(kv[0])))[:k]
+        return [{"value": v, "count": c, "error": self.errors[v]} for v, c in ranked]
+
+
+class Histogram:
+    """Fixed-edge histogram (mergeable because every chunk uses the same edges); out-of-range values clamp."""
+
+    def __init__(self, low: float, high: float, bins: int):
+        self.edges = np.linspace(low, high, bins + 1)
+        self.counts = np.zeros(bins, dtype=np.int64)
+
+    def update(self, values: np.ndarray) -> None:
+        if len(values):
+            idx = np.searchsorted(self.edges, values, side="right") - 1
+            np.add.at(self.counts, idx.clip(0, len(self.counts) - 1), 1)
+
+    def merge(self, other: "Histogram") -> None:
+        self.counts += other.counts
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"edges": self.edges.tolist(), "counts": self.counts.tolist()}
+
+
+class FieldProfile:
+    """Mergeable profile of one column; numeric fields get stats + histogram, others top-k categories."""
+
+    def __init__(self, spec: FieldSpec, options: dict[str, Any]):
+        self.name = spec.name
+        self.dtype = spec.dtype
+        self.numeric = spec.dtype in _NUMERIC
+        self.rows = 0
+        self.nulls = 0
+        self.invalid = 0  # present but not parseable as a number
+        self.distinct = HyperLogLog(options.get("hll_precision", 12))
+        self.stats = RunningStats() if self.numeric else None
+        self.top_k = SpaceSaving(options.get("top_k_capacity", 100)) if not self.numeric else None
+        self.histogram: Any = None
+        if self.numeric:
+            bins = options.get("histogram_bins", 20)
+            if spec.min_val is not None and spec.max_val is not None:
+                if spec.dtype == "int":
+                    # one bin per value for small integer ranges (e.g. hour 0..23)
+                    span = int(spec.max_val - spec.min_val) + 1
+                    if span <= _MAX_VALUE_BINS:
+                        self.histogram = Histogram(spec.min_val - 0.5, spec.max_val + 0.5, span)
+                if self.histogram is None:
+                    self.histogram = Histogram(spec.min_val, spec.max_val, bins)
+            else:
+                from ..observability.windows import LogHistogram
+
+                self.histogram = LogHistogram(options.get("sketch_relative_accuracy", 0.01))
+
+    def update(self, series: Any) -> None:
+        import pandas as pd
+
+        self.rows += len(series)
+        present = series.notna()
+        self.nulls += int(len(series) - present.sum())
+        series = series[present]
+        if self.numeric:
+            values = pd.to_numeric(series, errors="coerce")
+            ok = values.notna()
+            self.invalid += int(len(values) - ok.sum())
+            arr = values[ok].to_numpy(dtype=np.float64)
+            self.stats.update(arr)
+            self.distinct.update_hashes(pd.util.hash_array(arr))
+            if isinstance(self.histogram, Histogram):
+                self.histogram.update(arr)
+            elif len(arr):
+                _add_log(self.histogram, arr)
+        else:
+            values = series.astype(str)
+            counts = values.value_counts()
+            self.distinct.update_hashes(pd.util.hash_array(counts.index.to_numpy(dtype=object)))
+            self.top_k.update_counts(counts)
+
+    def merge(self, other: "FieldProfile") -> None:
+        self.rows += other.rows
+        self.nulls += other.nulls
+        self.invalid += other.invalid
+        self.distinct.merge(other.distinct)
+        if self.numeric:
+            self.stats.merge(other.stats)
+            self.histogram.merge(other.histogram)
+        else:
+            self.top_k.merge(other.top_k)
+
+    def to_dict(self, top_k: int = 20) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            "dtype": self.dtype,
+            "rows": self.rows,
+            "null_count": self.nulls,
+            "null_rate": self.nulls / self.rows if self.rows else 0.0,
+            "distinct_approx": self.distinct.estimate(),
+        }
+        if self.numeric:
+            s = self.stats
+            out["invalid_count"] = self.invalid
+            if s.count:
+                out.update(min=s.min, max=s.max, mean=s.mean, std=s.std)
+            if isinstance(self.histogram, Histogram):
+                out["histogram"] = self.histogram.to_dict()
+            else:
+                out["quantiles"] = {f"p{int(q * 100)}": self.histogram.quantile(q) for q in (0.01, 0.5, 0.95, 0.99)}
+                out["histogram"] = _log_histogram_dict(self.histogram)
+        else:
+            out["top_k"] = self.top_k.top(top_k)
+        return out
+
+
+def _add_log(hist: Any, values: np.ndarray) -> None:
+    """Vectorised LogHistogram.add for a chunk."""
+    idx = np.ceil(np.log(np.maximum(values, hist.min_value)) / hist._log_gamma).astype(np.int64)
+    keys, counts = np.unique(idx, return_counts=True)
+    for i, n in zip(keys.tolist(), counts.tolist()):
+        hist.bins[i] = hist.bins.get(i, 0) + n
+    hist.count += len(values)
+
+
+def _log_histogram_dict(hist: Any) -> dict[str, Any]:
+    keys = sorted(hist.bins)
+    edges = [hist._gamma ** (i - 1) for i in keys]
+    return {"lower": edges, "upper": [e * hist._gamma for e in edges], "counts": [hist.bins[i] for i in keys]}
+
+
+class DataProfile:
+    """Profiles for every contract field (target included); update() per chunk, merge() partial profiles."""
+
+    def __init__(self, contract: DataContract, options: Optional[dict[str, Any]] = None):
+        self.options = dict(options or {})
+        specs = list(contract.features) + ([contract.target] if contract.target else [])
+        self.contract_name = contract.name
+        self.fields = {s.name: FieldProfile(s, self.options) for s in specs}
+        self.rows = 0
+        self.missing_columns: set[str] = set()
+
+    def update(self, df: Any) -> None:
+        self.rows += len(df)
+        for name, field in self.fields.items():
+            if name in df.columns:
+                field.update(df[name])
+            else:
+                self.missing_columns.add(name)
+
+    def merge(self, other: "DataProfile") -> None:
+        self.rows += other.rows
+        self.missing_columns |= other.missing_columns
+        for name, field in self.fields.items():
+            field.merge(other.fields[name])
+
+    def to_dict(self) -> dict[str, Any]:
+        top_k = self.options.get("top_k", 20)
+        return {
+            "contract": self.contract_name,
+            "rows": self.rows,
+            "missing_columns": sorted(self.missing_columns),
+            "fields": {name: f.to_dict(top_k) for name, f in self.fields.items() if name not in self.missing_columns},
+        }
+
+
+def iter_chunks(path: str | Path, chunk_rows: int, contract: Optional[DataContract] = None) -> Iterator[Any]:
+    """Stream a CSV (pandas chunks) or Parquet file (record batches; needs pyarrow) as DataFrames."""
+    import pandas as pd
+
+    path = Path(path)
+    if path.suffix in (".parquet", ".pq"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Profiling Parquet files requires pyarrow") from e
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas()
+        return
+    # Pin string fields so every chunk parses them the same way (no per-chunk dtype inference)
+    dtype = {f.name: str for f in (contract.features if contract else []) if f.dtype not in _NUMERIC}
+    yield from pd.read_csv(path, chunksize=chunk_rows, dtype=dtype or None)
+
+
+def profile_file(
+    path: str | Path,
+    contract: DataContract,
+    options: Optional[dict[str, Any]] = None,
+    executor: Optional[Executor] = None,
+) -> DataProfile:
+    """
+    Profile a file in one streaming pass. Each chunk is profiled on a worker into a partial DataProfile and
+    merged in file order; at most 2 * workers chunks are in flight, so memory stays bounded by chunk size.
+    options: profile section of defaults.yaml (chunk_rows, workers, top_k, hll_precision, histogram_bins, ...).
+    """
+    options = dict(options or {})
+    chunk_rows = options.get("chunk_rows", 100_000)
+    workers = options.get("workers", 1)
+    total = DataProfile(contract, options)
+
+    def partial(chunk: Any) -> DataProfile:
+        part = DataProfile(contract, options)
+        part.update(chunk)
+        return part
+
+    if executor is None and workers <= 1:
+        for chunk in iter_chunks(path, chunk_rows, contract):
+            total.merge(partial(chunk))
+        return total
+    own = executor is None
+    pool = executor or ThreadPoolExecutor(max_workers=workers, thread_name_prefix="profile")
+    try:
+        pending: list = []
+        for chunk in iter_chunks(path, chunk_rows, contract):
+            pending.append(pool.submit(partial, chunk))
+            if len(pending) >= 2 * max(workers, 1):
+                total.merge(pending.pop(0).result())
+        for fut in pending:
+            total.merge(fut.result())
+    finally:
+        if own:
+            pool.shutdown(wait=True)
+    return total
+
+
+def write_profile(profile: DataProfile, run_dir: str | Path, source: Optional[str] = None) -> Path:
+    """Write <run_dir>/profile.json (next to metrics.json) and return its path."""
+    out = Path(run_dir) / PROFILE_FILE
+    out.parent.mkdir(parents=True, exist_ok=True)
+    data = profile.to_dict()
+    if source is not None:
+        data["source"] = source
+    out.write_text(json.dumps(data, indent=2, default=str))
+    return out
+
+
+def load_profile(run_dir: str | Path) -> Optional[dict[str, Any]]:
+    """Profile saved with a run (for drift / validation), or None."""
+    path = Path(run_dir) / PROFILE_FILE
+    return json.loads(path.read_text()) if path.exists() else None
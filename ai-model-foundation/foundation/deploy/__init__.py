@@ -1,3 +1,31 @@
-from .serving import deploy_to_target, get_serving_spec
-from .canary import canary_spec, check_canary_kpis
-from .rollback import rollback_to_version, get_previous_versions
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "deploy_to_target": ".serving",
+    "get_serving_spec": ".serving",
+    "canary_spec": ".canary",
+    "check_canary_kpis": ".canary",
+    "TrafficSplitter": ".routing",
+    "rollback_to_version": ".rollback",
+    "get_previous_versions": ".rollback",
+    "rollback_instant": ".rollback",
+    "Predictor": ".predictor",
+    "PredictionCache": ".cache",
+    "ModelHost": ".host",
+    "HostOverloaded": ".host",
+    "DeadlineExceeded": ".host",
+    "AdmissionController": ".admission",
+    "HeuristicScorer": ".admission",
+})
+
+if TYPE_CHECKING:
+    from .serving import deploy_to_target, get_serving_spec
+    from .canary import canary_spec, check_canary_kpis
+    from .routing import TrafficSplitter
+    from .rollback import rollback_to_version, rollback_instant, get_previous_versions
+    from .predictor import Predictor
+    from .cache import PredictionCache
+    from .host import ModelHost, HostOverloaded, DeadlineExceeded
+    from .admission import AdmissionController, HeuristicScorer
@@ -0,0 +1,94 @@
+"""
+Latency-SLO admission control for serving: every request carries a deadline, and a request whose estimated
+completion (queue wait + service, from an EWMA of recent service times) would miss it is shed at the door
+instead of queueing behind others and making them late too. Requests that still outlive their deadline in the
+queue are dropped before scoring. With degrade enabled, both are answered by a cheap heuristic rule (the
+model's `eval.baselines.<name>.rule`) instead of failing.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Any, Optional, Sequence
+
+ADMIT, DEGRADE, SHED = "admit", "degrade", "shed"
+
+
+class HeuristicScorer:
+    """
+    Threshold rule on one feature, e.g. {"feature": "amount", "threshold": 250}: score 1 when the value is at
+    or above the threshold (below with "direction": "below"). Returns the predictor's output shape plus
+    "degraded": True so callers can tell the answer did not come from the model.
+    """
+
+    def __init__(self, feature: str, threshold: float, direction: str = "above", feature_names: Sequence[str] = ()):
+        if direction not in ("above", "below"):
+            raise ValueError(f"Heuristic direction must be 'above' or 'below', got {direction!r}")
+        self.feature = feature
+        self.threshold = float(threshold)
+        self.direction = direction
+        # Tuple rows are in contract order
+        self._index = list(feature_names).index(feature) if feature in feature_names else None
+
+    @classmethod
+    def from_config(cls, config: dict, baseline: str = "heuristic", feature_names: Sequence[str] = ()) -> Optional["HeuristicScorer"]:
+        """Scorer for config eval.baselines[baseline].rule, or None when that baseline has no rule."""
+        rule = config.get("eval", {}).get("baselines", {}).get(baseline, {}).get("rule")
+        if not rule:
+            return None
+        return cls(rule["feature"], rule["threshold"], rule.get("direction", "above"), feature_names)
+
+    def __call__(self, row: dict | tuple) -> dict:
+        value = row[self.feature] if isinstance(row, dict) else row[self._index]
+        hit = float(value) >= self.threshold if self.direction == "above" else float(value) < self.threshold
+        return {"score": int(hit), "probability": float(hit), "degraded": True}
+
+
+class AdmissionController:
+    """
+    Decide per request whether it can finish within its deadline. Estimated completion for a newcomer with
+    `in_flight` requests ahead on `concurrency` workers is (in_flight // concurrency + 1) * service time, where
+    service time is an EWMA (weight `alpha`) of observed model latencies. Until the first observation
+    everything is admitted, and so is a request arriving at an idle model (in_flight == 0): it delays nobody,
+    and its service time is the only way the estimate recovers after a latency spike. Thread-safe.
+    """
+
+    def __init__(self, concurrency: int = 1, alpha: float = 0.2, degrade: bool = False, fallback: Any = None):
+        if not 0 < alpha <= 1:
+            raise ValueError("ewma_alpha must be in (0, 1]")
+        self.concurrency = max(int(concurrency), 1)
+        self.alpha = alpha
+        self.degrade = degrade and fallback is not None
+        self.fallback = fallback
+        self.service_sec: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: dict, concurrency: int = 1, feature_names: Sequence[str] = ()) -> "AdmissionController":
+        """Build from serving.admission (ewma_alpha, degrade, fallback baseline name)."""
+        adm = config.get("serving", {}).get("admission", {})
+        fallback = None
+        if adm.get("degrade", False):
+            fallback = HeuristicScorer.from_config(config, adm.get("fallback", "heuristic"), feature_names)
+        return cls(concurrency, alpha=adm.get("ewma_alpha", 0.2), degrade=fallback is not None, fallback=fallback)
+
+    def observe(self, sec: float) -> None:
+        """Fold one model service time (seconds, queue wait excluded) into the EWMA."""
+        with self._lock:
+            prev = self.service_sec
+            self.service_sec = sec if prev is None else prev + self.alpha * (sec - prev)
+
+    def estimated_sec(self, in_flight: int) -> float:
+        """Expected time until a request arriving behind `in_flight` others is answered (0 before any data)."""
+        service = self.service_sec
+        if service is None:
+            return 0.0
+        return (in_flight // self.concurrency + 1) * service
+
+    def decide(self, in_flight: int, budget_sec: Optional[float]) -> str:
+        """
+        ADMIT, DEGRADE or SHED for a request with `budget_sec` left (None: no deadline, always admit).
+        An idle model admits a probe request while budget remains, even when the estimate exceeds it.
+        """
+        if budget_sec is None or (budget_sec > 0 and (in_flight == 0 or self.estimated_sec(in_flight) <= budget_sec)):
+            return ADMIT
+        return DEGRADE if self.degrade else SHED
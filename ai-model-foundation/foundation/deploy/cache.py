@@ -0,0 +1,92 @@
+"""
+Prediction result cache for the serving path: size-bounded LRU with TTL, keyed by a canonical hash of the
+contract-ordered feature values and the deployed model version.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Sequence
+
+
+def _canonical(value: Any) -> Any:
+    """Normalize a raw input value so numerically equal features hash equally (25 and 25.0)."""
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, (int, float)):
+        return repr(float(value))
+    if hasattr(value, "item"):  # NumPy scalar
+        return _canonical(value.item())
+    return str(value)
+
+
+def prediction_key(
+    row: dict | tuple,
+    feature_names: Sequence[str],
+    version: str,
+    ignore: Sequence[str] = (),
+) -> str:
+    """
+    Hash of (model version, feature values in contract order, any other non-ignored input keys).
+    Tuples are already in contract order. Identifiers go in `ignore` so replays of the same transaction
+    under a new id still hit.
+    """
+    if isinstance(row, dict):
+        values = [_canonical(row.get(name)) for name in feature_names]
+        known = set(feature_names) | set(ignore)
+        extra = sorted((k, _canonical(v)) for k, v in row.items() if k not in known)
+    else:
+        values, extra = [_canonical(v) for v in row], []
+    payload = json.dumps([version, values, extra], separators=(",", ":"))
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+class PredictionCache:
+    """Thread-safe LRU of prediction results; entries older than ttl_sec are treated as misses."""
+
+    def __init__(self, max_entries: int = 10000, ttl_sec: Optional[float] = 300.0):
+        self.max_entries = max_entries
+        self.ttl_sec = ttl_sec
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0, "invalidations": 0}
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            stored_at, value = entry
+            if self.ttl_sec is not None and now - stored_at > self.ttl_sec:
+                del self._entries[key]
+                self.stats["expired"] += 1
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.stats["invalidations"] += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def hit_rate(self) -> float:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / lookups if lookups else 0.0
@@ -0,0 +1,313 @@
+"""
+Multi-model serving host: one process serves every model under deployments/embedded/. Models load lazily on
+first request; each gets its own bounded queue and worker pool (a slow model cannot starve the others), its
+own Monitor and admission control (requests that would miss their deadline are shed or degraded), and idle
+models are evicted least-recently-used when the memory budget is exceeded.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Optional
+
+from .admission import ADMIT, DEGRADE, AdmissionController
+from .serving import _deployments_root
+
+
+class HostOverloaded(RuntimeError):
+    """Raised when a model's queue is full; callers should shed or retry later."""
+
+
+class DeadlineExceeded(HostOverloaded):
+    """Raised when a request cannot be (or was not) answered within its deadline and was shed unscored."""
+
+
+class _ModelSlot:
+    """One hosted model: lazily created Predictor, worker pool, admission semaphore and controller, Monitor."""
+
+    def __init__(
+        self,
+        name: str,
+        model_dir: Path,
+        max_concurrency: int,
+        max_queue: int,
+        monitor: Any,
+        admission: Optional[AdmissionController] = None,
+        deadline_sec: Optional[float] = None,
+    ):
+        self.name = name
+        self.model_dir = model_dir
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.monitor = monitor
+        self.admission = admission or AdmissionController(max_concurrency)
+        self.deadline_sec = deadline_sec  # default per-request budget; None = no deadline
+        # Running + waiting requests; a non-blocking acquire failing means the queue is full
+        self.slots = threading.BoundedSemaphore(max_concurrency + max_queue)
+        self.pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix=f"host-{name}")
+        self.predictor: Any = None
+        self.resident_bytes = 0  # predictor.footprint_bytes() as of its last load, reload or switch
+        self.generation = -1  # predictor.generation that resident_bytes was measured at
+        self.in_flight = 0
+        self.last_used = 0.0
+        self.loads = 0
+        self.rejected = 0
+        self.snapshot_writer: Any = None
+        self.lock = threading.Lock()
+
+
+class ModelHost:
+    """
+    Serve many embedded models from one process. submit() returns a Future; predict() waits for it.
+    Per-model limits come from serving.host in defaults.yaml, overridable in each model.yaml; an explicit
+    config applies to every model instead. Process logging is configured from its runner.log_level and logging:.
+    """
+
+    def __init__(
+        self,
+        root: Optional[str | Path] = None,
+        memory_budget_mb: Optional[float] = None,
+        config: Optional[dict] = None,
+    ):
+        from ..core.logging import configure_from_config
+
+        self.root = Path(root) if root else _deployments_root() / "deployments" / "embedded"
+        self.config = config
+        configure_from_config(self._model_config(None))
+        host_cfg = self._host_config(None)
+        budget = memory_budget_mb if memory_budget_mb is not None else host_cfg.get("memory_budget_mb")
+        self.memory_budget_bytes = int(budget * 1024 * 1024) if budget else None
+        self._slots: dict[str, _ModelSlot] = {}
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def _model_config(self, model_name: Optional[str]) -> dict:
+        from ..core.config import load_config
+
+        return self.config if self.config is not None else load_config(model_name)
+
+    def _host_config(self, model_name: Optional[str]) -> dict:
+        return self._model_config(model_name).get("serving", {}).get("host", {})
+
+    def available_models(self) -> list[str]:
+        """Models deployed under the host root (directories with a model bundle, full or compact)."""
+        from ..core.compact import COMPACT_FILE
+
+        if not self.root.exists():
+            return []
+        return sorted(
+            d.name for d in self.root.iterdir()
+            if d.is_dir() and any((d / f).exists() for f in ("model.bin", "model.joblib", COMPACT_FILE))
+        )
+
+    def loaded_models(self) -> list[str]:
+        return [name for name, slot in self._slots.items() if slot.predictor is not None]
+
+    def _slot(self, model_name: str) -> _ModelSlot:
+        slot = self._slots.get(model_name)
+        if slot is not None:
+            return slot
+        model_dir = self.root / model_name
+        if not model_dir.is_dir():
+            raise KeyError(f"No embedded deployment for {model_name} under {self.root}")
+        from ..core.config import load_contract
+        from ..observability.monitor import Monitor
+
+        config = self._model_config(model_name)
+        host_cfg = config.get("serving", {}).get("host", {})
+        deadline_ms = config.get("serving", {}).get("admission", {}).get("deadline_ms")
+        contract = load_contract(model_name)
+        with self._lock:
+            slot = self._slots.get(model_name)
+            if slot is None:
+                concurrency = host_cfg.get("max_concurrency", 2)
+                slot = _ModelSlot(
+                    model_name,
+                    model_dir,
+                    max_concurrency=concurrency,
+                    max_queue=host_cfg.get("max_queue", 64),
+                    monitor=Monitor.from_config(config),
+                    admission=AdmissionController.from_config(
+                        config, concurrency, contract.feature_names() if contract else ()
+                    ),
+                    deadline_sec=deadline_ms / 1000 if deadline_ms is not None else None,
+                )
+                self._start_snapshots(slot, config)
+                self._slots[model_name] = slot
+        return slot
+
+    @staticmethod
+    def _start_snapshots(slot: _ModelSlot, config: dict) -> None:
+        snap_cfg = config.get("observability", {}).get("snapshot", {})
+        if not snap_cfg.get("enabled", False) or slot.monitor.windowed is None:
+            return
+        from ..observability.snapshot import SnapshotWriter
+
+        slot.snapshot_writer = SnapshotWriter(
+            slot.monitor,
+            snap_cfg.get("dir", "./monitor_snapshots"),
+            name=slot.name,
+            replica_id=snap_cfg.get("replica_id"),
+            interval_sec=snap_cfg.get("interval_sec", 60),
+        ).start()
+
+    def _ensure_loaded(self, slot: _ModelSlot) -> Any:
+        if slot.predictor is not None:
+            return slot.predictor
+        from .predictor import Predictor
+
+        with slot.lock:
+            if slot.predictor is None:
+                predictor = Predictor(slot.name, slot.model_dir, config=self.config, monitor=slot.monitor)
+                predictor.load()
+                slot.loads += 1
+                slot.predictor = predictor
+        self._measure(slot)
+        return slot.predictor
+
+    def _measure(self, slot: _ModelSlot) -> None:
+        """Refresh the slot's resident bytes after its predictor (re)loaded or switched bundles, then apply the budget."""
+        predictor = slot.predictor
+        if predictor is None or predictor.generation == slot.generation:
+            return
+        with slot.lock:
+            slot.generation = predictor.generation
+            slot.resident_bytes = predictor.footprint_bytes()
+        self._enforce_budget(keep=slot.name)
+
+    def preload(self, model_names: Optional[list[str]] = None) -> dict[str, float]:
+        """Warm-up before traffic: import entrypoints and load bundles. Returns load seconds per model."""
+        timings = {}
+        for name in model_names if model_names is not None else self.available_models():
+            t0 = time.perf_counter()
+            self._ensure_loaded(self._slot(name))
+            timings[name] = time.perf_counter() - t0
+        return timings
+
+    def _enforce_budget(self, keep: str) -> None:
+        """Evict least-recently-used idle models until their footprints (live bundle + resident versions) fit the budget."""
+        if self.memory_budget_bytes is None:
+            return
+        with self._lock:
+            loaded = [s for s in self._slots.values() if s.predictor is not None]
+            total = sum(s.resident_bytes for s in loaded)
+            for slot in sorted(loaded, key=lambda s: s.last_used):
+                if total <= self.memory_budget_bytes:
+                    break
+                with slot.lock:
+                    if slot.name == keep or slot.in_flight:
+                        continue  # never evict the model being loaded or one serving requests
+                    slot.predictor = None
+                    total -= slot.resident_bytes
+                    slot.resident_bytes = 0
+                    slot.generation = -1
+                    self.evictions += 1
+
+    @staticmethod
+    def _degrade(slot: _ModelSlot, row: dict | tuple) -> Future:
+        """Answer with the slot's heuristic fallback instead of the model (already resolved Future)."""
+        slot.monitor.record_degraded()
+        future: Future = Future()
+        future.set_result(slot.admission.fallback(row))
+        return future
+
+    def submit(self, model_name: str, row: dict | tuple, deadline_ms: Optional[float] = None) -> Future:
+        """
+        Queue one request on the model's own workers. deadline_ms (default serving.admission.deadline_ms) is the
+        latency budget: a request estimated to miss it is shed (DeadlineExceeded) or, in degrade mode, answered
+        by the heuristic fallback; one still queued at its deadline is dropped the same way before scoring.
+        Raises HostOverloaded when the queue is full (degraded instead when degrade mode is on).
+        """
+        slot = self._slot(model_name)
+        budget = deadline_ms / 1000 if deadline_ms is not None else slot.deadline_sec
+        deadline = time.monotonic() + budget if budget is not None else None
+        decision = slot.admission.decide(slot.in_flight, budget)
+        if decision == DEGRADE:
+            return self._degrade(slot, row)
+        if decision != ADMIT:
+            slot.monitor.record_shed()
+            raise DeadlineExceeded(
+                f"{model_name}: estimated {slot.admission.estimated_sec(slot.in_flight) * 1000:.1f}ms "
+                f"exceeds the {budget * 1000:.1f}ms deadline"
+            )
+        if not slot.slots.acquire(blocking=False):
+            if slot.admission.degrade:
+                return self._degrade(slot, row)
+            slot.rejected += 1
+            slot.monitor.record_error(HostOverloaded(model_name))
+            raise HostOverloaded(f"{model_name}: {slot.max_concurrency} running + {slot.max_queue} queued")
+        with slot.lock:
+            slot.in_flight += 1
+            slot.last_used = time.monotonic()
+
+        def run() -> Any:
+            try:
+                if deadline is not None and time.monotonic() > deadline:
+                    # Late already: scoring now only delays the requests behind this one
+                    if slot.admission.degrade:
+                        return self._degrade(slot, row).result()
+                    slot.monitor.record_shed()
+                    raise DeadlineExceeded(f"{model_name}: deadline passed while queued")
+                predictor = self._ensure_loaded(slot)
+                t0 = time.perf_counter()
+                out = predictor.predict(row)
+                slot.admission.observe(time.perf_counter() - t0)
+                self._measure(slot)  # a deploy picked up by this request may have changed what is loaded
+                return out
+            finally:
+                with slot.lock:
+                    slot.in_flight -= 1
+                    slot.last_used = time.monotonic()
+                slot.slots.release()
+
+        try:
+            return slot.pool.submit(run)
+        except RuntimeError:  # pool shut down
+            with slot.lock:
+                slot.in_flight -= 1
+            slot.slots.release()
+            raise
+
+    def predict(
+        self, model_name: str, row: dict | tuple, timeout: Optional[float] = None, deadline_ms: Optional[float] = None
+    ) -> Any:
+        return self.submit(model_name, row, deadline_ms=deadline_ms).result(timeout)
+
+    def rollback(self, model_name: str, to_version: str, registry: Any = None) -> dict[str, Any]:
+        """Roll one hosted model back (instant when the version is resident). Returns timings."""
+        from .rollback import rollback_instant
+
+        slot = self._slot(model_name)
+        out = rollback_instant(self._ensure_loaded(slot), to_version, registry=registry, config=self.config)
+        self._measure(slot)
+        return out
+
+    def stats(self) -> dict[str, Any]:
+        """Per-model load state, queue depth and KPIs (last N events; see window_kpis for time windows)."""
+        models = {}
+        for name, slot in self._slots.items():
+            models[name] = {
+                "loaded": slot.predictor is not None,
+                "version": slot.predictor.version if slot.predictor is not None else None,
+                "resident_versions": slot.predictor.resident_versions() if slot.predictor is not None else [],
+                "in_flight": slot.in_flight,
+                "rejected": slot.rejected,
+                "service_ewma_ms": slot.admission.service_sec * 1000 if slot.admission.service_sec is not None else None,
+                "loads": slot.loads,
+                "resident_bytes": slot.resident_bytes,
+                **slot.monitor.kpis(),
+            }
+        resident = sum(s.resident_bytes for s in self._slots.values())
+        return {"resident_bytes": resident, "evictions": self.evictions, "models": models}
+
+    def window_kpis(self, model_name: str, seconds: float) -> dict[str, Any]:
+        """Time-windowed KPIs for one model, e.g. window_kpis("fraud_detector", 300)["latency_p99"]."""
+        return self._slot(model_name).monitor.window_kpis(seconds)
+
+    def close(self) -> None:
+        for slot in self._slots.values():
+            slot.pool.shutdown(wait=True)
+            if slot.snapshot_writer is not None:
+                slot.snapshot_writer.stop()  # final snapshot with everything served
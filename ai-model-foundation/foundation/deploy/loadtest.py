@@ -0,0 +1,329 @@
+"""
+Load generator and latency benchmark for serving: replays contract rows (a CSV such as data/eval.csv, or
+synthetic rows) against the in-process row scorer or a local HTTP endpoint, in open-loop (fixed RPS) or
+closed-loop (N concurrent clients) mode, and reports throughput plus a latency histogram corrected for
+coordinated omission: latency is measured from when a request was due, not from when a stalled client got
+around to sending it. Results compare against a stored baseline (baselines/<model>.loadtest.json) so capacity
+regressions fail like eval gates.
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from ..observability.windows import LogHistogram
+
+QUANTILES = {"p50": 0.5, "p90": 0.9, "p99": 0.99, "p999": 0.999}
+# Display buckets (ms upper bounds) for the histogram in the report; the sketch itself is finer
+_HIST_EDGES_MS = (0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+
+def _baselines_root() -> Path:
+    return Path(__file__).resolve().parent.parent.parent / "baselines"
+
+
+class LatencyRecorder:
+    """
+    Latency sketch (LogHistogram, ~1% quantile error) plus count / sum / max. With expected_interval (a client
+    pacing at a fixed rate), a sample longer than the interval also records the requests the stalled client
+    should have sent meanwhile (latency - interval, - 2*interval, ... down to one interval), as HdrHistogram does.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.hist = LogHistogram(relative_accuracy)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, sec: float, expected_interval: Optional[float] = None) -> None:
+        self._add(sec)
+        if expected_interval:
+            missed = sec - expected_interval
+            while missed >= expected_interval:
+                self._add(missed)
+                missed -= expected_interval
+
+    def _add(self, sec: float) -> None:
+        self.hist.add(sec)
+        self.count += 1
+        self.total += sec
+        self.max = max(self.max, sec)
+
+    def summary_ms(self) -> dict[str, Any]:
+        if not self.count:
+            return {"count": 0}
+        out = {"count": self.count, "mean": self.total / self.count * 1000}
+        out.update({name: self.hist.quantile(q) * 1000 for name, q in QUANTILES.items()})
+        out["max"] = self.max * 1000
+        return out
+
+    def histogram_ms(self) -> list[dict[str, Any]]:
+        """Counts per display bucket: [{"le_ms": 1, "count": n}, ...], last bucket le_ms None (overflow)."""
+        gamma = self.hist._gamma
+        counts = [0] * (len(_HIST_EDGES_MS) + 1)
+        for i, n in self.hist.bins.items():
+            value_ms = 2 * gamma ** i / (gamma + 1) * 1000
+            slot = next((k for k, edge in enumerate(_HIST_EDGES_MS) if value_ms <= edge), len(_HIST_EDGES_MS))
+            counts[slot] += n
+        edges = [*_HIST_EDGES_MS, None]
+        return [{"le_ms": e, "count": c} for e, c in zip(edges, counts) if c]
+
+
+# --- request sources ---
+
+
+def synthetic_rows(contract: Any, n: int = 1000, seed: int = 0) -> list[dict]:
+    """Rows conforming to the contract: allowed_values sampled, numbers uniform in [min_val, max_val]."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    columns: dict[str, list] = {}
+    for f in contract.features:
+        if f.allowed_values:
+            columns[f.name] = rng.choice(f.allowed_values, n).tolist()
+        elif f.dtype == "str":
+            columns[f.name] = [f"{f.name}_{k}" for k in rng.integers(0, 20, n)]
+        elif f.dtype == "int":
+            lo = int(f.min_val) if f.min_val is not None else 0
+            hi = int(f.max_val) if f.max_val is not None else lo + 100
+            columns[f.name] = rng.integers(lo, hi + 1, n).tolist()
+        else:
+            lo = float(f.min_val) if f.min_val is not None else 0.0
+            hi = float(f.max_val) if f.max_val is not None else lo + 1000.0
+            columns[f.name] = rng.uniform(lo, hi, n).round(2).tolist()
+    rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+    for i, row in enumerate(rows):
+        for ident in contract.identifiers:
+            row[ident] = f"lt_{i}"
+    return rows
+
+
+def load_rows(source: str | Path, contract: Any, n: int = 1000, seed: int = 0) -> list[dict]:
+    """Request rows: "synthetic" or a CSV path (contract features and identifiers only; target dropped)."""
+    if str(source) == "synthetic":
+        return synthetic_rows(contract, n, seed)
+    import pandas as pd
+
+    df = pd.read_csv(source)
+    keep = [c for c in [*contract.feature_names(), *contract.identifiers] if c in df.columns]
+    return df[keep].to_dict("records")
+
+
+# --- targets ---
+
+
+def in_process_target(model_name: str, model_path: str | Path) -> Callable[[dict], Any]:
+    """The serving row path (the model's RowScorer, as run_predict uses for one row), loaded once."""
+    from ..core.runner import load_scorer
+
+    return load_scorer(model_name, str(model_path))
+
+
+def http_target(url: str, timeout: float = 10.0) -> Callable[[dict], Any]:
+    """POST each row as JSON to url; non-2xx responses raise (counted as errors)."""
+    import urllib.request
+
+    def call(row: dict) -> Any:
+        req = urllib.request.Request(url, data=json.dumps(row, default=str).encode(), headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return json.loads(resp.read() or b"null")
+
+    return call
+
+
+# --- drivers ---
+
+
+class _Run:
+    def __init__(self, relative_accuracy: float):
+        self.latency = LatencyRecorder(relative_accuracy)  # corrected for coordinated omission
+        self.service = LatencyRecorder(relative_accuracy)  # send -> response only
+        self.errors = 0
+        self.first_error: Optional[str] = None
+
+    def timed(self, call: Callable[[dict], Any], row: dict) -> tuple[float, float, bool]:
+        """Runs in a worker thread: (sent, done, ok) as perf_counter stamps."""
+        sent = time.perf_counter()
+        try:
+            call(row)
+            ok = True
+        except Exception as e:
+            ok = False
+            if self.first_error is None:
+                self.first_error = f"{type(e).__name__}: {e}"
+        return sent, time.perf_counter(), ok
+
+    def record(self, due: float, sent: float, done: float, ok: bool, expected_interval: Optional[float] = None) -> None:
+        if not ok:
+            self.errors += 1
+            return
+        self.service.record(done - sent)
+        self.latency.record(done - due, expected_interval)
+
+
+async def _open_loop(call: Callable, rows: list[dict], rps: float, n: int, pool: ThreadPoolExecutor, run: _Run) -> None:
+    """Request i is due at start + i / rps whether or not earlier ones finished; latency counts from due time."""
+    loop = asyncio.get_running_loop()
+    interval = 1.0 / rps
+    start = time.perf_counter()
+
+    async def one(i: int, due: float) -> None:
+        sent, done, ok = await loop.run_in_executor(pool, run.timed, call, rows[i % len(rows)])
+        run.record(due, sent, done, ok)
+
+    tasks = []
+    for i in range(n):
+        due = start + i * interval
+        delay = due - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(one(i, due)))
+    await asyncio.gather(*tasks)
+
+
+async def _closed_loop(
+    call: Callable,
+    rows: list[dict],
+    concurrency: int,
+    duration_sec: float,
+    rps: Optional[float],
+    pool: ThreadPoolExecutor,
+    run: _Run,
+) -> None:
+    """
+    `concurrency` clients for duration_sec, each sending its next request when the previous one returns (paced
+    to rps / clients when rps is set; stalls then back-fill the missed requests into the histogram).
+    """
+    loop = asyncio.get_running_loop()
+    interval = concurrency / rps if rps else None
+    counter = itertools.count()
+    end = time.perf_counter() + duration_sec
+
+    async def client() -> None:
+        next_due = time.perf_counter()
+        while time.perf_counter() < end:
+            i = next(counter)
+            if interval is not None:
+                delay = next_due - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                next_due += interval
+            sent, done, ok = await loop.run_in_executor(pool, run.timed, call, rows[i % len(rows)])
+            # A stall makes this client skip sends: record() back-fills them from the pacing interval
+            run.record(sent, sent, done, ok, interval)
+            if interval is not None:
+                next_due = max(next_due, done)
+
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+
+
+def run_loadtest(
+    call: Callable[[dict], Any],
+    rows: list[dict],
+    mode: str = "closed",
+    rps: Optional[float] = None,
+    concurrency: int = 4,
+    duration_sec: float = 10.0,
+    warmup_requests: int = 20,
+    max_in_flight: int = 256,
+    relative_accuracy: float = 0.01,
+) -> dict[str, Any]:
+    """
+    Drive `call` with rows for about duration_sec (open: rps * duration_sec requests at a fixed rate; closed:
+    `concurrency` clients until the time is up). Returns throughput, error_rate, latency_ms (corrected: mean/p50/p90/p99/p999/max),
+    service_ms (uncorrected) and histogram_ms.
+    """
+    if not rows:
+        raise ValueError("No rows to send")
+    if mode not in ("open", "closed"):
+        raise ValueError(f"mode must be 'open' or 'closed', got {mode!r}")
+    if mode == "open" and not rps:
+        raise ValueError("Open-loop mode needs rps")
+    for row in rows[:warmup_requests]:
+        try:
+            call(row)  # lazy loads, caches, connections: not part of the measurement
+        except Exception:
+            pass
+    run = _Run(relative_accuracy)
+    workers = min(max_in_flight, concurrency) if mode == "closed" else max_in_flight
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="loadtest") as pool:
+        t0 = time.perf_counter()
+        if mode == "open":
+            asyncio.run(_open_loop(call, rows, rps, max(int(rps * duration_sec), 1), pool, run))
+        else:
+            asyncio.run(_closed_loop(call, rows, concurrency, duration_sec, rps, pool, run))
+        elapsed = time.perf_counter() - t0
+    sent = run.service.count + run.errors
+    return {
+        "mode": mode,
+        "rps": rps,
+        "concurrency": concurrency if mode == "closed" else None,
+        "requests": sent,
+        "errors": run.errors,
+        "error_rate": run.errors / sent if sent else 0.0,
+        "first_error": run.first_error,
+        "duration_sec": elapsed,
+        "throughput_rps": run.service.count / elapsed if elapsed else 0.0,
+        "latency_ms": run.latency.summary_ms(),
+        "service_ms": run.service.summary_ms(),
+        "histogram_ms": run.latency.histogram_ms(),
+    }
+
+
+# --- baselines and gates ---
+
+
+def baseline_path(model_name: str) -> Path:
+    return _baselines_root() / f"{model_name}.loadtest.json"
+
+
+def load_baseline(model_name: str, path: Optional[str | Path] = None) -> Optional[dict]:
+    p = Path(path) if path else baseline_path(model_name)
+    return json.loads(p.read_text()) if p.exists() else None
+
+
+def save_baseline(model_name: str, result: dict, path: Optional[str | Path] = None) -> Path:
+    p = Path(path) if path else baseline_path(model_name)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_text(json.dumps(result, indent=2))
+    return p
+
+
+def compare_to_baseline(
+    result: dict, baseline: Optional[dict], config: Optional[dict] = None
+) -> tuple[bool, dict[str, Any]]:
+    """
+    Capacity gates (loadtest.gates): p99 latency at most max_p99_ratio x baseline, throughput at least
+    min_throughput_ratio x baseline, error_rate at most max_error_rate. Returns (all_passed, details) like eval
+    gates; without a baseline only the error-rate gate applies. Raises ValueError when the runs are not
+    comparable (different mode, rps or concurrency).
+    """
+    gates = (config or {}).get("loadtest", {}).get("gates", {})
+    details: dict[str, Any] = {}
+    max_error_rate = gates.get("max_error_rate", 0.01)
+    details["error_rate"] = {"value": result["error_rate"], "max": max_error_rate, "passed": result["error_rate"] <= max_error_rate}
+    if baseline is None:
+        details["baseline"] = {"passed": True, "reason": "no_baseline"}
+    else:
+        for key in ("mode", "rps", "concurrency"):
+            if result.get(key) != baseline.get(key):
+                raise ValueError(f"Not comparable to baseline: {key} {result.get(key)!r} vs {baseline.get(key)!r}")
+        p99, base_p99 = result["latency_ms"].get("p99"), baseline["latency_ms"].get("p99")
+        ratio = gates.get("max_p99_ratio", 1.25)
+        if p99 is None or base_p99 is None:
+            details["latency_p99_ms"] = {"passed": p99 is not None, "reason": "missing_metric" if p99 is None else "no_baseline"}
+        else:
+            details["latency_p99_ms"] = {"value": p99, "baseline": base_p99, "max": base_p99 * ratio, "passed": p99 <= base_p99 * ratio}
+        floor = baseline["throughput_rps"] * gates.get("min_throughput_ratio", 0.8)
+        details["throughput_rps"] = {
+            "value": result["throughput_rps"],
+            "baseline": baseline["throughput_rps"],
+            "min": floor,
+            "passed": result["throughput_rps"] >= floor,
+        }
+    return all(d["passed"] for d in details.values()), details
@@ -0,0 +1,254 @@
+"""
+Serving-side predictor for an embedded deployment: loads the model once, follows deploy_meta.json for
+version changes (deploy / rollback), optionally caches results for repeated identical inputs (except for bundles
+reading online feature-store aggregates), and can keep previous versions loaded so rollback is a pointer switch.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+from .cache import PredictionCache, prediction_key
+from .serving import _deployments_root
+
+
+def _uses_online_features(scorer: Any) -> bool:
+    """
+    True when the scorer's bundle adds feature-store aggregates per request: the score then depends on
+    store state that is not part of the request, so a cached result could be stale.
+    """
+    metadata = getattr(scorer, "metadata", None) or {}
+    return bool(metadata.get("feature_store", {}).get("enabled", False))
+
+
+class Predictor:
+    """
+    Score single rows against deployments/embedded/<model_name>/. Each call stats deploy_meta.json (deploys
+    write it last, after the model files); when it changed and the deployed bundle differs from the live one
+    (version, variant or model-file stamps), the model is reloaded and the prediction cache cleared, so a deploy or
+    rollback (even from another process) is picked up on the next request.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        model_dir: Optional[str | Path] = None,
+        config: Optional[dict] = None,
+        monitor: Any = None,
+    ):
+        from ..core.config import load_config, load_contract
+
+        self.model_name = model_name
+        self.model_dir = Path(model_dir) if model_dir else _deployments_root() / "deployments" / "embedded" / model_name
+        self.config = config if config is not None else load_config(model_name)
+        self.monitor = monitor
+        contract = load_contract(model_name)
+        self.feature_names = contract.feature_names() if contract else []
+        # Keys that never change the prediction: excluded from the cache key
+        self.ignore_keys = list(contract.identifiers) if contract else []
+        if contract and contract.target:
+            self.ignore_keys.append(contract.target.name)
+        cache_cfg = self.config.get("serving", {}).get("cache", {})
+        self.cache: Optional[PredictionCache] = None
+        if cache_cfg.get("enabled", False):
+            self.cache = PredictionCache(
+                max_entries=cache_cfg.get("max_entries", 10000),
+                ttl_sec=cache_cfg.get("ttl_sec", 300.0),
+            )
+        rollback_cfg = self.config.get("serving", {}).get("rollback", {})
+        self.keep_versions = int(rollback_cfg.get("keep_versions", 0))
+        self._prewarm = rollback_cfg.get("prewarm", True)
+        # (version, scorer) swapped as one reference so a request never pairs a scorer with another version's key
+        self._active: Optional[tuple[str, Any]] = None
+        # What the live scorer was loaded from: (version, variant, bundle_stamp of its files)
+        self._identity: Optional[tuple] = None
+        # Previously deployed bundles kept loaded for instant rollback:
+        # (version, variant) -> {"scorer", "artifact_path", "identity"}
+        self._resident: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+        self._artifact_path: Optional[str] = None
+        self._last_row: Any = None
+        self._stamp: Optional[tuple] = None
+        self._lock = threading.Lock()
+        # Bumped whenever the set of loaded bundles changes (reload, switch, prewarm): hosts re-check footprint_bytes()
+        self.generation = 0
+
+    @property
+    def version(self) -> Optional[str]:
+        return self._active[0] if self._active else None
+
+    def _meta_stamp(self) -> Optional[tuple]:
+        try:
+            st = (self.model_dir / "deploy_meta.json").stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _refresh(self) -> None:
+        stamp = self._meta_stamp()
+        if self._active is not None and stamp == self._stamp:
+            return
+        from ..core.artifacts import bundle_stamp
+        from ..core.runner import load_scorer
+
+        with self._lock:  # concurrent requests: one reload
+            if self._active is not None and stamp == self._stamp:
+                return
+            meta_file = self.model_dir / "deploy_meta.json"
+            meta = json.loads(meta_file.read_text()) if meta_file.exists() else {}
+            identity = (str(meta.get("version", "unversioned")), meta.get("variant", "full"), bundle_stamp(self.model_dir))
+            first_load = self._active is None
+            if self._active is not None and identity == self._identity:
+                self._stamp = stamp  # same bundle re-written (e.g. files synced after a rollback): nothing to load
+                return
+            entry = self._resident.get(identity[:2])
+            if entry is not None and entry["identity"] == identity:
+                scorer = self._resident.pop(identity[:2])["scorer"]  # warm: deployed elsewhere to a bundle we hold
+            else:
+                scorer = load_scorer(self.model_name, str(self.model_dir))
+            self._activate(identity, scorer, meta.get("artifact_path"))
+            self._stamp = stamp
+        if first_load and self.keep_versions and self._prewarm:
+            self.prewarm()
+
+    def _activate(self, identity: tuple, scorer: Any, artifact_path: Optional[str]) -> None:
+        """Make the scorer for identity (version, variant, files stamp) live; the outgoing one stays resident. Caller holds the lock."""
+        if self._active is not None and self.keep_versions:
+            self._resident[self._identity[:2]] = {
+                "scorer": self._active[1],
+                "artifact_path": self._artifact_path,
+                "identity": self._identity,
+            }
+            while len(self._resident) > self.keep_versions:
+                self._resident.popitem(last=False)
+        self._active = (identity[0], scorer)
+        self._identity = identity
+        self._artifact_path = artifact_path
+        self.generation += 1
+        self.invalidate()
+
+    def load(self) -> None:
+        """Load (or reload after a deploy) now rather than on the next request."""
+        self._refresh()
+
+    def invalidate(self) -> None:
+        """Drop cached predictions (called automatically when the deployed version changes)."""
+        if self.cache is not None:
+            self.cache.clear()
+
+    def footprint_bytes(self) -> int:
+        """
+        Resident-size proxy: on-disk bytes of every bundle this predictor holds loaded, the live one plus the
+        resident versions kept for rollback (from the file stamps recorded when each was loaded).
+        """
+        with self._lock:
+            identities = [self._identity, *(e["identity"] for e in self._resident.values())]
+        return sum(size for identity in identities if identity is not None for _, _, size in identity[2])
+
+    def resident_versions(self, variant: Optional[str] = None) -> list[str]:
+        """Versions ready for instant rollback (of one variant, or any), oldest first."""
+        return list(dict.fromkeys(v for v, var in self._resident if variant is None or var == variant))
+
+    def prewarm(self, registry: Any = None, versions: Optional[list[str]] = None) -> list[str]:
+        """
+        Load up to keep_versions earlier versions (default: previous runs from the registry) so rollback needs
+        no file copy or unpickling. Each candidate must load and, once traffic has been seen, score the last
+        request; failures are skipped. Returns the versions now resident.
+        """
+        from ..core.artifacts import bundle_stamp
+        from ..core.registry import Registry
+        from ..core.runner import load_scorer
+        from .rollback import get_previous_versions
+
+        if not self.keep_versions:
+            return []
+        self._refresh()
+        if registry is None:
+            reg_cfg = self.config.get("registry", {})
+            registry = Registry(backend=reg_cfg.get("backend", "local"), uri=reg_cfg.get("uri", "./registry"))
+        if versions is None:
+            # +1: the registry listing includes the live version, which is filtered out
+            versions = get_previous_versions(
+                self.model_name, self.version, limit=self.keep_versions + 1, registry=registry
+            )
+        runs_root = Path(self.config.get("runs", {}).get("root", "./runs"))
+        for version in versions[: self.keep_versions]:
+            if version == self.version or (version, "full") in self._resident:
+                continue
+            artifact_path = registry.get_run(self.model_name, version).get("artifact_path") or str(
+                runs_root / version / "artifact"
+            )
+            if not Path(artifact_path).exists():
+                continue
+            try:
+                scorer = load_scorer(self.model_name, artifact_path)
+                if self._last_row is not None:
+                    scorer(self._last_row)
+            except Exception as e:  # a broken old bundle must not take down the live model
+                if self.monitor is not None:
+                    self.monitor.record_error(e)
+                continue
+            with self._lock:
+                # Run artifacts load as the full variant; deploys copy2 these files, so the stamp matches once deployed
+                identity = (version, "full", bundle_stamp(artifact_path))
+                self._resident[identity[:2]] = {"scorer": scorer, "artifact_path": artifact_path, "identity": identity}
+                self._resident.move_to_end(identity[:2], last=False)  # registry order is newest first
+                while len(self._resident) > self.keep_versions:
+                    self._resident.popitem(last=False)
+                self.generation += 1
+        return self.resident_versions()
+
+    def switch_to(self, version: str, variant: Optional[str] = None) -> dict[str, Any]:
+        """
+        Instant rollback to a resident version: swap the live scorer in this process only. The deployment on
+        disk is left as is; rollback_instant then syncs the files and writes deploy_meta.json last, which this
+        predictor recognizes as the bundle it already serves (no reload) and other processes pick up.
+        variant: which resident variant (default: full when resident, else the other one).
+        Raises KeyError when the version is not resident. Returns timings in ms.
+        """
+        t0 = time.perf_counter()
+        with self._lock:
+            if variant is None:
+                variant = "full" if (version, "full") in self._resident else "compact"
+            entry = self._resident.pop((version, variant))
+            previous = self.version
+            self._activate(entry["identity"], entry["scorer"], entry["artifact_path"])
+        t_done = time.perf_counter()
+        return {"version": version, "previous": previous, "time_to_rollback_ms": (t_done - t0) * 1000}
+
+    def predict(self, row: dict | tuple) -> Any:
+        t0 = time.perf_counter()
+        self._refresh()
+        version, scorer = self._active
+        self._last_row = row
+        key = None
+        if self.cache is not None and not _uses_online_features(scorer):
+            key = prediction_key(row, self.feature_names, version, ignore=self.ignore_keys)
+            cached = self.cache.get(key)
+            if self.monitor is not None:
+                self.monitor.record_cache(cached is not None)
+            if cached is not None:
+                self._record(cached, t0)
+                return dict(cached) if isinstance(cached, dict) else cached
+        try:
+            out = scorer(row)
+        except Exception as e:
+            if self.monitor is not None:
+                self.monitor.record_error(e)
+            raise
+        if key is not None:
+            self.cache.put(key, dict(out) if isinstance(out, dict) else out)
+        self._record(out, t0)
+        return out
+
+    __call__ = predict
+
+    def _record(self, out: Any, t0: float) -> None:
+        if self.monitor is None:
+            return
+        self.monitor.record_latency(time.perf_counter() - t0)
+        if isinstance(out, dict) and "probability" in out:
+            self.monitor.record_prediction(out["probability"])
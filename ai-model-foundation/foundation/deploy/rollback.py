@@ -3,7 +3,8 @@ Rollback: switch serving to a previous model version.
 """
 from __future__ import annotations
 
-from typing import Optional
+import time
+from typing import Any, Optional
 
 from ..core.registry import Registry
 from .serving import deploy_to_target
@@ -14,10 +15,11 @@ def rollback_to_version(
     to_version: str,
     registry: Optional[Registry] = None,
     config: Optional[dict] = None,
+    variant: Optional[str] = None,
 ) -> None:
     """
     Deploy the specified version to prod (rollback). Optionally resolve
-    artifact_path from registry.
+    artifact_path from registry. variant defaults to deploy.variant.
     """
     registry = registry or Registry()
     run = registry.get_run(model_name, to_version)
@@ -30,11 +32,47 @@ def rollback_to_version(
         target="prod",
         metrics=metrics,
         config=config,
+        variant=variant,
     )
 
 
-def get_previous_versions(model_name: str, current_version: str, limit: int = 10) -> list[str]:
+def rollback_instant(
+    predictor: Any,
+    to_version: str,
+    registry: Optional[Registry] = None,
+    config: Optional[dict] = None,
+) -> dict[str, Any]:
+    """
+    Roll a live Predictor back. When the version is resident (serving.rollback.keep_versions), this process
+    switches pointers at once; then the files and baseline are synced and deploy_meta.json is written last,
+    so other processes only see the new version once its files are in place (and this one does not reload).
+    Otherwise it falls back to rollback_to_version and a cold load. The bundle variant is deploy.variant.
+    Returns {"version", "mode": "resident" | "cold", "time_to_rollback_ms", "total_ms"}.
+    """
+    t0 = time.perf_counter()
+    variant = (config or predictor.config).get("deploy", {}).get("variant", "full")
+    if to_version in predictor.resident_versions(variant):
+        timings = predictor.switch_to(to_version, variant)
+        rollback_to_version(predictor.model_name, to_version, registry=registry, config=config, variant=variant)
+        return {
+            "version": to_version,
+            "mode": "resident",
+            "time_to_rollback_ms": timings["time_to_rollback_ms"],
+            "total_ms": (time.perf_counter() - t0) * 1000,
+        }
+    rollback_to_version(predictor.model_name, to_version, registry=registry, config=config, variant=variant)
+    predictor.load()
+    elapsed = (time.perf_counter() - t0) * 1000
+    return {"version": to_version, "mode": "cold", "time_to_rollback_ms": elapsed, "total_ms": elapsed}
+
+
+def get_previous_versions(
+    model_name: str,
+    current_version: str,
+    limit: int = 10,
+    registry: Optional[Registry] = None,
+) -> list[str]:
     """List previous run/version IDs for a model (for choosing rollback target)."""
-    reg = Registry()
+    reg = registry or Registry()
     runs = reg.list_runs(model_name, limit=limit)
     return [r for r in runs if r != current_version][:limit]
@@ -0,0 +1,134 @@
+"""
+Deterministic traffic splitting for canary and A/B: a request's routing key (data contract identifiers, e.g.
+transaction_id) is hashed (blake2b, 64-bit) to a point in [0, 2**64) and the arm owning that slice of the
+weighted layout serves it. The same key always lands on the same arm for a given layout and salt, so results
+reproduce; optional stickiness also keeps entities on their arm when weights change. Weights can be replaced
+at runtime (set_weights) without restarting.
+"""
+from __future__ import annotations
+
+import hashlib
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Any, Optional, Sequence
+
+from .cache import _canonical
+
+_SPACE = 1 << 64
+
+
+def route_hash(key: str | bytes, salt: bytes = b"") -> int:
+    """Stable 64-bit hash of a routing key (independent of PYTHONHASHSEED and process)."""
+    data = key if isinstance(key, bytes) else key.encode()
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8, salt=salt).digest(), "big")
+
+
+class _Layout:
+    """Immutable arm layout: arm i owns hash points [bounds[i-1], bounds[i])."""
+
+    __slots__ = ("arms", "weights", "bounds")
+
+    def __init__(self, weights: dict[str, float]):
+        total = float(sum(weights.values()))
+        if not weights or total <= 0 or any(w < 0 for w in weights.values()):
+            raise ValueError("Traffic split needs at least one arm and non-negative weights with a positive sum")
+        self.arms = list(weights)
+        self.weights = {arm: w / total for arm, w in weights.items()}
+        acc, bounds = 0.0, []
+        for arm in self.arms:
+            acc += weights[arm]
+            bounds.append(min(int(acc / total * _SPACE), _SPACE))
+        bounds[-1] = _SPACE
+        self.bounds = bounds
+
+
+class TrafficSplitter:
+    """
+    Assign requests to weighted arms (model versions) by hashing key_fields of the row.
+    sticky=True remembers each key's first arm (bounded LRU of sticky_max_entries) so later weight changes
+    only affect new keys; without it a weight change moves just the keys in the slices that changed owner.
+    """
+
+    def __init__(
+        self,
+        weights: dict[str, float],
+        key_fields: Sequence[str] = (),
+        salt: str = "",
+        sticky: bool = False,
+        sticky_max_entries: int = 100_000,
+    ):
+        self.key_fields = list(key_fields)
+        self.salt = hashlib.blake2b(salt.encode(), digest_size=16).digest() if salt else b""
+        self._hasher = hashlib.blake2b(digest_size=8, salt=self.salt)  # copied per key: skips re-init
+        self.sticky = sticky
+        self.sticky_max_entries = sticky_max_entries
+        self._layout = _Layout(dict(weights))
+        self._sticky: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.counts: dict[str, int] = {arm: 0 for arm in self._layout.arms}
+
+    @classmethod
+    def from_canary_spec(cls, spec: dict[str, Any], config: Optional[dict] = None) -> "TrafficSplitter":
+        """Two arms from canary_spec(): current_version gets 100 - canary_percent, new_version the rest."""
+        config = config or {}
+        routing = config.get("deploy", {}).get("routing", {})
+        percent = float(spec["canary_percent"])
+        weights = {spec["current_version"]: 100.0 - percent, spec["new_version"]: percent}
+        return cls(
+            weights,
+            key_fields=routing.get("key") or config.get("data_contract", {}).get("identifiers", []),
+            salt=routing.get("salt") or spec.get("model_name", ""),
+            sticky=routing.get("sticky", False),
+            sticky_max_entries=routing.get("sticky_max_entries", 100_000),
+        )
+
+    @property
+    def weights(self) -> dict[str, float]:
+        return dict(self._layout.weights)
+
+    def set_weights(self, weights: dict[str, float]) -> None:
+        """Swap the split atomically (in-flight assignments finish on the old layout). Sticky keys on removed arms are re-routed."""
+        layout = _Layout(dict(weights))
+        with self._lock:
+            self._layout = layout
+            for arm in layout.arms:
+                self.counts.setdefault(arm, 0)
+
+    def routing_key(self, row: dict | str) -> str:
+        """key_fields joined in order; rows without them fall back to all fields (canonical, order-independent)."""
+        if isinstance(row, str):
+            return row
+        if self.key_fields and all(f in row for f in self.key_fields):
+            return "\x1f".join(str(_canonical(row[f])) for f in self.key_fields)
+        return "\x1f".join(f"{k}={_canonical(v)}" for k, v in sorted(row.items()))
+
+    def _hash(self, key: str) -> int:
+        h = self._hasher.copy()
+        h.update(key.encode())
+        return int.from_bytes(h.digest(), "big")  # == route_hash(key, self.salt)
+
+    def arm_for_key(self, key: str) -> str:
+        """Arm for a routing key on the current layout (pure: no stickiness, no counters)."""
+        layout = self._layout
+        return layout.arms[bisect_right(layout.bounds, self._hash(key))]
+
+    def assign(self, row: dict | str) -> str:
+        """Arm (model version) that should serve this request."""
+        key = self.routing_key(row)
+        layout = self._layout
+        if self.sticky:
+            with self._lock:
+                arm = self._sticky.get(key)
+                if arm is not None and arm in layout.weights and layout.weights[arm] > 0:
+                    self._sticky.move_to_end(key)
+                    self.counts[arm] += 1
+                    return arm
+        arm = layout.arms[bisect_right(layout.bounds, self._hash(key))]
+        with self._lock:
+            self.counts[arm] = self.counts.get(arm, 0) + 1
+            if self.sticky:
+                self._sticky[key] = arm
+                if len(self._sticky) > self.sticky_max_entries:
+                    self._sticky.popitem(last=False)
+        return arm
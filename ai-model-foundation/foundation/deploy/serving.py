@@ -4,10 +4,14 @@ Deploy helpers: copy artifact to deployments/embedded/ (Phase 1), and optional K
 from __future__ import annotations
 
 import json
+import os
 import shutil
 from pathlib import Path
 from typing import Any, Optional
 
+from ..core.compact import COMPACT_FILE, COMPACT_META_FILE
+from ..core.forest import COMPILED_FILE
+
 
 def _deployments_root() -> Path:
     """Repo root for deployments/ (embedded, future channels, etc.)."""
@@ -18,6 +22,13 @@ def _baselines_root() -> Path:
     return Path(__file__).resolve().parent.parent.parent
 
 
+def _copy_atomic(src: Path, dst: Path) -> None:
+    """copy2 (content + mtime) to a temp name, then rename over dst: readers see the old or the new file."""
+    tmp = dst.with_name(dst.name + ".tmp")
+    shutil.copy2(src, tmp)
+    os.replace(tmp, dst)
+
+
 def get_serving_spec(
     model_name: str,
     version: str,
@@ -50,31 +61,57 @@ def deploy_to_embedded(
     stage: str = "staging",
     metrics: Optional[dict] = None,
     config: Optional[dict] = None,
+    variant: Optional[str] = None,
 ) -> Path:
     """
     Copy artifact from runs/<run_id>/artifact/ to deployments/embedded/<model_name>/model.bin.
+    variant (default deploy.variant): "full" ships model.bin (+ model.forest.npz); "compact" ships only
+    model.compact.npz + compact.json (foundation export) for targets where size and load time matter.
     If stage is prod, save baseline to baselines/<model_name>.json.
-    Returns path to deployments/embedded/<model_name>/model.bin.
+    Returns path to the deployed model file.
     """
+    variant = variant or (config or {}).get("deploy", {}).get("variant", "full")
+    if variant not in ("full", "compact"):
+        raise ValueError(f"Unknown deploy variant {variant!r}")
     root = _deployments_root()
     embedded_dir = root / "deployments" / "embedded" / model_name
-    embedded_dir.mkdir(parents=True, exist_ok=True)
     artifact_dir = Path(artifact_path)
-    # Copy model (prefer model.bin) and metadata so embedded app can load_bundle()
-    src_bin = artifact_dir / "model.bin" if (artifact_dir / "model.bin").exists() else artifact_dir / "model.joblib"
-    if src_bin.exists():
-        shutil.copy2(src_bin, embedded_dir / "model.bin")
+    if variant == "compact" and not (artifact_dir / COMPACT_FILE).exists():
+        raise FileNotFoundError(f"No {COMPACT_FILE} in {artifact_dir}; run foundation export first")
+    embedded_dir.mkdir(parents=True, exist_ok=True)
+    if variant == "compact":
+        shipped = {COMPACT_FILE: artifact_dir / COMPACT_FILE, COMPACT_META_FILE: artifact_dir / COMPACT_META_FILE}
+    else:
+        # Copy model (prefer model.bin) and metadata so embedded app can load_bundle()
+        src_bin = artifact_dir / "model.bin" if (artifact_dir / "model.bin").exists() else artifact_dir / "model.joblib"
+        shipped = {"model.bin": src_bin, COMPILED_FILE: artifact_dir / COMPILED_FILE}
+    # Files first (each replaced atomically, mtime kept), deploy_meta.json last: servers reload when they see
+    # a new deploy_meta.json, so they never load a half-synced bundle under the new version
+    for name in ("model.bin", COMPILED_FILE, COMPACT_FILE, COMPACT_META_FILE):
+        src = shipped.get(name)
+        if src is not None and src.exists():
+            _copy_atomic(src, embedded_dir / name)
+        elif (embedded_dir / name).exists():
+            (embedded_dir / name).unlink()  # load_bundle picks the model by which files exist: no stale ones
     if (artifact_dir / "metadata.json").exists():
-        shutil.copy2(artifact_dir / "metadata.json", embedded_dir / "metadata.json")
+        _copy_atomic(artifact_dir / "metadata.json", embedded_dir / "metadata.json")
     # Record what is deployed (for "what model is in staging?")
-    deploy_meta = {"model_name": model_name, "version": run_id, "stage": stage, "artifact_path": str(artifact_path)}
-    (embedded_dir / "deploy_meta.json").write_text(json.dumps(deploy_meta, indent=2))
+    deploy_meta = {
+        "model_name": model_name,
+        "version": run_id,
+        "stage": stage,
+        "artifact_path": str(artifact_path),
+        "variant": variant,
+    }
+    tmp = embedded_dir / "deploy_meta.json.tmp"
+    tmp.write_text(json.dumps(deploy_meta, indent=2))
+    os.replace(tmp, embedded_dir / "deploy_meta.json")
     if stage == "prod" and metrics:
         baselines_dir = _baselines_root() / "baselines"
         baselines_dir.mkdir(parents=True, exist_ok=True)
         baseline_file = baselines_dir / f"{model_name}.json"
         baseline_file.write_text(json.dumps({"version": run_id, **metrics}, indent=2))
-    return embedded_dir / "model.bin"
+    return embedded_dir / ("model.bin" if variant == "full" else COMPACT_FILE)
 
 
 def deploy_to_target(
@@ -84,6 +121,7 @@ def deploy_to_target(
     target: str = "staging",
     metrics: Optional[dict] = None,
     config: Optional[dict] = None,
+    variant: Optional[str] = None,
 ) -> None:
     """Copy to deployments/embedded (and save baseline if target=prod). Optionally trigger K8s."""
-    deploy_to_embedded(model_name, version, artifact_path, stage=target, metrics=metrics, config=config)
+    deploy_to_embedded(model_name, version, artifact_path, stage=target, metrics=metrics, config=config, variant=variant)
@@ -1,3 +1,18 @@
-from .harness import run_harness
-from .metrics import compute_gate_result
-from .baselines import get_baseline_metrics
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "run_harness": ".harness",
+    "compute_gate_result": ".metrics",
+    "get_baseline_metrics": ".baselines",
+    "bootstrap_intervals": ".intervals",
+    "delong_interval": ".intervals",
+    "metric_intervals": ".intervals",
+})
+
+if TYPE_CHECKING:
+    from .harness import run_harness
+    from .metrics import compute_gate_result
+    from .baselines import get_baseline_metrics
+    from .intervals import bootstrap_intervals, delong_interval, metric_intervals
@@ -37,5 +37,6 @@ def get_baseline_metrics(
     config = config or {}
     baselines = config.get("eval", {}).get("baselines", {})
     if baseline_name in baselines:
-        return dict(baselines[baseline_name])
+        # Numeric entries only: a baseline may also carry its scoring rule (e.g. heuristic.rule)
+        return {k: float(v) for k, v in baselines[baseline_name].items() if isinstance(v, (int, float))}
     return {}
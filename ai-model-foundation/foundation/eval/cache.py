@@ -0,0 +1,57 @@
+"""
+Eval result cache: key = (model bundle digest, eval data digest, the model's eval/feature code, eval config +
+data contract + the feature_store and compact sections).
+Entries live in the local registry index so repeated CI gate runs skip model loading.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Optional
+
+from ..core.hashing import file_digest, json_digest, path_digest
+
+# Model source files whose changes alter eval results for an unchanged bundle
+CODE_FILES = ("eval.py", "features.py")
+
+
+def model_digest(model_path: str | Path) -> str:
+    """
+    Digest of the bundle's model file (model.bin, else model.joblib) plus metadata.json and the compact variant
+    (its metrics are reported alongside) when present.
+    """
+    from ..core.compact import COMPACT_FILE
+
+    path = Path(model_path)
+    model_file = path / "model.bin" if (path / "model.bin").exists() else path / "model.joblib"
+    parts = [file_digest(model_file) if model_file.exists() else ""]
+    if (path / "metadata.json").exists():
+        parts.append(file_digest(path / "metadata.json"))
+    if (path / COMPACT_FILE).exists():
+        parts.append(file_digest(path / COMPACT_FILE))
+    return json_digest(parts)
+
+
+def eval_cache_key(
+    model_name: str,
+    model_path: str | Path,
+    eval_data_path: str | Path,
+    config: dict,
+    extra: Optional[dict[str, Any]] = None,
+) -> str:
+    """
+    Cache key for one eval: changes when the bundle, the eval data, models/<name>/eval.py or features.py, the
+    eval / data_contract / feature_store / compact config sections, or extra kwargs change.
+    """
+    from ..core.runner import _MODELS_ROOT
+
+    return json_digest({
+        "model_name": model_name,
+        "model": model_digest(model_path),
+        "data": file_digest(eval_data_path),
+        "code": {name: path_digest(_MODELS_ROOT / model_name / name) for name in CODE_FILES},
+        "eval": config.get("eval", {}),
+        "data_contract": config.get("data_contract", {}),
+        "feature_store": config.get("feature_store", {}),
+        "compact": config.get("compact", {}),
+        "extra": extra or {},
+    })
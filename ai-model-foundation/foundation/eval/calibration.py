@@ -0,0 +1,169 @@
+"""
+Probability calibration and cost-optimal decision threshold, fitted once at train time and stored in the bundle
+metadata ("calibration", "score_threshold", "decision"). Calibration maps raw model scores to probabilities
+(isotonic: piecewise-linear table; platt: sigmoid of the score) on out-of-bag scores when the forest has them.
+The threshold sweep sorts the calibrated scores once and evaluates every cut with cumulative sums, so the
+whole fit is O(n log n). Predict applies both as a table lookup and one comparison per row.
+"""
+from __future__ import annotations
+
+from typing import Any, Optional
+
+METHODS = ("isotonic", "platt", "none")
+
+
+class Calibrator:
+    """
+    Score -> calibrated probability from a stored mapping: {"method": "isotonic", "x": [...], "y": [...]}
+    (linear interpolation between knots, clipped at the ends) or {"method": "platt", "a": a, "b": b}.
+    Floats and arrays go through the same NumPy formula, so the row and batch paths agree bit for bit at the
+    threshold; a float in returns a float out.
+    """
+
+    def __init__(self, spec: dict[str, Any]):
+        import numpy as np
+
+        self.method = spec["method"]
+        if self.method == "isotonic":
+            self.x = [float(v) for v in spec["x"]]
+            self.y = [float(v) for v in spec["y"]]
+            self._xp, self._fp = np.asarray(self.x), np.asarray(self.y)
+        elif self.method == "platt":
+            self.a, self.b = float(spec["a"]), float(spec["b"])
+        else:
+            raise ValueError(f"Unknown calibration method {self.method!r}; expected isotonic or platt")
+
+    def to_dict(self) -> dict[str, Any]:
+        if self.method == "isotonic":
+            return {"method": "isotonic", "x": self.x, "y": self.y}
+        return {"method": "platt", "a": self.a, "b": self.b}
+
+    def __call__(self, score: Any) -> Any:
+        import numpy as np
+
+        scalar = isinstance(score, float)
+        score = np.asarray(score, dtype=np.float64)
+        if self.method == "platt":
+            out = 1.0 / (1.0 + np.exp(-(self.a * score + self.b)))
+        else:
+            out = np.interp(score, self._xp, self._fp)
+        return float(out) if scalar else out
+
+
+def fit_calibration(scores: Any, labels: Any, method: str = "isotonic") -> Optional[Calibrator]:
+    """Fit a Calibrator on (raw score, 0/1 label) pairs; None for method "none" or a single-class sample."""
+    import numpy as np
+
+    if method not in METHODS:
+        raise ValueError(f"calibration.method must be one of {METHODS}, got {method!r}")
+    scores = np.asarray(scores, dtype=np.float64)
+    labels = np.asarray(labels).astype(int)
+    if method == "none" or len(np.unique(labels)) < 2:
+        return None
+    if method == "platt":
+        from sklearn.linear_model import LogisticRegression
+
+        lr = LogisticRegression(C=1e6).fit(scores.reshape(-1, 1), labels)
+        return Calibrator({"method": "platt", "a": float(lr.coef_[0, 0]), "b": float(lr.intercept_[0])})
+    from sklearn.isotonic import IsotonicRegression
+
+    iso = IsotonicRegression(y_min=0.0, y_max=1.0, out_of_bounds="clip").fit(scores, labels)
+    return Calibrator({"method": "isotonic", "x": iso.X_thresholds_.tolist(), "y": iso.y_thresholds_.tolist()})
+
+
+def cost_threshold(proba: Any, labels: Any, false_negative_cost: Any = 1.0, false_positive_cost: Any = 1.0) -> dict[str, Any]:
+    """
+    Threshold t minimizing total cost when rows with proba >= t are flagged: missed positives cost
+    false_negative_cost each (scalar, or per row, e.g. the transaction amount) and flagged negatives
+    false_positive_cost. One sort, then cumulative costs for every cut between distinct scores (ties stay
+    together); t is the midpoint to the next lower score. Returns threshold, cost, false_negatives,
+    false_positives, and cost_at_default (t = 0.5) for comparison.
+    """
+    import numpy as np
+
+    proba = np.asarray(proba, dtype=np.float64)
+    labels = np.asarray(labels).astype(bool)
+    n = len(proba)
+    fn_cost = np.broadcast_to(np.asarray(false_negative_cost, dtype=np.float64), (n,))
+    fp_cost = np.broadcast_to(np.asarray(false_positive_cost, dtype=np.float64), (n,))
+    order = np.argsort(-proba, kind="stable")
+    p = proba[order]
+    caught = np.cumsum(np.where(labels[order], fn_cost[order], 0.0))  # fraud loss avoided by the top k
+    flagged_neg = np.cumsum(np.where(labels[order], 0.0, fp_cost[order]))
+    missed_total = float(fn_cost[labels].sum())
+    # Candidate cuts: flag nothing, or flag everything down to the last row of each tie group
+    ends = np.flatnonzero(np.r_[p[1:] != p[:-1], True]) if n else np.array([], dtype=int)
+    costs = np.r_[missed_total, missed_total - caught[ends] + flagged_neg[ends]]
+    best = int(np.argmin(costs))
+    if best == 0:
+        threshold = float(np.nextafter(p[0], np.inf)) if n else 0.5
+        fn, fp = int(labels.sum()), 0
+    else:
+        end = ends[best - 1]
+        threshold = float((p[end] + p[end + 1]) / 2) if end + 1 < n else float(p[end])
+        fn = int(labels[order][end + 1:].sum())
+        fp = int((~labels[order][: end + 1]).sum())
+    default = proba >= 0.5
+    cost_at_default = float(fn_cost[labels & ~default].sum() + fp_cost[~labels & default].sum())
+    return {
+        "threshold": threshold,
+        "cost": float(costs[best]),
+        "false_negatives": fn,
+        "false_positives": fp,
+        "cost_at_default": cost_at_default,
+    }
+
+
+def _calibration_scores(model: Any, X: Any, y: Any) -> tuple[Any, Any, str]:
+    """
+    Raw positive-class scores for fitting and the mask of rows they cover: out-of-bag when the forest kept them
+    (rows never out-of-bag are dropped), else in-sample predict_proba over every row.
+    """
+    import numpy as np
+
+    y = np.asarray(y)
+    oob = getattr(model, "oob_decision_function_", None)
+    if oob is not None:
+        keep = ~np.isnan(oob).any(axis=1)
+        if len(np.unique(y[keep])) > 1:
+            return oob[keep, -1], keep, "oob"
+    return model.predict_proba(X)[:, -1], np.ones(len(y), dtype=bool), "train"
+
+
+def fit_decision(model: Any, X: Any, y: Any, config: dict, frame: Any = None) -> dict[str, Any]:
+    """
+    Bundle metadata for the serving decision (config calibration:): calibration mapping (or None), the
+    cost-optimal score_threshold on calibrated scores, and decision stats (method, source, rows, costs).
+    frame supplies calibration.cost.false_negative_column (e.g. amount) per row. With calibration disabled,
+    a model without predict_proba or a single-class target, only score_threshold (config
+    thresholds.score_threshold) is returned.
+    """
+    import numpy as np
+
+    cfg = config.get("calibration", {})
+    fallback = config.get("thresholds", {}).get("score_threshold", 0.5)
+    if not cfg.get("enabled", True) or not hasattr(model, "predict_proba") or len(np.unique(np.asarray(y))) < 2:
+        return {"score_threshold": fallback}
+    method = cfg.get("method", "isotonic")
+    scores, keep, source = _calibration_scores(model, X, y)
+    labels = np.asarray(y)[keep]
+    calibrator = fit_calibration(scores, labels, method)
+    proba = calibrator(scores) if calibrator is not None else scores
+    cost = cfg.get("cost", {})
+    fn_cost: Any = cost.get("false_negative", 1.0)
+    column = cost.get("false_negative_column")
+    if column and frame is not None and column in frame:
+        fn_cost = np.asarray(frame[column], dtype=np.float64)[keep]
+    sweep = cost_threshold(proba, labels, fn_cost, cost.get("false_positive", 1.0))
+    return {
+        "score_threshold": sweep.pop("threshold"),
+        "calibration": calibrator.to_dict() if calibrator is not None else None,
+        "decision": {"method": method, "source": source, "rows": int(len(labels)), **sweep},
+    }
+
+
+def decision_from_metadata(metadata: dict, threshold: Optional[float] = None) -> tuple[Optional[Calibrator], float]:
+    """(Calibrator or None, score threshold) for predict; an explicit threshold overrides the stored one."""
+    spec = metadata.get("calibration")
+    calibrator = Calibrator(spec) if spec else None
+    return calibrator, threshold or metadata.get("score_threshold", 0.5)
@@ -6,8 +6,11 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Optional
 
+from ..core.registry import Registry
 from ..core.runner import run_eval
 from .baselines import get_baseline_metrics
+from .cache import eval_cache_key
+from .intervals import metric_intervals
 from .metrics import compute_gate_result
 
 
@@ -18,26 +21,70 @@ def run_harness(
     config: dict,
     baseline_name: Optional[str] = None,
     gate_metrics: Optional[list[str]] = None,
+    registry: Optional[Registry] = None,
+    force: bool = False,
     **kwargs: Any,
 ) -> dict:
     """
     Run model eval, optionally compare to baseline, and compute gate pass/fail.
-    Returns dict with metrics, baseline_metrics, gate_passed, gate_details.
+    With eval.gate_mode: bootstrap, gates use the CI lower bound computed from the entrypoint's per-sample output.
+    With a registry (and eval.cache enabled), results are cached by bundle/data/config digest; a hit skips
+    model loading. force=True recomputes and refreshes the entry. Gates are always re-applied against
+    current baselines. When the bundle has a compact variant (model.compact.npz) and compact.report_in_eval is
+    on, it is evaluated too and reported as compact: {metrics, delta} (delta = compact - full; not gated).
+    Returns dict with metrics, baseline_metrics, gate_passed, gate_details, cached (and intervals in bootstrap mode).
     """
-    result = run_eval(
-        model_name=model_name,
-        model_path=model_path,
-        eval_data_path=eval_data_path,
-        config=config,
-        **kwargs,
-    )
-    metrics = result.get("metrics", result)
+    use_cache = registry is not None and config.get("eval", {}).get("cache", True)
+    cache_key = eval_cache_key(model_name, model_path, eval_data_path, config, extra=kwargs) if use_cache else None
+    cached = registry.get_cached_eval(model_name, cache_key) if use_cache and not force else None
+    if cached is not None:
+        metrics = cached["metrics"]
+        gate_metrics = gate_metrics or list(metrics.keys())
+        intervals = cached.get("intervals")
+        compact = cached.get("compact")
+    else:
+        result = run_eval(
+            model_name=model_name,
+            model_path=model_path,
+            eval_data_path=eval_data_path,
+            config=config,
+            **kwargs,
+        )
+        metrics = result.get("metrics", result)
+        gate_metrics = gate_metrics or list(metrics.keys())
+        intervals = None
+        if config.get("eval", {}).get("gate_mode", "point") == "bootstrap" and result.get("samples"):
+            intervals = metric_intervals(result["samples"], gate_metrics, config)
+        compact = _compact_report(model_name, model_path, eval_data_path, config, metrics, kwargs)
+        if use_cache:
+            registry.put_cached_eval(model_name, cache_key, {"metrics": metrics, "intervals": intervals, "compact": compact})
     baseline_metrics = get_baseline_metrics(model_name, baseline_name or "heuristic", config)
-    gate_metrics = gate_metrics or list(metrics.keys())
-    gate_passed, gate_details = compute_gate_result(metrics, baseline_metrics, gate_metrics, config)
-    return {
+    gate_passed, gate_details = compute_gate_result(metrics, baseline_metrics, gate_metrics, config, intervals=intervals)
+    out = {
         "metrics": metrics,
         "baseline_metrics": baseline_metrics,
         "gate_passed": gate_passed,
         "gate_details": gate_details,
+        "cached": cached is not None,
     }
+    if intervals is not None:
+        out["intervals"] = intervals
+    if compact is not None:
+        out["compact"] = compact
+    return out
+
+
+def _compact_report(
+    model_name: str, model_path: str, eval_data_path: str, config: dict, metrics: dict, kwargs: dict
+) -> Optional[dict]:
+    """Metrics of the bundle's compact variant and their delta vs the full model, or None when not exported."""
+    from ..core.compact import COMPACT_FILE
+
+    if "variant" in kwargs or not config.get("compact", {}).get("report_in_eval", True):
+        return None
+    if not (Path(model_path) / COMPACT_FILE).exists():
+        return None
+    result = run_eval(model_name, model_path, eval_data_path, config, **kwargs, variant="compact")
+    compact_metrics = result.get("metrics", result)
+    delta = {k: compact_metrics[k] - v for k, v in metrics.items() if isinstance(v, (int, float)) and k in compact_metrics}
+    return {"metrics": compact_metrics, "delta": delta}
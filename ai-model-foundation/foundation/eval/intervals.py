@@ -0,0 +1,179 @@
+"""
+Confidence intervals for eval metrics (statistical gates).
+Bootstrap resampling is vectorized: one NumPy index matrix per chunk of resamples, no Python loop per resample.
+"""
+from __future__ import annotations
+
+import os
+import time
+from typing import Any, Optional
+
+# Metrics with a vectorized bootstrap implementation (higher is better for both)
+SUPPORTED_METRICS = ("accuracy", "auc")
+
+
+def _accuracy_resamples(correct, idx):
+    """Accuracy per resample: mean of correct[idx] along each row of the index matrix."""
+    return correct[idx].mean(axis=1)
+
+
+def _auc_resamples(y_true, levels, n_levels, idx):
+    """
+    AUC per resample (Mann-Whitney with ties counted 1/2), from per-row class counts at each score level.
+    levels are dense ranks of the scores, so ties share a level.
+    """
+    import numpy as np
+
+    n_resamples = idx.shape[0]
+    pos = y_true[idx]
+    flat = np.arange(n_resamples)[:, None] * n_levels + levels[idx]
+    pos_counts = np.bincount(flat[pos], minlength=n_resamples * n_levels).reshape(n_resamples, n_levels)
+    neg_counts = np.bincount(flat[~pos], minlength=n_resamples * n_levels).reshape(n_resamples, n_levels)
+    neg_below = np.cumsum(neg_counts, axis=1) - neg_counts
+    wins = (pos_counts * (neg_below + 0.5 * neg_counts)).sum(axis=1)
+    n_pos = pos_counts.sum(axis=1)
+    n_neg = neg_counts.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        auc = wins / (n_pos * n_neg)
+    return auc  # NaN where a resample drew a single class
+
+
+def _resample_chunk(seed_seq, size: int, arrays: tuple) -> dict[str, Any]:
+    """Draw one index matrix (size x n) and compute every requested metric on it."""
+    import numpy as np
+
+    correct, y_true, levels, n_levels, metric_names = arrays
+    idx = np.random.default_rng(seed_seq).integers(0, len(y_true), size=(size, len(y_true)))
+    out = {}
+    if "accuracy" in metric_names:
+        out["accuracy"] = _accuracy_resamples(correct, idx)
+    if "auc" in metric_names:
+        out["auc"] = _auc_resamples(y_true, levels, n_levels, idx)
+    return out
+
+
+def delong_interval(y_true, y_score, confidence: float = 0.95) -> dict[str, float]:
+    """AUC with DeLong variance (closed form, no resampling). Returns auc, ci_low, ci_high."""
+    import numpy as np
+    from statistics import NormalDist
+
+    y_true = np.asarray(y_true).astype(bool)
+    y_score = np.asarray(y_score, dtype=float)
+    pos = np.sort(y_score[y_true])
+    neg = np.sort(y_score[~y_true])
+    if len(pos) < 2 or len(neg) < 2:
+        return {}
+    # Structural components: per-positive share of negatives beaten, per-negative share of positives beating it
+    v10 = (np.searchsorted(neg, pos, "left") + np.searchsorted(neg, pos, "right")) / (2.0 * len(neg))
+    v01 = 1.0 - (np.searchsorted(pos, neg, "left") + np.searchsorted(pos, neg, "right")) / (2.0 * len(pos))
+    auc = float(v10.mean())
+    se = float(np.sqrt(v10.var(ddof=1) / len(pos) + v01.var(ddof=1) / len(neg)))
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    return {"auc": auc, "ci_low": max(0.0, auc - z * se), "ci_high": min(1.0, auc + z * se)}
+
+
+def bootstrap_intervals(
+    y_true,
+    y_score,
+    y_pred=None,
+    metric_names: Optional[list[str]] = None,
+    n_resamples: int = 1000,
+    confidence: float = 0.95,
+    seed: int = 42,
+    time_budget_sec: Optional[float] = None,
+    n_jobs: int = 1,
+    chunk_size: Optional[int] = None,
+) -> dict[str, dict[str, Any]]:
+    """
+    Percentile bootstrap intervals for accuracy and AUC.
+    Resamples are drawn in chunks (index matrix of shape chunk x n); chunks run in a process pool when n_jobs > 1.
+    Stops early when time_budget_sec is exceeded and reports how many resamples were used.
+    Returns {metric: {"value", "ci_low", "ci_high", "n_resamples"}}.
+    """
+    import numpy as np
+
+    y_true = np.asarray(y_true).astype(bool)
+    y_score = np.asarray(y_score, dtype=float)
+    y_pred = (y_score >= 0.5) if y_pred is None else np.asarray(y_pred).astype(bool)
+    n = len(y_true)
+    metric_names = [m for m in (metric_names or SUPPORTED_METRICS) if m in SUPPORTED_METRICS]
+    if n == 0 or not metric_names:
+        return {}
+
+    correct = (y_pred == y_true).astype(float)
+    _, levels = np.unique(y_score, return_inverse=True)
+    n_levels = int(levels.max()) + 1
+    # Keep each index matrix around ~8M entries so memory stays bounded on large eval sets
+    chunk_size = chunk_size or max(1, min(n_resamples, 8_000_000 // n))
+    seeds = np.random.SeedSequence(seed).spawn((n_resamples + chunk_size - 1) // chunk_size)
+    sizes = [min(chunk_size, n_resamples - i * chunk_size) for i in range(len(seeds))]
+
+    arrays = (correct, y_true, levels, n_levels, tuple(metric_names))
+    if n_jobs is None or n_jobs < 1:
+        n_jobs = os.cpu_count() or 1
+    n_jobs = min(n_jobs, len(seeds))
+    start = time.perf_counter()
+    results: list[dict[str, Any]] = []
+    if n_jobs <= 1:
+        for seed_seq, size in zip(seeds, sizes):
+            results.append(_resample_chunk(seed_seq, size, arrays))
+            if time_budget_sec is not None and time.perf_counter() - start > time_budget_sec:
+                break
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Fancy indexing and bincount hold the GIL, so chunks go to processes; submit in waves for the time budget
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            for wave in range(0, len(seeds), n_jobs):
+                batch = slice(wave, wave + n_jobs)
+                results.extend(pool.map(_resample_chunk, seeds[batch], sizes[batch], [arrays] * len(sizes[batch])))
+                if time_budget_sec is not None and time.perf_counter() - start > time_budget_sec:
+                    break
+
+    point = {
+        "accuracy": float(correct.mean()),
+        "auc": float(_auc_resamples(y_true, levels, n_levels, np.arange(n)[None, :])[0]),
+    }
+    alpha = (1.0 - confidence) / 2
+    out: dict[str, dict[str, Any]] = {}
+    for name in metric_names:
+        samples = np.concatenate([r[name] for r in results])
+        samples = samples[~np.isnan(samples)]
+        if samples.size == 0 or np.isnan(point[name]):
+            continue
+        low, high = np.quantile(samples, [alpha, 1.0 - alpha])
+        out[name] = {"value": point[name], "ci_low": float(low), "ci_high": float(high), "n_resamples": int(samples.size)}
+    return out
+
+
+def metric_intervals(samples: dict[str, Any], metric_names: list[str], config: Optional[dict] = None) -> dict[str, dict]:
+    """
+    Intervals for gate metrics from per-sample eval output (y_true, y_score, optional y_pred).
+    Config eval.ci: method (bootstrap | delong), n_resamples, confidence, seed, time_budget_sec, n_jobs,
+    parallel_min_rows (below this, resampling stays in-process).
+    """
+    config = config or {}
+    ci_cfg = config.get("eval", {}).get("ci", {}) or {}
+    confidence = float(ci_cfg.get("confidence", 0.95))
+    y_true, y_score = samples.get("y_true"), samples.get("y_score")
+    if y_true is None or y_score is None:
+        return {}
+    n_jobs = ci_cfg.get("n_jobs", 1)
+    if len(y_true) < int(ci_cfg.get("parallel_min_rows", 50_000)):
+        n_jobs = 1
+    intervals = bootstrap_intervals(
+        y_true,
+        y_score,
+        y_pred=samples.get("y_pred"),
+        metric_names=metric_names,
+        n_resamples=int(ci_cfg.get("n_resamples", 1000)),
+        confidence=confidence,
+        seed=int(ci_cfg.get("seed", 42)),
+        time_budget_sec=ci_cfg.get("time_budget_sec"),
+        n_jobs=n_jobs,
+    )
+    if ci_cfg.get("method") == "delong" and "auc" in metric_names:
+        delong = delong_interval(y_true, y_score, confidence)
+        if delong:
+            intervals["auc"] = {"value": delong["auc"], "ci_low": delong["ci_low"], "ci_high": delong["ci_high"], "method": "delong"}
+    return intervals
@@ -11,13 +11,16 @@ def compute_gate_result(
     baseline_metrics: dict[str, float],
     gate_metric_names: list[str],
     config: Optional[dict] = None,
+    intervals: Optional[dict[str, dict]] = None,
 ) -> tuple[bool, dict[str, Any]]:
     """
     Determine if gates pass: for each gate metric, model should be >= baseline (or meet min delta).
+    When intervals are given (eval.gate_mode: bootstrap), the CI lower bound is compared instead of the point value.
     Returns (all_passed, details).
     """
     config = config or {}
     gate_delta_min = config.get("eval", {}).get("gate_delta_min", 0.0)
+    intervals = intervals or {}
     details = {}
     all_passed = True
     for name in gate_metric_names:
@@ -30,9 +33,22 @@ def compute_gate_result(
         if base is None:
             details[name] = {"passed": True, "reason": "no_baseline"}
             continue
-        delta = val - base
-        passed = delta >= gate_delta_min
-        details[name] = {"value": val, "baseline": base, "delta": delta, "passed": passed}
+        interval = intervals.get(name)
+        if interval is not None:
+            delta = interval["ci_low"] - base
+            passed = delta >= gate_delta_min
+            details[name] = {
+                "value": val,
+                "baseline": base,
+                "delta": delta,
+                "ci_low": interval["ci_low"],
+                "ci_high": interval["ci_high"],
+                "passed": passed,
+            }
+        else:
+            delta = val - base
+            passed = delta >= gate_delta_min
+            details[name] = {"value": val, "baseline": base, "delta": delta, "passed": passed}
         if not passed:
             all_passed = False
     return all_passed, details
@@ -1 +1,2 @@
 from .monitor import Monitor
+from .windows import WindowedStats
@@ -1,29 +1,83 @@
 """
-Observability: drift-lite checks and KPI hooks (errors, latency).
+Observability: drift-lite checks and KPI hooks (errors, latency), over the last N events and over time windows.
 """
 from __future__ import annotations
 
 from collections import deque
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, Sequence
+
+from .windows import DEFAULT_RESOLUTIONS, WindowedStats
 
 
 class Monitor:
-    """Lightweight monitor for drift-lite and KPI hooks."""
+    """
+    Lightweight monitor for drift-lite and KPI hooks. kpis() covers the last window_size events;
+    window_kpis(seconds) covers a time window (e.g. 300 for the last 5 minutes) from pre-aggregated buckets.
+    """
 
-    def __init__(self, window_size: int = 1000):
+    def __init__(
+        self,
+        window_size: int = 1000,
+        windows: Optional[Sequence[Sequence[int]]] = DEFAULT_RESOLUTIONS,
+        relative_accuracy: float = 0.01,
+    ):
         self.window_size = window_size
         self.predictions: deque = deque(maxlen=window_size)
         self.latencies: deque = deque(maxlen=window_size)
         self.errors: deque = deque(maxlen=window_size)
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.shed = 0  # requests turned away unscored to protect the latency SLO
+        self.degraded = 0  # requests answered by the heuristic fallback instead of the model
+        self.windowed = WindowedStats(windows, relative_accuracy) if windows else None
+
+    @classmethod
+    def from_config(cls, config: dict) -> "Monitor":
+        """Build from the observability section (drift_window, windows, sketch_relative_accuracy)."""
+        obs = config.get("observability", {})
+        return cls(
+            window_size=obs.get("drift_window", 1000),
+            windows=obs.get("windows", DEFAULT_RESOLUTIONS),
+            relative_accuracy=obs.get("sketch_relative_accuracy", 0.01),
+        )
 
     def record_prediction(self, value: float) -> None:
         self.predictions.append(value)
+        if self.windowed is not None:
+            self.windowed.record_prediction(value)
 
     def record_latency(self, sec: float) -> None:
         self.latencies.append(sec)
+        if self.windowed is not None:
+            self.windowed.record_latency(sec)
 
     def record_error(self, error: Any) -> None:
         self.errors.append(error)
+        if self.windowed is not None:
+            self.windowed.record_error()
+
+    def record_cache(self, hit: bool) -> None:
+        if hit:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+        if self.windowed is not None:
+            self.windowed.record_cache(hit)
+
+    def record_shed(self) -> None:
+        self.shed += 1
+
+    def record_degraded(self) -> None:
+        self.degraded += 1
+
+    def window_kpis(self, seconds: float) -> dict[str, Any]:
+        """
+        KPIs over the last `seconds`: request/error counts, error_rate, latency_mean/p50/p99 (sketch, ~1%
+        relative error), prediction_mean/std, cache_hit_rate. Cost is O(buckets), independent of QPS.
+        """
+        if self.windowed is None:
+            raise RuntimeError("Monitor was created without time windows")
+        return self.windowed.query(seconds)
 
     def drift_lite(self, reference_mean: Optional[float] = None, reference_std: Optional[float] = None) -> dict:
         """
@@ -45,8 +99,19 @@ class Monitor:
         return out
 
     def kpis(self) -> dict[str, Any]:
-        """Aggregate KPIs: error_count, latency_p50/p99, prediction_count."""
+        """
+        Aggregate KPIs: error_count, latency_p50/p99, prediction_count, cache_hit_rate (when caching),
+        shed_count / degraded_count (once admission control acted; totals since start).
+        """
         out = {"prediction_count": len(self.predictions), "error_count": len(self.errors)}
+        if self.shed or self.degraded:
+            out["shed_count"] = self.shed
+            out["degraded_count"] = self.degraded
+        lookups = self.cache_hits + self.cache_misses
+        if lookups:
+            out["cache_hits"] = self.cache_hits
+            out["cache_misses"] = self.cache_misses
+            out["cache_hit_rate"] = self.cache_hits / lookups
         if self.latencies:
             sorted_lat = sorted(self.latencies)
             n = len(sorted_lat)
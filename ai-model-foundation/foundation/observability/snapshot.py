@@ -0,0 +1,294 @@
+"""
+Persisted, mergeable monitor state. A replica periodically writes its windowed buckets (counters, sums, latency
+sketches; no raw samples) to <dir>/<name>.<replica>.monsnap in a compact binary format. Snapshots from many
+replicas merge bucket-by-bucket into one fleet view; a restarted replica restores its own file.
+"""
+from __future__ import annotations
+
+import os
+import socket
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from .windows import Bucket, WindowedStats, level_for
+
+SUFFIX = ".monsnap"
+_MAGIC = b"AMFM"
+_FORMAT_VERSION = 1
+# magic, format version, created_at, relative_accuracy, n_levels, n_counters, n_sources
+_HEADER = struct.Struct("<4sHddHHH")
+_LEVEL = struct.Struct("<dIII")  # width, retain, n_closed, n_open
+# start, requests, errors, latency_sum, predictions, prediction_sum, prediction_sq_sum, cache_hits, cache_misses, n_bins
+_BUCKET = struct.Struct("<dQQdQddQQI")
+_LEN = struct.Struct("<H")
+_U64 = struct.Struct("<Q")
+
+
+def _copy(bucket: Bucket, relative_accuracy: float) -> Bucket:
+    out = Bucket(bucket.start, bucket.width, relative_accuracy)
+    out.merge(bucket)
+    return out
+
+
+class StatsSnapshot:
+    """
+    Windowed KPI state detached from a live Monitor. Per resolution it holds closed buckets and open (not yet
+    rolled up) buckets keyed by start; merging adds buckets with equal (resolution, start, open) so a merged
+    query equals the sum of the replicas' own queries.
+    """
+
+    def __init__(
+        self,
+        resolutions: list[tuple[float, int]],
+        relative_accuracy: float,
+        counters: Optional[dict[str, int]] = None,
+        sources: Optional[list[str]] = None,
+        created_at: Optional[float] = None,
+    ):
+        self.resolutions = [(float(w), int(n)) for w, n in resolutions]
+        self.relative_accuracy = relative_accuracy
+        self.closed: list[dict[float, Bucket]] = [{} for _ in self.resolutions]
+        self.open: list[dict[float, Bucket]] = [{} for _ in self.resolutions]
+        self.counters: dict[str, int] = dict(counters or {})
+        self.sources: list[str] = list(sources or [])
+        self.created_at = time.time() if created_at is None else created_at
+
+    @classmethod
+    def from_monitor(cls, monitor: Any, source: str = "") -> "StatsSnapshot":
+        stats: WindowedStats = monitor.windowed
+        if stats is None:
+            raise RuntimeError("Monitor was created without time windows")
+        counters = {"cache_hits": monitor.cache_hits, "cache_misses": monitor.cache_misses}
+        counters.update({k: v for k, v in (("shed", monitor.shed), ("degraded", monitor.degraded)) if v})
+        snap = cls(stats.resolutions, stats.relative_accuracy, counters, [source] if source else [])
+        with stats._lock:
+            stats._current(stats.clock())  # close a stale finest bucket so rollups are current
+            for level in range(len(stats.resolutions)):
+                for b in stats._closed[level]:
+                    snap.closed[level][b.start] = _copy(b, stats.relative_accuracy)
+                if stats._open[level] is not None:
+                    b = stats._open[level]
+                    snap.open[level][b.start] = _copy(b, stats.relative_accuracy)
+        return snap
+
+    def merge(self, other: "StatsSnapshot") -> None:
+        if other.resolutions != self.resolutions or other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge snapshots with different windows or sketch accuracy")
+        for level, (_, retain) in enumerate(self.resolutions):
+            for mine, theirs in ((self.closed[level], other.closed[level]), (self.open[level], other.open[level])):
+                for start, b in theirs.items():
+                    if start in mine:
+                        mine[start].merge(b)
+                    else:
+                        mine[start] = _copy(b, self.relative_accuracy)
+            closed = self.closed[level]
+            for start in sorted(closed)[: max(len(closed) - retain, 0)]:
+                del closed[start]  # keep the newest `retain` buckets, like a live ring
+        for k, v in other.counters.items():
+            self.counters[k] = self.counters.get(k, 0) + v
+        self.sources.extend(other.sources)
+        self.created_at = max(self.created_at, other.created_at)
+
+    def query(self, seconds: float, now: Optional[float] = None) -> dict[str, Any]:
+        """KPI summary over the last `seconds`, same semantics as WindowedStats.query."""
+        now = time.time() if now is None else now
+        since = now - seconds
+        level = level_for(self.resolutions, seconds)
+        merged = Bucket(0.0, seconds, self.relative_accuracy)
+        for b in self.closed[level].values():
+            if b.end > since:
+                merged.merge(b)
+        for open_level in self.open[: level + 1]:
+            for b in open_level.values():
+                if b.end > since:
+                    merged.merge(b)
+        return {"window_sec": seconds, **merged.summary()}
+
+    def restore_into(self, monitor: Any) -> None:
+        """Load a single replica's snapshot into a fresh Monitor (e.g. after restart)."""
+        stats: WindowedStats = monitor.windowed
+        if stats is None or stats.resolutions != self.resolutions:
+            raise ValueError("Monitor windows do not match the snapshot")
+        if any(len(o) > 1 for o in self.open):
+            raise ValueError("Cannot restore a merged (multi-replica) snapshot into one Monitor")
+        with stats._lock:
+            for level in range(len(self.resolutions)):
+                for start in sorted(self.closed[level]):
+                    stats._closed[level].append(self.closed[level][start])
+                for b in self.open[level].values():
+                    if stats._open[level] is None:
+                        stats._open[level] = b
+                    else:
+                        stats._open[level].merge(b)
+        monitor.cache_hits += self.counters.get("cache_hits", 0)
+        monitor.cache_misses += self.counters.get("cache_misses", 0)
+        monitor.shed += self.counters.get("shed", 0)
+        monitor.degraded += self.counters.get("degraded", 0)
+
+    # --- binary encoding ---
+
+    def to_bytes(self) -> bytes:
+        parts = [_HEADER.pack(
+            _MAGIC, _FORMAT_VERSION, self.created_at, self.relative_accuracy,
+            len(self.resolutions), len(self.counters), len(self.sources),
+        )]
+        for name, value in self.counters.items():
+            raw = name.encode()
+            parts += [_LEN.pack(len(raw)), raw, _U64.pack(value)]
+        for source in self.sources:
+            raw = source.encode()
+            parts += [_LEN.pack(len(raw)), raw]
+        for level, (width, retain) in enumerate(self.resolutions):
+            closed, open_ = self.closed[level], self.open[level]
+            parts.append(_LEVEL.pack(width, retain, len(closed), len(open_)))
+            for buckets in (closed, open_):
+                for start in sorted(buckets):
+                    b = buckets[start]
+                    keys = sorted(b.latency.bins)
+                    parts.append(_BUCKET.pack(
+                        b.start, b.requests, b.errors, b.latency_sum, b.predictions,
+                        b.prediction_sum, b.prediction_sq_sum, b.cache_hits, b.cache_misses, len(keys),
+                    ))
+                    parts.append(struct.pack(f"<{len(keys)}i", *keys))
+                    parts.append(struct.pack(f"<{len(keys)}Q", *(b.latency.bins[k] for k in keys)))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "StatsSnapshot":
+        magic, version, created_at, accuracy, n_levels, n_counters, n_sources = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError("Not a monitor snapshot (or unsupported format version)")
+        offset = _HEADER.size
+
+        def read_str() -> str:
+            nonlocal offset
+            (n,) = _LEN.unpack_from(data, offset)
+            start = offset + _LEN.size
+            offset = start + n
+            return data[start:offset].decode()
+
+        counters = {}
+        for _ in range(n_counters):
+            name = read_str()
+            (counters[name],) = _U64.unpack_from(data, offset)
+            offset += _U64.size
+        sources = [read_str() for _ in range(n_sources)]
+        levels = []
+        for _ in range(n_levels):
+            width, retain, n_closed, n_open = _LEVEL.unpack_from(data, offset)
+            offset += _LEVEL.size
+            buckets: list[list[Bucket]] = [[], []]
+            for kind, count in ((0, n_closed), (1, n_open)):
+                for _ in range(count):
+                    fields = _BUCKET.unpack_from(data, offset)
+                    offset += _BUCKET.size
+                    n_bins = fields[-1]
+                    keys = struct.unpack_from(f"<{n_bins}i", data, offset)
+                    offset += 4 * n_bins
+                    counts = struct.unpack_from(f"<{n_bins}Q", data, offset)
+                    offset += 8 * n_bins
+                    b = Bucket(fields[0], width, accuracy)
+                    (b.requests, b.errors, b.latency_sum, b.predictions, b.prediction_sum,
+                     b.prediction_sq_sum, b.cache_hits, b.cache_misses) = fields[1:9]
+                    b.latency.bins = dict(zip(keys, counts))
+                    b.latency.count = sum(counts)
+                    buckets[kind].append(b)
+            levels.append(((width, retain), buckets))
+        snap = cls([r for r, _ in levels], accuracy, counters, sources, created_at)
+        for level, (_, (closed, open_)) in enumerate(levels):
+            snap.closed[level] = {b.start: b for b in closed}
+            snap.open[level] = {b.start: b for b in open_}
+        return snap
+
+    def write(self, path: str | Path) -> Path:
+        """Atomic write (tmp + rename), safe for readers on a shared directory."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(self.to_bytes())
+        os.replace(tmp, path)
+        return path
+
+    @classmethod
+    def read(cls, path: str | Path) -> "StatsSnapshot":
+        return cls.from_bytes(Path(path).read_bytes())
+
+
+def default_replica_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def snapshot_path(directory: str | Path, name: str, replica_id: str) -> Path:
+    return Path(directory) / f"{name}.{replica_id}{SUFFIX}"
+
+
+def merge_snapshots(sources: str | Path | Iterable[str | Path], name: Optional[str] = None) -> StatsSnapshot:
+    """
+    Merge snapshot files into one fleet view. sources: a directory (all *.monsnap, or <name>.*.monsnap when
+    name is given) or an iterable of files. Raises FileNotFoundError when nothing matches.
+    """
+    if isinstance(sources, (str, Path)) and Path(sources).is_dir():
+        pattern = f"{name}.*{SUFFIX}" if name else f"*{SUFFIX}"
+        paths = sorted(Path(sources).glob(pattern))
+    else:
+        paths = [Path(sources)] if isinstance(sources, (str, Path)) else [Path(p) for p in sources]
+    if not paths:
+        raise FileNotFoundError(f"No monitor snapshots in {sources}")
+    merged = StatsSnapshot.read(paths[0])
+    for path in paths[1:]:
+        merged.merge(StatsSnapshot.read(path))
+    return merged
+
+
+class SnapshotWriter:
+    """
+    Background thread writing a Monitor's snapshot every interval_sec (and once more on stop). With a stable
+    replica_id, start() first restores the previous snapshot so KPIs survive restarts.
+    """
+
+    def __init__(
+        self,
+        monitor: Any,
+        directory: str | Path,
+        name: str = "monitor",
+        replica_id: Optional[str] = None,
+        interval_sec: float = 60.0,
+        restore: bool = True,
+    ):
+        self.monitor = monitor
+        self.replica_id = replica_id or default_replica_id()
+        self.path = snapshot_path(directory, name, self.replica_id)
+        self.interval_sec = interval_sec
+        self.restore = restore
+        self.writes = 0
+        self.errors: list[str] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "SnapshotWriter":
+        if self.restore and self.path.exists():
+            StatsSnapshot.read(self.path).restore_into(self.monitor)
+        self._thread = threading.Thread(target=self._run, name=f"monsnap-{self.path.stem}", daemon=True)
+        self._thread.start()
+        return self
+
+    def write_now(self) -> Path:
+        path = StatsSnapshot.from_monitor(self.monitor, source=self.path.stem).write(self.path)
+        self.writes += 1
+        return path
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_sec):
+            try:
+                self.write_now()
+            except OSError as e:  # shared dir hiccup: keep serving, try again next interval
+                self.errors.append(f"{type(e).__name__}: {e}")
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.write_now()
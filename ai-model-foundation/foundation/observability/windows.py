@@ -0,0 +1,219 @@
+"""
+Time-windowed KPI aggregation: tumbling buckets (e.g. 1m / 5m / 1h) holding counts, sums and a sparse
+log-scale latency sketch. Closed buckets roll up into the next coarser resolution, each resolution keeps a
+fixed number of buckets (bounded memory), and queries merge O(buckets) summaries, never raw events.
+"""
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Iterable, Optional, Sequence
+
+# (bucket width in seconds, buckets kept): last hour by minute, last day by 5 minutes, last week by hour
+DEFAULT_RESOLUTIONS: tuple[tuple[int, int], ...] = ((60, 60), (300, 288), (3600, 168))
+
+
+def level_for(resolutions: Sequence[tuple[float, int]], seconds: float) -> int:
+    """Finest resolution whose retained span covers the window (coarsest if none does)."""
+    for level, (width, n) in enumerate(resolutions):
+        if width * n >= seconds:
+            return level
+    return len(resolutions) - 1
+
+
+class LogHistogram:
+    """
+    Sparse log-bucketed histogram (DDSketch-style): quantiles within `relative_accuracy` of the true value,
+    mergeable by adding counts. Values below min_value share one bucket, so size is bounded by the value range.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, min_value: float = 1e-6):
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.bins: dict[int, int] = {}
+        self.count = 0
+
+    def _index(self, value: float) -> int:
+        return math.ceil(math.log(max(value, self.min_value)) / self._log_gamma)
+
+    def add(self, value: float, n: int = 1) -> None:
+        i = self._index(value)
+        self.bins[i] = self.bins.get(i, 0) + n
+        self.count += n
+
+    def merge(self, other: "LogHistogram") -> None:
+        for i, n in other.bins.items():
+            self.bins[i] = self.bins.get(i, 0) + n
+        self.count += other.count
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for i in sorted(self.bins):
+            seen += self.bins[i]
+            if seen > rank:
+                # Bucket i covers (gamma^(i-1), gamma^i]; its midpoint estimate is within relative_accuracy
+                return 2 * self._gamma ** i / (self._gamma + 1)
+        return None
+
+
+class Bucket:
+    """Pre-aggregated KPIs for one time span [start, start + width)."""
+
+    __slots__ = (
+        "start", "width", "requests", "errors", "latency_sum", "latency", "predictions",
+        "prediction_sum", "prediction_sq_sum", "cache_hits", "cache_misses",
+    )
+
+    def __init__(self, start: float, width: float, relative_accuracy: float = 0.01):
+        self.start = start
+        self.width = width
+        self.requests = 0  # successful requests (one latency sample each)
+        self.errors = 0
+        self.latency_sum = 0.0
+        self.latency = LogHistogram(relative_accuracy)
+        self.predictions = 0
+        self.prediction_sum = 0.0
+        self.prediction_sq_sum = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @property
+    def end(self) -> float:
+        return self.start + self.width
+
+    def merge(self, other: "Bucket") -> None:
+        self.requests += other.requests
+        self.errors += other.errors
+        self.latency_sum += other.latency_sum
+        self.latency.merge(other.latency)
+        self.predictions += other.predictions
+        self.prediction_sum += other.prediction_sum
+        self.prediction_sq_sum += other.prediction_sq_sum
+        self.cache_hits += other.cache_hits
+        self.cache_misses += other.cache_misses
+
+    def summary(self) -> dict[str, Any]:
+        total = self.requests + self.errors
+        out: dict[str, Any] = {
+            "request_count": total,
+            "error_count": self.errors,
+            "error_rate": self.errors / total if total else 0.0,
+            "prediction_count": self.predictions,
+        }
+        if self.requests:
+            out["latency_mean"] = self.latency_sum / self.requests
+            out["latency_p50"] = self.latency.quantile(0.5)
+            out["latency_p99"] = self.latency.quantile(0.99)
+        if self.predictions:
+            mean = self.prediction_sum / self.predictions
+            out["prediction_mean"] = mean
+            out["prediction_std"] = math.sqrt(max(self.prediction_sq_sum / self.predictions - mean * mean, 0.0))
+        lookups = self.cache_hits + self.cache_misses
+        if lookups:
+            out["cache_hit_rate"] = self.cache_hits / lookups
+        return out
+
+
+class WindowedStats:
+    """
+    Multi-resolution tumbling windows. Events land in the finest open bucket; when it closes it is kept in that
+    resolution's ring and merged into the next coarser open bucket. Bucket starts are epoch-aligned, so stats
+    from different processes line up.
+    """
+
+    def __init__(
+        self,
+        resolutions: Sequence[Sequence[int]] = DEFAULT_RESOLUTIONS,
+        relative_accuracy: float = 0.01,
+        clock=time.time,
+    ):
+        self.resolutions = sorted((float(w), int(n)) for w, n in resolutions)
+        self.relative_accuracy = relative_accuracy
+        self.clock = clock
+        self._closed: list[deque] = [deque(maxlen=n) for _, n in self.resolutions]
+        self._open: list[Optional[Bucket]] = [None] * len(self.resolutions)
+        self._lock = threading.Lock()
+
+    def _bucket_for(self, level: int, t: float) -> Bucket:
+        width = self.resolutions[level][0]
+        return Bucket(math.floor(t / width) * width, width, self.relative_accuracy)
+
+    def _close(self, level: int, bucket: Bucket) -> None:
+        self._closed[level].append(bucket)
+        if level + 1 < len(self.resolutions):
+            self._roll_into(level + 1, bucket)
+
+    def _roll_into(self, level: int, bucket: Bucket) -> None:
+        current = self._open[level]
+        if current is not None and bucket.start >= current.end:
+            self._close(level, current)
+            current = None
+        if current is None:
+            current = self._open[level] = self._bucket_for(level, bucket.start)
+        current.merge(bucket)
+
+    def _current(self, now: float) -> Bucket:
+        """Open finest bucket for `now`, closing (and rolling up) the previous one if its span ended."""
+        bucket = self._open[0]
+        if bucket is not None and now >= bucket.end:
+            self._close(0, bucket)
+            bucket = None
+        if bucket is None:
+            bucket = self._open[0] = self._bucket_for(0, now)
+        return bucket
+
+    # --- recording ---
+
+    def record_latency(self, sec: float, now: Optional[float] = None) -> None:
+        with self._lock:
+            b = self._current(self.clock() if now is None else now)
+            b.requests += 1
+            b.latency_sum += sec
+            b.latency.add(sec)
+
+    def record_error(self, now: Optional[float] = None) -> None:
+        with self._lock:
+            self._current(self.clock() if now is None else now).errors += 1
+
+    def record_prediction(self, value: float, now: Optional[float] = None) -> None:
+        with self._lock:
+            b = self._current(self.clock() if now is None else now)
+            b.predictions += 1
+            b.prediction_sum += value
+            b.prediction_sq_sum += value * value
+
+    def record_cache(self, hit: bool, now: Optional[float] = None) -> None:
+        with self._lock:
+            b = self._current(self.clock() if now is None else now)
+            if hit:
+                b.cache_hits += 1
+            else:
+                b.cache_misses += 1
+
+    # --- queries ---
+
+    def buckets(self, seconds: float, now: Optional[float] = None) -> Iterable[Bucket]:
+        """Buckets overlapping the last `seconds` (rounded out to whole buckets) at the chosen resolution."""
+        now = self.clock() if now is None else now
+        since = now - seconds
+        level = level_for(self.resolutions, seconds)
+        with self._lock:
+            self._current(now)
+            selected = [b for b in self._closed[level] if b.end > since]
+            # Data not yet rolled up to this level sits in the open buckets at this level and finer ones
+            selected += [b for b in self._open[: level + 1] if b is not None and b.end > since]
+        return selected
+
+    def query(self, seconds: float, now: Optional[float] = None) -> dict[str, Any]:
+        """KPI summary over the last `seconds`, e.g. query(300)["latency_p99"] or query(3600)["error_rate"]."""
+        merged = Bucket(0.0, seconds, self.relative_accuracy)
+        for b in self.buckets(seconds, now):
+            merged.merge(b)
+        return {"window_sec": seconds, **merged.summary()}
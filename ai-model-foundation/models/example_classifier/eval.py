@@ -4,6 +4,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from foundation.core.artifacts import load_bundle
+from foundation.eval.calibration import decision_from_metadata
 
 from . import features as feat_mod
 
@@ -12,7 +13,7 @@ def run_eval(model_path: str, eval_data_path: str, config: dict, **kwargs) -> di
     import pandas as pd
     from sklearn.metrics import accuracy_score, roc_auc_score
 
-    model, metadata = load_bundle(Path(model_path))
+    model, metadata = load_bundle(Path(model_path), variant=kwargs.get("variant"))
     df = pd.read_csv(eval_data_path)
     cols = feat_mod.get_feature_columns()
     target_name = config.get("data_contract", {}).get("target", {}).get("name", "is_fraud")
@@ -23,9 +24,15 @@ def run_eval(model_path: str, eval_data_path: str, config: dict, **kwargs) -> di
 
     pred = model.predict(X)
     proba = model.predict_proba(X)[:, 1] if hasattr(model, "predict_proba") else pred
+    calibrator, threshold = decision_from_metadata(metadata)
+    if calibrator is not None or "score_threshold" in metadata:
+        # Score what predict serves: calibrated probability against the bundle's threshold
+        proba = calibrator(proba) if calibrator is not None else proba
+        pred = (proba >= threshold).astype(int)
     return {
         "metrics": {
             "accuracy": float(accuracy_score(y, pred)),
             "auc": float(roc_auc_score(y, proba)) if len(set(y)) > 1 else 0.0,
-        }
+        },
+        "samples": {"y_true": y.to_numpy(), "y_score": proba, "y_pred": pred},
     }
@@ -7,23 +7,29 @@ from typing import Any, Union
 import pandas as pd
 
 from foundation.core.artifacts import load_bundle
+from foundation.core.forest import use_compiled
+from foundation.eval.calibration import decision_from_metadata
 
 from . import features as feat_mod
 
 
 def run_predict(model_path: str, input_data: Union[str, Path, pd.DataFrame, dict], **kwargs) -> Any:
-    model, metadata = load_bundle(Path(model_path))
     if isinstance(input_data, (str, Path)):
         df = pd.read_csv(input_data)
     elif isinstance(input_data, dict):
         df = pd.DataFrame([input_data])
     else:
         df = input_data
+    compiled = use_compiled(kwargs.get("engine", "auto"), len(df), kwargs.get("compiled_max_rows"))
+    model, metadata = load_bundle(Path(model_path), prefer_compiled=compiled)
     cols = feat_mod.get_feature_columns()
     X = pd.get_dummies(df[cols], columns=["merchant_id"] if "merchant_id" in cols else [])
     feature_columns = metadata.get("feature_columns", list(X.columns))
-    X = X.reindex(columns=[c for c in feature_columns if c in X.columns], fill_value=0)
+    X = X.reindex(columns=feature_columns, fill_value=0)  # one-hot columns absent from this batch -> 0
     proba = model.predict_proba(X)[:, 1] if hasattr(model, "predict_proba") else model.predict(X)
+    calibrator, threshold = decision_from_metadata(metadata, kwargs.get("threshold"))
+    if calibrator is not None:
+        proba = calibrator(proba)
     if isinstance(input_data, dict) and len(proba) == 1:
-        return {"score": int(proba[0] >= 0.5), "probability": float(proba[0])}
-    return pd.DataFrame({"score": (proba >= 0.5).astype(int), "probability": proba})
+        return {"score": int(proba[0] >= threshold), "probability": float(proba[0])}
+    return pd.DataFrame({"score": (proba >= threshold).astype(int), "probability": proba})
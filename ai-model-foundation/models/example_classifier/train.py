@@ -4,6 +4,8 @@ from __future__ import annotations
 from pathlib import Path
 
 from foundation.core.artifacts import save_bundle
+from foundation.core.training import estimator_params, resource_usage, thread_limits, train_resources, training_metrics
+from foundation.eval.calibration import fit_decision
 
 from . import features as feat_mod
 
@@ -11,7 +13,6 @@ from . import features as feat_mod
 def run_train(config: dict, data_path: str, output_path: str, **kwargs) -> dict:
     import pandas as pd
     from sklearn.ensemble import RandomForestClassifier
-    from sklearn.metrics import accuracy_score, roc_auc_score
 
     run_id = kwargs.get("run_id", "unknown")
     df = pd.read_csv(data_path)
@@ -20,18 +21,22 @@ def run_train(config: dict, data_path: str, output_path: str, **kwargs) -> dict:
     target_name = config.get("data_contract", {}).get("target", {}).get("name", "is_fraud")
     y = df[target_name]
 
-    model = RandomForestClassifier(n_estimators=10, random_state=42)
-    model.fit(X, y)
-    pred = model.predict(X)
-    proba = model.predict_proba(X)[:, 1] if hasattr(model, "predict_proba") else pred
+    resources = train_resources(config)
+    model = RandomForestClassifier(**estimator_params(resources, n_estimators=10))
+    with resource_usage(resources) as usage, thread_limits(resources["max_threads"]):
+        model.fit(X, y)
 
-    metrics = {
-        "accuracy": float(accuracy_score(y, pred)),
-        "auc": float(roc_auc_score(y, proba)) if len(set(y)) > 1 else 0.0,
-    }
+    train_metrics, metrics_info = training_metrics(model, X, y, resources)
+    metrics = {**train_metrics, **usage}
     save_bundle(
         Path(output_path),
         model,
-        metadata={"run_id": run_id, "metrics": metrics, "feature_columns": list(X.columns)},
+        metadata={
+            "run_id": run_id,
+            "metrics": metrics,
+            "feature_columns": list(X.columns),
+            **metrics_info,
+            **fit_decision(model, X, y, config, frame=df),
+        },
     )
-    return {"run_id": run_id, "metrics": metrics}
+    return {"run_id": run_id, "metrics": metrics, "params": metrics_info}
@@ -6,6 +6,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from foundation.core.artifacts import load_bundle
+from foundation.eval.calibration import decision_from_metadata
 
 from . import features as feat_mod
 
@@ -20,10 +21,10 @@ def run_eval(
     import pandas as pd
     from sklearn.metrics import accuracy_score, roc_auc_score
 
-    model, metadata = load_bundle(model_path)
+    model, metadata = load_bundle(model_path, variant=kwargs.get("variant"))
     df = pd.read_csv(eval_data_path)
-    df = feat_mod.transform(df)
-    cols = feat_mod.get_feature_columns()
+    df = feat_mod.transform(df, metadata)  # same feature store settings as training
+    cols = feat_mod.get_feature_columns(metadata)
     target_name = config.get("data_contract", {}).get("target", {}).get("name", "is_fraud")
     X = pd.get_dummies(df[cols], columns=["merchant_id"] if "merchant_id" in cols else [])
     y = df[target_name]
@@ -32,6 +33,13 @@ def run_eval(
 
     pred = model.predict(X)
     proba = model.predict_proba(X)[:, 1] if hasattr(model, "predict_proba") else pred
+    calibrator, threshold = decision_from_metadata(metadata)
+    if calibrator is not None or "score_threshold" in metadata:
+        # Score what predict serves: calibrated probability against the bundle's threshold
+        proba = calibrator(proba) if calibrator is not None else proba
+        pred = (proba >= threshold).astype(int)
     accuracy = float(accuracy_score(y, pred))
     auc = float(roc_auc_score(y, proba)) if len(set(y)) > 1 else 0.0
-    return {"metrics": {"accuracy": accuracy, "auc": auc}}
+    # Per-sample output lets the harness compute confidence intervals (eval.gate_mode: bootstrap)
+    samples = {"y_true": y.to_numpy(), "y_score": proba, "y_pred": pred}
+    return {"metrics": {"accuracy": accuracy, "auc": auc}, "samples": samples}
@@ -3,19 +3,112 @@ Feature transforms for fraud_detector (used by train and predict).
 """
 from __future__ import annotations
 
-from typing import Any
+import threading
+from datetime import datetime
+from typing import Any, Optional, Sequence, Union
 
+import numpy as np
 import pandas as pd
 
 
-def transform(df: pd.DataFrame) -> pd.DataFrame:
-    """Prepare features from raw input. Idempotent with train and predict."""
+def transform(df: pd.DataFrame, config: Optional[dict] = None) -> pd.DataFrame:
+    """
+    Prepare features from raw input. Idempotent with train and predict. With feature_store enabled in config,
+    adds the windowed merchant aggregates: point-in-time when rows carry a timestamp (training, backfill),
+    else the entity's latest online values.
+    """
     out = df.copy()
     if "hour" not in out.columns and "timestamp" in out.columns:
         out["hour"] = pd.to_datetime(out["timestamp"], errors="coerce").dt.hour.fillna(0).astype(int)
+    store = feature_store(config)
+    if store is not None:
+        if store.timestamp in out.columns:
+            out = store.point_in_time(out)
+        else:
+            from foundation.data.feature_store import feature_names
+
+            looked_up: dict[tuple, dict] = {}  # one store read per distinct entity
+            online = []
+            for keys in out[store.keys].astype(str).itertuples(index=False, name=None):
+                if keys not in looked_up:
+                    looked_up[keys] = store.online_features(dict(zip(store.keys, keys)))
+                online.append(looked_up[keys])
+            out = out.join(pd.DataFrame(online, index=out.index, columns=feature_names(store.spec)))
     return out
 
 
-def get_feature_columns() -> list[str]:
-    """Return ordered list of feature names for model input."""
-    return ["amount", "merchant_id", "hour"]
+def get_feature_columns(config: Optional[dict] = None) -> list[str]:
+    """Return ordered list of feature names for model input (plus feature-store aggregates when enabled)."""
+    columns = ["amount", "merchant_id", "hour"]
+    spec = (config or {}).get("feature_store", {})
+    if spec.get("enabled", False):
+        from foundation.data.feature_store import feature_names
+
+        columns += feature_names(spec)
+    return columns
+
+
+_STORES: dict[str, Any] = {}
+
+
+def feature_store(config: Optional[dict]) -> Any:
+    """FeatureStore for config["feature_store"] (model.yaml or bundle metadata), opened once per spec."""
+    spec = (config or {}).get("feature_store", {})
+    if not spec.get("enabled", False):
+        return None
+    import json
+
+    from foundation.data.feature_store import FeatureStore
+
+    key = json.dumps(spec, sort_keys=True)
+    if key not in _STORES:
+        _STORES[key] = FeatureStore.from_config({"feature_store": spec})
+    return _STORES[key]
+
+
+def hour_from_timestamp(value: Any) -> int:
+    """
+    Hour of a raw timestamp (datetime or string); 0 when unparseable, like transform(). ISO strings take the
+    fast stdlib parse, anything else (e.g. "01/15/2024 13:00") goes through pd.to_datetime as in transform().
+    """
+    if hasattr(value, "hour"):
+        return int(value.hour)
+    try:
+        return datetime.fromisoformat(str(value)).hour
+    except ValueError:
+        pass
+    parsed = pd.to_datetime(value, errors="coerce")
+    return 0 if pd.isna(parsed) else int(parsed.hour)
+
+
+class RowEncoder:
+    """
+    Encode one raw row (dict, or tuple in get_feature_columns() order) into a preallocated (1, n) buffer
+    laid out like the trained columns: numeric features copied, merchant_id one-hot, unseen merchants all zero.
+    Mirrors transform() + get_dummies + reindex without pandas. The buffer is reused (one per thread): copy it to keep a row.
+    """
+
+    def __init__(self, feature_columns: Sequence[str]):
+        self.feature_columns = list(feature_columns)
+        index = {c: i for i, c in enumerate(self.feature_columns)}
+        # Every trained column that is not a merchant one-hot is copied from the row (amount, hour, store aggregates)
+        self._numeric = [(c, i) for c, i in index.items() if c != "merchant_id" and not c.startswith("merchant_id_")]
+        self._merchant_index = {c[len("merchant_id_"):]: i for c, i in index.items() if c.startswith("merchant_id_")}
+        self._local = threading.local()  # per-thread buffer: one encoder may serve concurrent workers
+
+    def encode(self, row: Union[dict, Sequence[Any]]) -> np.ndarray:
+        if not isinstance(row, dict):
+            row = dict(zip(get_feature_columns(), row))
+        if "hour" not in row and "timestamp" in row:
+            row = {**row, "hour": hour_from_timestamp(row["timestamp"])}
+        buf = getattr(self._local, "buffer", None)
+        if buf is None:
+            buf = self._local.buffer = np.zeros((1, len(self.feature_columns)), dtype=np.float64)
+        else:
+            buf.fill(0.0)
+        for name, i in self._numeric:
+            buf[0, i] = row[name]
+        j = self._merchant_index.get(str(row["merchant_id"]))
+        if j is not None:
+            buf[0, j] = 1.0
+        return buf
@@ -3,42 +3,85 @@ Prediction entrypoint for fraud_detector. Called by foundation runner / serving.
 """
 from __future__ import annotations
 
+import warnings
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Optional, Union
 
 import pandas as pd
 
 from foundation.core.artifacts import load_bundle
+from foundation.core.forest import use_compiled
+from foundation.eval.calibration import decision_from_metadata
 
 from . import features as feat_mod
 
 
+class RowScorer:
+    """
+    Low-latency single-row scoring: raw dict/tuple -> preallocated buffer -> predict_proba, no pandas.
+    The bundle's calibration (if any) maps the score to a probability before the stored threshold is applied.
+    Hold one per loaded model and call it per request; results match run_predict's DataFrame path.
+    """
+
+    def __init__(self, model: Any, metadata: dict, threshold: Optional[float] = None):
+        self.model = model
+        self.metadata = metadata
+        self.calibrator, self.threshold = decision_from_metadata(metadata, threshold)
+        self.encoder = feat_mod.RowEncoder(metadata.get("feature_columns", feat_mod.get_feature_columns(metadata)))
+        self.store = feat_mod.feature_store(metadata)  # trained with store aggregates: add them per request
+        self._has_proba = hasattr(model, "predict_proba")
+
+    def __call__(self, row: Union[dict, tuple]) -> dict:
+        if self.store is not None:
+            if not isinstance(row, dict):
+                row = dict(zip(feat_mod.get_feature_columns(), row))
+            row = {**self.store.online_features(row), **row}  # values sent with the request win
+        x = self.encoder.encode(row)
+        with warnings.catch_warnings():
+            # A NumPy buffer laid out in trained column order: sklearn's feature-name check is redundant here
+            warnings.filterwarnings("ignore", message="X does not have valid feature names", category=UserWarning)
+            p = float(self.model.predict_proba(x)[0, 1] if self._has_proba else self.model.predict(x)[0])
+        if self.calibrator is not None:
+            p = self.calibrator(p)
+        return {"score": int(p >= self.threshold), "probability": p}
+
+
+def load_scorer(model_path: str, **kwargs) -> RowScorer:
+    """Load the bundle once and return a RowScorer for repeated single-row requests."""
+    model, metadata = load_bundle(model_path, prefer_compiled=use_compiled(kwargs.get("engine", "auto")))
+    return RowScorer(model, metadata, threshold=kwargs.get("threshold"))
+
+
 def run_predict(
     model_path: str,
-    input_data: Union[str, Path, pd.DataFrame, dict],
+    input_data: Union[str, Path, pd.DataFrame, dict, tuple],
     **kwargs,
 ) -> Union[pd.DataFrame, list, dict]:
-    """Load model and run inference. input_data can be path to CSV, DataFrame, or dict row."""
-    model, metadata = load_bundle(model_path)
-    threshold = kwargs.get("threshold") or metadata.get("score_threshold", 0.5)
-    feature_columns = metadata.get("feature_columns", feat_mod.get_feature_columns())
-
+    """
+    Load model and run inference. input_data can be path to CSV, DataFrame, dict row, or contract-ordered tuple.
+    engine: "auto" (compiled forest up to compiled_max_rows rows, sklearn above), "compiled" or "sklearn".
+    """
+    if isinstance(input_data, (dict, tuple)):
+        return load_scorer(model_path, **kwargs)(input_data)
     if isinstance(input_data, (str, Path)):
         df = pd.read_csv(input_data)
-    elif isinstance(input_data, dict):
-        df = pd.DataFrame([input_data])
     else:
         df = input_data
+    compiled = use_compiled(kwargs.get("engine", "auto"), len(df), kwargs.get("compiled_max_rows"))
+    model, metadata = load_bundle(model_path, prefer_compiled=compiled)
+    calibrator, threshold = decision_from_metadata(metadata, kwargs.get("threshold"))
+    feature_columns = metadata.get("feature_columns", feat_mod.get_feature_columns(metadata))
 
-    df = feat_mod.transform(df)
-    X = pd.get_dummies(df[feat_mod.get_feature_columns()], columns=["merchant_id"] if "merchant_id" in feat_mod.get_feature_columns() else [])
+    df = feat_mod.transform(df, metadata)
+    columns = feat_mod.get_feature_columns(metadata)
+    X = pd.get_dummies(df[columns], columns=["merchant_id"] if "merchant_id" in columns else [])
     # Align columns to training (missing -> 0)
     for c in feature_columns:
         if c not in X.columns and c != "merchant_id":
             X[c] = 0
     X = X.reindex(columns=[c for c in feature_columns if c in X.columns], fill_value=0)
     proba = model.predict_proba(X)[:, 1] if hasattr(model, "predict_proba") else model.predict(X)
+    if calibrator is not None:
+        proba = calibrator(proba)
     score = (proba >= threshold).astype(int).tolist() if hasattr(proba, "__len__") else [1 if proba >= threshold else 0]
-    if len(score) == 1 and isinstance(input_data, dict):
-        return {"score": score[0], "probability": float(proba[0]) if hasattr(proba, "__len__") else float(proba)}
     return pd.DataFrame({"score": score, "probability": proba if hasattr(proba, "__len__") else [proba]})
@@ -0,0 +1,39 @@
+"""
+Shared fixtures: bundles trained on data/train.csv once per session; each caller gets its own copy to write into.
+"""
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from foundation.core.runner import run_train
+
+TRAIN_CSV = _REPO_ROOT / "data" / "train.csv"
+
+
+@pytest.fixture(scope="session")
+def train_bundle(tmp_path_factory):
+    """Factory: ``train_bundle(model_name, run_id)`` returns a fresh copy of that model's bundle (trained once, default config)."""
+    trained = {}
+
+    def train(model_name: str = "fraud_detector", run_id: str = "test") -> Path:
+        key = (model_name, run_id)
+        if key not in trained:
+            trained[key] = tmp_path_factory.mktemp(f"trained_{model_name}_{run_id}")
+            run_train(model_name, {}, str(TRAIN_CSV), str(trained[key]), run_id=run_id)
+        copy = tmp_path_factory.mktemp(model_name)
+        shutil.copytree(trained[key], copy, dirs_exist_ok=True)
+        return copy
+
+    return train
+
+
+@pytest.fixture(scope="module")
+def bundle(train_bundle):
+    """A fraud_detector bundle private to the test module (tests may export variants into it)."""
+    return train_bundle()
@@ -0,0 +1,144 @@
+"""
+Tests for latency-SLO admission control: wait estimate and decisions, heuristic fallback, and an open-loop load
+generator against ModelHost showing admitted requests meet the deadline while excess load is shed or degraded.
+"""
+import shutil
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from foundation.core.config import load_config
+from foundation.deploy.admission import ADMIT, DEGRADE, SHED, AdmissionController, HeuristicScorer
+from foundation.deploy.host import DeadlineExceeded, ModelHost
+
+pytestmark = pytest.mark.filterwarnings("ignore:X does not have valid feature names")
+
+ROW = {"amount": 600.0, "merchant_id": "m_c", "hour": 2}
+SERVICE_SEC = 0.02
+
+
+@pytest.fixture(scope="module")
+def root(tmp_path_factory, train_bundle):
+    root = tmp_path_factory.mktemp("embedded")
+    shutil.copytree(train_bundle(), root / "fraud_detector")
+    return root
+
+
+def _slow_host(root, **admission):
+    config = load_config("fraud_detector")
+    config["serving"] = {"host": {"max_concurrency": 1, "max_queue": 1000}, "admission": admission}
+    host = ModelHost(root, config=config)
+    host.predict("fraud_detector", ROW)
+    predictor = host._slots["fraud_detector"].predictor
+
+    def slow(row):
+        time.sleep(SERVICE_SEC)
+        return {"score": 1, "probability": 0.9}
+
+    predictor._active = (predictor.version, slow)
+    return host
+
+
+def _open_loop(host, n, interval, deadline_ms=None):
+    """Fire n requests at a fixed rate regardless of completions; returns (latencies of answers, outcomes)."""
+    latencies, outcomes, lock = [], {"ok": 0, "degraded": 0, "shed": 0}, threading.Lock()
+
+    def done(t0, future):
+        with lock:
+            try:
+                out = future.result()
+            except DeadlineExceeded:
+                outcomes["shed"] += 1
+                return
+            outcomes["degraded" if out.get("degraded") else "ok"] += 1
+            if not out.get("degraded"):
+                latencies.append(time.perf_counter() - t0)
+
+    futures = []
+    start = time.perf_counter()
+    for i in range(n):
+        time.sleep(max(start + i * interval - time.perf_counter(), 0))
+        t0 = time.perf_counter()
+        try:
+            future = host.submit("fraud_detector", ROW, deadline_ms=deadline_ms)
+        except DeadlineExceeded:
+            with lock:
+                outcomes["shed"] += 1
+            continue
+        future.add_done_callback(lambda f, t0=t0: done(t0, f))
+        futures.append(future)
+    for f in futures:
+        f.exception(10)
+    return sorted(latencies), outcomes
+
+
+def test_controller_estimate_and_decisions():
+    adm = AdmissionController(concurrency=2, alpha=0.5)
+    assert adm.decide(100, 0.01) == ADMIT  # no service time observed yet
+    adm.observe(0.010)
+    adm.observe(0.020)
+    assert adm.service_sec == pytest.approx(0.015)
+    assert adm.estimated_sec(3) == pytest.approx(0.030)  # 1 full round ahead on 2 workers, then own service
+    assert adm.decide(3, 0.05) == ADMIT and adm.decide(3, 0.02) == SHED and adm.decide(0, None) == ADMIT
+    rule = HeuristicScorer("amount", 250, feature_names=["amount", "merchant_id", "hour"])
+    degrading = AdmissionController(1, degrade=True, fallback=rule)
+    degrading.observe(0.010)
+    assert degrading.decide(9, 0.05) == DEGRADE
+
+
+def test_controller_recovers_after_latency_spike():
+    adm = AdmissionController(concurrency=1, alpha=0.2)
+    for _ in range(50):
+        adm.observe(0.005)
+    adm.observe(0.400)
+    assert adm.service_sec > 0.05 and adm.decide(1, 0.05) == SHED
+    # Idle model: probes are admitted and their service times pull the estimate back under the budget
+    probes = 0
+    while adm.decide(1, 0.05) != ADMIT:
+        assert adm.decide(0, 0.05) == ADMIT and probes < 50
+        adm.observe(0.005)
+        probes += 1
+    assert adm.service_sec < 0.025 and probes < 20
+    assert adm.decide(0, 0.0) == SHED  # no budget left: still refused
+
+
+def test_heuristic_rule_from_baseline():
+    config = load_config("fraud_detector")
+    scorer = HeuristicScorer.from_config(config, feature_names=["amount", "merchant_id", "hour"])
+    assert scorer(ROW) == {"score": 1, "probability": 1.0, "degraded": True}
+    assert scorer((10.0, "m_a", 4))["score"] == 0  # contract-ordered tuple row
+    assert HeuristicScorer.from_config(load_config("example_classifier")) is None
+
+
+def test_overload_sheds_and_admitted_requests_meet_deadline(root):
+    # ~4x the capacity of one 20ms worker for 0.5s
+    host = _slow_host(root)
+    unbounded, _ = _open_loop(host, 100, SERVICE_SEC / 4)
+    host.close()
+    assert unbounded[-1] > 1.0  # no deadline: the queue grows and late requests wait for everyone ahead
+
+    host = _slow_host(root, deadline_ms=100)
+    latencies, outcomes = _open_loop(host, 100, SERVICE_SEC / 4)
+    kpis = host.stats()["models"]["fraud_detector"]
+    host.close()
+    assert outcomes["shed"] > 50 and outcomes["ok"] >= 15
+    assert latencies[-1] < 0.1 + 3 * SERVICE_SEC  # dequeued before the deadline, plus one service time
+    assert kpis["shed_count"] == outcomes["shed"] and kpis["degraded_count"] == 0
+    assert kpis["service_ewma_ms"] == pytest.approx(SERVICE_SEC * 1000, rel=0.5)
+
+
+def test_degrade_mode_answers_with_heuristic(root):
+    host = _slow_host(root, deadline_ms=100, degrade=True)
+    latencies, outcomes = _open_loop(host, 100, SERVICE_SEC / 4)
+    kpis = host.stats()["models"]["fraud_detector"]
+    host.close()
+    assert outcomes["shed"] == 0 and outcomes["degraded"] > 50
+    assert kpis["degraded_count"] == outcomes["degraded"] and kpis["shed_count"] == 0
+    assert latencies[-1] < 0.1 + 3 * SERVICE_SEC
@@ -0,0 +1,99 @@
+"""
+Tests for the serving prediction cache: canonical keys, LRU/TTL eviction, invalidation on deploy, and no caching
+for bundles that read online feature-store aggregates.
+"""
+import json
+import shutil
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from foundation.core.config import load_config
+from foundation.deploy.cache import PredictionCache, prediction_key
+from foundation.deploy.predictor import Predictor
+from foundation.observability import Monitor
+
+pytestmark = pytest.mark.filterwarnings("ignore:X does not have valid feature names")
+
+FEATURES = ["amount", "merchant_id", "hour"]
+ROW = {"amount": 600.0, "merchant_id": "m_c", "hour": 2}
+
+
+def test_key_is_canonical():
+    key = prediction_key(ROW, FEATURES, "v1", ignore=["transaction_id"])
+    assert prediction_key({"hour": 2, "merchant_id": "m_c", "amount": 600}, FEATURES, "v1") == key
+    assert prediction_key((600.0, "m_c", 2), FEATURES, "v1") == key
+    assert prediction_key({**ROW, "transaction_id": "t9"}, FEATURES, "v1", ignore=["transaction_id"]) == key
+    assert prediction_key(ROW, FEATURES, "v2") != key
+    assert prediction_key({**ROW, "timestamp": "2024-01-01"}, FEATURES, "v1") != key
+
+
+def test_lru_and_ttl():
+    cache = PredictionCache(max_entries=2, ttl_sec=0.05)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # a is now most recent
+    cache.put("c", 3)
+    assert cache.get("b") is None and cache.stats["evictions"] == 1
+    time.sleep(0.06)
+    assert cache.get("a") is None and cache.stats["expired"] == 1
+
+
+def _deploy(model_dir: Path, artifact: Path, version: str) -> None:
+    for name in ("model.bin", "metadata.json"):
+        shutil.copy2(artifact / name, model_dir / name)
+    (model_dir / "deploy_meta.json").write_text(json.dumps({"model_name": "fraud_detector", "version": version}))
+
+
+def test_predictor_caches_and_invalidates_on_deploy(tmp_path, train_bundle):
+    artifact = train_bundle()
+    model_dir = tmp_path / "embedded"
+    model_dir.mkdir()
+    _deploy(model_dir, artifact, "v1")
+    config = load_config("fraud_detector")
+    config["serving"] = {"cache": {"enabled": True, "max_entries": 100, "ttl_sec": 60}}
+    monitor = Monitor()
+    predictor = Predictor("fraud_detector", model_dir, config=config, monitor=monitor)
+
+    first = predictor.predict(ROW)
+    assert predictor.predict(dict(ROW)) == first
+    assert monitor.kpis()["cache_hit_rate"] == 0.5
+
+    _deploy(model_dir, artifact, "v2")  # redeploy -> deploy_meta changes -> cache cleared
+    assert predictor.predict(ROW) == first
+    assert predictor.version == "v2"
+    assert predictor.cache.stats["invalidations"] == 2 and monitor.cache_misses == 2
+
+
+class _CountingScorer:
+    def __init__(self, metadata):
+        self.metadata = metadata
+        self.calls = 0
+
+    def __call__(self, row):
+        self.calls += 1
+        return {"score": 0, "probability": self.calls / 100}  # aggregates moved: a new score per call
+
+
+def test_cache_bypassed_for_online_feature_store_bundles(tmp_path, train_bundle):
+    artifact = train_bundle()
+    model_dir = tmp_path / "embedded"
+    model_dir.mkdir()
+    _deploy(model_dir, artifact, "v1")
+    config = load_config("fraud_detector")
+    config["serving"] = {"cache": {"enabled": True, "max_entries": 100, "ttl_sec": 60}}
+    predictor = Predictor("fraud_detector", model_dir, config=config)
+    predictor.load()
+
+    plain = _CountingScorer({"feature_store": {"enabled": False}})
+    predictor._active = ("v1", plain)
+    assert predictor.predict(ROW) == predictor.predict(ROW) and plain.calls == 1
+    online = _CountingScorer({"feature_store": {"enabled": True}})
+    predictor._active = ("v1", online)
+    assert predictor.predict(ROW) != predictor.predict(ROW) and online.calls == 2
@@ -0,0 +1,108 @@
+"""
+Tests for train-time calibration and the cost-optimal threshold: lookup parity (row vs vectorized), the sorted
+sweep against brute force, and bundles whose predict/eval apply the stored mapping and threshold.
+"""
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from foundation.core.config import load_config
+from foundation.core.runner import load_scorer, run_predict, run_train
+from foundation.eval.calibration import Calibrator, cost_threshold, fit_calibration
+
+pytestmark = pytest.mark.filterwarnings("ignore:X does not have valid feature names")
+
+TRAIN_CSV = str(_REPO_ROOT / "data" / "train.csv")
+
+
+def _skewed_scores(n=4000, seed=0):
+    """Scores that overstate the positive rate: true P(y=1 | s) = s**2."""
+    rng = np.random.default_rng(seed)
+    s = rng.uniform(size=n)
+    return s, (rng.uniform(size=n) < s**2).astype(int)
+
+
+@pytest.mark.parametrize("method", ["isotonic", "platt"])
+def test_calibration_improves_brier_and_row_lookup_matches(method):
+    s, y = _skewed_scores()
+    cal = fit_calibration(s, y, method)
+    s_test, y_test = _skewed_scores(seed=1)
+    p = cal(s_test)
+    assert np.mean((p - y_test) ** 2) < np.mean((s_test - y_test) ** 2)
+    assert (np.diff(p[np.argsort(s_test)]) >= -1e-12).all()  # monotone: ranking (AUC) preserved
+    rows = [cal(float(v)) for v in s_test[:200]]
+    assert rows == p[:200].tolist() and isinstance(rows[0], float)  # bit-identical, not just close
+    assert Calibrator(json.loads(json.dumps(cal.to_dict())))(0.3) == cal(0.3)
+    assert fit_calibration(s, np.zeros_like(y)) is None and fit_calibration(s, y, "none") is None
+
+
+@pytest.mark.parametrize("method", ["isotonic", "platt"])
+def test_row_and_batch_paths_are_bit_identical(method):
+    s, y = _skewed_scores()
+    cal = fit_calibration(s, y, method)
+    knots = np.asarray(cal.x) if method == "isotonic" else np.array([0.5])
+    probes = np.r_[np.random.default_rng(3).uniform(-0.5, 1.5, size=5000), knots, np.nextafter(knots, -1), np.nextafter(knots, 2)]
+    assert [cal(float(v)) for v in probes] == cal(probes).tolist()
+
+
+def test_cost_threshold_matches_brute_force():
+    rng = np.random.default_rng(2)
+    proba = np.round(rng.uniform(size=500), 2)  # plenty of ties
+    labels = rng.uniform(size=500) < proba
+    amount = rng.exponential(100.0, size=500)
+    out = cost_threshold(proba, labels, false_negative_cost=amount, false_positive_cost=30.0)
+
+    def cost(t):
+        flag = proba >= t
+        return amount[labels & ~flag].sum() + 30.0 * (~labels & flag).sum()
+
+    brute = min(cost(t) for t in np.r_[np.unique(proba), 2.0])
+    assert out["cost"] == pytest.approx(brute) and cost(out["threshold"]) == pytest.approx(brute)
+    flag = proba >= out["threshold"]
+    assert out["false_negatives"] == int((labels & ~flag).sum()) and out["false_positives"] == int((~labels & flag).sum())
+    assert out["cost"] <= out["cost_at_default"] == pytest.approx(cost(0.5))
+    # Expensive false alarms push the threshold up
+    assert cost_threshold(proba, labels, 1.0, 10.0)["threshold"] > cost_threshold(proba, labels, 10.0, 1.0)["threshold"]
+
+
+def test_train_stores_decision_and_predict_applies_it(tmp_path):
+    config = load_config("fraud_detector")
+    run_train("fraud_detector", config, TRAIN_CSV, str(tmp_path / "cal"), run_id="t")
+    meta = json.loads((tmp_path / "cal" / "metadata.json").read_text())
+    assert meta["calibration"]["method"] == "isotonic" and meta["decision"]["source"] == "oob"
+    assert 0.0 < meta["score_threshold"] <= 1.0 and meta["decision"]["cost"] <= meta["decision"]["cost_at_default"]
+
+    rows = pd.read_csv(TRAIN_CSV)
+    batch = run_predict("fraud_detector", str(tmp_path / "cal"), rows)
+    cal = Calibrator(meta["calibration"])
+    assert batch["probability"].between(min(cal.y), max(cal.y)).all()  # calibrated, not raw vote fractions
+    assert (batch["score"] == (batch["probability"] >= meta["score_threshold"]).astype(int)).all()
+    scorer = load_scorer("fraud_detector", str(tmp_path / "cal"))
+    for row, expected in zip(rows.to_dict("records"), batch.itertuples()):
+        out = scorer(row)
+        assert out["score"] == expected.score and out["probability"] == pytest.approx(expected.probability)
+
+    config["calibration"] = {"enabled": False}
+    config["thresholds"] = {"score_threshold": 0.3}
+    run_train("fraud_detector", config, TRAIN_CSV, str(tmp_path / "raw"), run_id="t")
+    meta = json.loads((tmp_path / "raw" / "metadata.json").read_text())
+    assert meta["score_threshold"] == 0.3 and "calibration" not in meta
+
+
+def test_example_classifier_uses_stored_threshold(tmp_path):
+    run_train("example_classifier", load_config("example_classifier"), TRAIN_CSV, str(tmp_path), run_id="t")
+    meta = json.loads((tmp_path / "metadata.json").read_text())
+    meta["score_threshold"] = 0.99
+    (tmp_path / "metadata.json").write_text(json.dumps(meta))
+    row = {"amount": 600.0, "merchant_id": "m_c", "hour": 2}
+    out = run_predict("example_classifier", str(tmp_path), row)
+    assert out["score"] == int(out["probability"] >= 0.99)
+    assert run_predict("example_classifier", str(tmp_path), row, threshold=0.01)["score"] == 1
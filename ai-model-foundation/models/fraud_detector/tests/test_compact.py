@@ -0,0 +1,154 @@
+"""
+Tests for the compact bundle variant: exact float32 thresholds, parity with the full forest, contract-bound pruning,
+tree selection within a metric tolerance, the eval delta report, and deploying/serving the compact variant alone.
+"""
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from foundation.core.artifacts import load_bundle
+from foundation.core.compact import COMPACT_FILE, compact_arrays, export_compact, round_down_f32, select_trees
+from foundation.core.config import load_config
+from foundation.core.forest import CompiledForest, compile_forest
+from foundation.core.runner import load_scorer
+from foundation.deploy import serving
+from foundation.eval.harness import run_harness
+
+pytestmark = pytest.mark.filterwarnings("ignore:X does not have valid feature names")
+
+EVAL_DATA = str(_REPO_ROOT / "data" / "eval.csv")
+
+
+def test_round_down_f32_keeps_split_decisions():
+    t = np.array([0.1, 1 / 3, 250.0, -2.7, 1e-9])
+    t32 = round_down_f32(t)
+    assert t32.dtype == np.float32 and (t32.astype(np.float64) <= t).all()
+    below = np.nextafter(t32, np.float32(np.inf))  # the next float32 up is already above t
+    assert (below.astype(np.float64) > t).all()
+
+
+def test_compact_matches_full_forest():
+    from sklearn.ensemble import RandomForestClassifier
+
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(2000, 6))
+    y = (X[:, 0] + X[:, 1] * X[:, 2] > 0).astype(int)
+    model = RandomForestClassifier(n_estimators=20, random_state=0).fit(X, y)
+    compact, stats = compact_arrays(compile_forest(model))
+    forest = CompiledForest(compact)
+    X_test = rng.normal(size=(500, 6))
+    assert np.abs(forest.predict_proba(X_test) - model.predict_proba(X_test)).max() < 1e-6
+    assert (forest.predict(X_test) == model.predict(X_test)).all()
+    assert compact["threshold"].dtype == np.float32 and compact["feature"].dtype == np.int16
+    assert stats["trees"] == stats["trees_full"] == 20 and stats["nodes"] <= stats["nodes_full"]
+
+
+def test_bounds_prune_unreachable_splits():
+    from sklearn.ensemble import RandomForestClassifier
+
+    rng = np.random.default_rng(1)
+    X = rng.uniform(-10, 10, size=(3000, 2))
+    y = ((X[:, 0] > -5) & (X[:, 1] > 0)).astype(int)
+    model = RandomForestClassifier(n_estimators=5, random_state=0, bootstrap=False).fit(X, y)
+    arrays = compile_forest(model)
+    # The serving contract only admits x0 in [0, 10]: every split on x0 below 0 is decided in advance
+    compact, stats = compact_arrays(arrays, bounds={0: (0.0, 10.0)})
+    assert stats["pruned_nodes"] > 0 and stats["nodes"] < stats["nodes_full"]
+    X_in = np.column_stack([rng.uniform(0, 10, 1000), rng.uniform(-10, 10, 1000)])
+    assert np.abs(CompiledForest(compact).predict_proba(X_in) - model.predict_proba(X_in)).max() < 1e-6
+
+
+def test_compact_routes_nan_like_sklearn():
+    from sklearn.ensemble import RandomForestClassifier
+
+    rng = np.random.default_rng(2)
+    X = rng.uniform(-10, 10, size=(3000, 3))
+    y = ((X[:, 0] > -5) & (X[:, 1] > 0)).astype(int)
+    X_nan = X.copy()
+    X_nan[rng.uniform(size=X.shape) < 0.1] = np.nan
+    X_in = np.column_stack([rng.uniform(0, 10, 1000), rng.uniform(-10, 10, (1000, 2))])
+    X_in[rng.uniform(size=X_in.shape) < 0.2] = np.nan
+    # Trained without NaN (missing rows go to the larger child) and with NaN (learned direction)
+    for X_train in (X, X_nan):
+        model = RandomForestClassifier(n_estimators=10, random_state=0, bootstrap=False).fit(X_train, y)
+        arrays = compile_forest(model)
+        for bounds in (None, {0: (0.0, 10.0)}):  # bounds pruning must not bypass a split NaN takes the other way
+            compact, _ = compact_arrays(arrays, bounds=bounds)
+            assert len(compact["missing_left"]) == len(compact["feature"])
+            assert np.abs(CompiledForest(compact).predict_proba(X_in) - model.predict_proba(X_in)).max() < 1e-6
+
+
+def test_select_trees_binary_search():
+    scores = {k: min(k, 10) / 10 for k in range(1, 51)}
+    calls = []
+    k, score = select_trees(lambda k: calls.append(k) or scores[k], 50, 1.0, 0.05)
+    assert (k, score) == (10, 1.0) and len(calls) <= 7
+
+
+def test_export_and_eval_delta(bundle):
+    config = load_config("fraud_detector")
+    info = export_compact("fraud_detector", bundle, config, EVAL_DATA, n_trees=10)
+    assert info["trees"] == 10 and info["bytes"] < info["bytes_full"]
+    assert json.loads((bundle / "compact.json").read_text())["trees"] == 10
+    model, _ = load_bundle(bundle, variant="compact")
+    assert isinstance(model, CompiledForest) and len(model.roots) == 10
+    result = run_harness("fraud_detector", str(bundle), EVAL_DATA, config)
+    assert set(result["compact"]["delta"]) <= set(result["metrics"])
+    assert result["compact"]["delta"]["auc"] == pytest.approx(result["compact"]["metrics"]["auc"] - result["metrics"]["auc"])
+
+    info = export_compact("fraud_detector", bundle, config, EVAL_DATA, max_metric_loss=0.02)
+    sel = info["selection"]
+    assert sel["metric"] == "auc" and sel["score"] >= sel["score_all_trees"] - 0.02
+    assert 1 <= info["trees"] <= info["trees_full"]
+
+
+def test_deploy_compact_variant_serves_without_model_bin(bundle, tmp_path, monkeypatch):
+    config = load_config("fraud_detector")
+    export_compact("fraud_detector", bundle, config)
+    monkeypatch.setattr(serving, "_deployments_root", lambda: tmp_path)
+    deployed = serving.deploy_to_embedded("fraud_detector", "test", str(bundle), config=config, variant="full")
+    assert deployed.name == "model.bin"
+    deployed = serving.deploy_to_embedded("fraud_detector", "test", str(bundle), config=config, variant="compact")
+    embedded = deployed.parent
+    assert deployed.name == COMPACT_FILE and not (embedded / "model.bin").exists()
+    assert json.loads((embedded / "deploy_meta.json").read_text())["variant"] == "compact"
+    row = {"amount": 600.0, "merchant_id": "m_c", "hour": 2}
+    full, compact = load_scorer("fraud_detector", str(bundle)), load_scorer("fraud_detector", str(embedded))
+    assert compact(row)["score"] == full(row)["score"]
+    assert compact(row)["probability"] == pytest.approx(full(row)["probability"], abs=1e-6)
+    missing = {"amount": None, "merchant_id": "m_a", "hour": 3}  # no model.bin to fall back to
+    assert compact(missing)["probability"] == pytest.approx(full(missing)["probability"], abs=1e-6)
+
+
+def test_running_predictor_follows_variant_and_reexport(bundle, tmp_path, monkeypatch):
+    from foundation.deploy.predictor import Predictor
+
+    config = load_config("fraud_detector")
+    config["serving"] = {"rollback": {"keep_versions": 2, "prewarm": False}}
+    monkeypatch.setattr(serving, "_deployments_root", lambda: tmp_path)
+    row = {"amount": 600.0, "merchant_id": "m_c", "hour": 2}
+
+    def trees():
+        predictor.predict(row)
+        return len(predictor._active[1].model.roots)
+
+    serving.deploy_to_embedded("fraud_detector", "test", str(bundle), config=config, variant="full")
+    predictor = Predictor("fraud_detector", tmp_path / "deployments" / "embedded" / "fraud_detector", config=config)
+    assert trees() == 10
+    export_compact("fraud_detector", bundle, config, n_trees=5)
+    serving.deploy_to_embedded("fraud_detector", "test", str(bundle), config=config, variant="compact")
+    assert trees() == 5  # same run_id, other variant
+    export_compact("fraud_detector", bundle, config, n_trees=3)
+    serving.deploy_to_embedded("fraud_detector", "test", str(bundle), config=config, variant="compact")
+    assert trees() == 3  # same run_id and variant, re-exported files
+    assert predictor.resident_versions("full") == ["test"] and predictor.resident_versions("compact") == ["test"]
+    resident_full = predictor._resident[("test", "full")]["scorer"]
+    serving.deploy_to_embedded("fraud_detector", "test", str(bundle), config=config, variant="full")
+    assert trees() == 10 and predictor._active[1] is resident_full  # warm switch back, the right variant
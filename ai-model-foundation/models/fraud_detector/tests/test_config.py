@@ -0,0 +1,88 @@
+"""
+Tests for the config service: the mtime-keyed parse cache follows YAML edits, and compiled config pickles are
+trusted only while their sources are unchanged; stale, corrupt or truncated files are rebuilt from YAML.
+"""
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from foundation.core import config as config_mod
+from foundation.core.config import compile_config, load_compiled, load_config, load_contract
+
+CONTRACT = """
+data_contract:
+  features:
+    - {name: amount, dtype: float, min_val: 0}
+"""
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """A throwaway repo root: defaults.yaml plus models/toy/model.yaml; parses are counted."""
+    (tmp_path / "models" / "toy").mkdir(parents=True)
+    defaults = tmp_path / "defaults.yaml"
+    defaults.write_text("runner:\n  log_level: INFO\n")
+    monkeypatch.setattr(config_mod, "_REPO_ROOT", tmp_path)
+    monkeypatch.setattr(config_mod, "_DEFAULTS", defaults)
+    parses = []
+    real_parse = config_mod._parse
+
+    def counting_parse(model_name):
+        parses.append(model_name)
+        return real_parse(model_name)
+
+    monkeypatch.setattr(config_mod, "_parse", counting_parse)
+    config_mod.clear_cache()
+    yield tmp_path / "models" / "toy" / "model.yaml", parses
+    config_mod.clear_cache()
+
+
+def test_yaml_edit_invalidates_parse_cache(repo):
+    model_yaml, parses = repo
+    model_yaml.write_text("train:\n  n_jobs: 2\n" + CONTRACT)
+    assert load_config("toy")["train"]["n_jobs"] == 2 and load_config("toy")["runner"]["log_level"] == "INFO"
+    assert load_contract("toy") is load_contract("toy") and parses == ["toy"]
+    model_yaml.write_text("train:\n  n_jobs: 16\n" + CONTRACT)
+    assert load_config("toy")["train"]["n_jobs"] == 16 and parses == ["toy", "toy"]
+    config_mod._DEFAULTS.write_text("runner:\n  log_level: DEBUG\n")  # either source invalidates
+    assert load_config("toy")["runner"]["log_level"] == "DEBUG" and len(parses) == 3
+
+
+def test_compiled_config_is_trusted_only_while_fresh(repo, tmp_path):
+    model_yaml, parses = repo
+    model_yaml.write_text("train:\n  n_jobs: 2\n" + CONTRACT)
+    compiled = compile_config("toy", tmp_path / "compiled" / "toy.pkl")
+    config_mod.clear_cache()  # a fresh worker process
+    assert load_compiled(compiled)["train"]["n_jobs"] == 2 and parses == ["toy"]  # no YAML parse
+    assert load_contract("toy").features[0].name == "amount"
+
+    model_yaml.write_text("train:\n  n_jobs: 8\n" + CONTRACT)
+    config_mod.clear_cache()
+    assert load_compiled(compiled)["train"]["n_jobs"] == 8 and len(parses) == 2
+    assert pickle.loads(compiled.read_bytes())["config"]["train"]["n_jobs"] == 8  # rebuilt on disk
+    config_mod.clear_cache()
+    assert load_compiled(compiled)["train"]["n_jobs"] == 8 and len(parses) == 2
+
+
+@pytest.mark.parametrize("damage", [
+    lambda data: b"not a pickle",
+    lambda data: data[: len(data) // 2],  # truncated mid-write
+    lambda data: pickle.dumps({"model_name": "toy"}),  # incomplete payload
+])
+def test_corrupt_compiled_config_is_rebuilt(repo, tmp_path, damage):
+    model_yaml, parses = repo
+    model_yaml.write_text("train:\n  n_jobs: 4\n")
+    compiled = compile_config("toy", tmp_path / "toy.pkl")
+    compiled.write_bytes(damage(compiled.read_bytes()))
+    config_mod.clear_cache()
+    with pytest.raises(ValueError, match="model_name"):
+        load_compiled(compiled)
+    assert load_compiled(compiled, "toy")["train"]["n_jobs"] == 4
+    assert pickle.loads(compiled.read_bytes())["model_name"] == "toy"
+    assert not list(tmp_path.glob(".toy.pkl.*.tmp"))
@@ -0,0 +1,87 @@
+"""
+Tests for the pipeline DAG executor: content-hash step caching (inputs, params, outputs, force), graph checks
+(cycles, unknown and duplicate steps), and failures blocking only their downstream steps.
+"""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from foundation.core.dag import Step, run_dag
+
+
+def test_unchanged_steps_are_skipped_by_content_hash(tmp_path):
+    src, out, state = tmp_path / "in.txt", tmp_path / "out.txt", tmp_path / "pipeline.json"
+    src.write_text("a")
+    calls = []
+
+    def copy() -> int:
+        calls.append(src.read_text())
+        out.write_text(src.read_text().upper())
+        return 0
+
+    def run(params=None, force=False):
+        step = Step("copy", copy, inputs=[src], outputs=[out], params=params or {"k": 1})
+        return run_dag([step], state, force=force)["steps"]["copy"]
+
+    assert run()["status"] == "ok" and calls == ["a"]
+    assert run()["status"] == "cached" and calls == ["a"]
+    src.write_text("a")  # rewritten, same content: still cached
+    assert run()["cached"] and calls == ["a"]
+    src.write_text("b")
+    assert run()["status"] == "ok" and calls == ["a", "b"]
+    out.write_text("tampered")  # outputs must still match the recorded digests
+    assert run()["status"] == "ok" and out.read_text() == "B" and len(calls) == 3
+    assert run(params={"k": 2})["status"] == "ok" and len(calls) == 4
+    assert run(params={"k": 2}, force=True)["status"] == "ok" and len(calls) == 5
+    assert json.loads(state.read_text())["steps"]["copy"]["status"] == "ok"
+
+
+@pytest.mark.parametrize("steps, message", [
+    ([Step("a", lambda: 0, deps=["c"]), Step("b", lambda: 0, deps=["a"]), Step("c", lambda: 0, deps=["b"])], "cycle"),
+    ([Step("a", lambda: 0, deps=["a"])], "cycle"),
+    ([Step("a", lambda: 0, deps=["missing"])], "unknown"),
+    ([Step("a", lambda: 0), Step("a", lambda: 0)], "Duplicate"),
+])
+def test_invalid_graphs_are_rejected_before_running(tmp_path, steps, message):
+    with pytest.raises(ValueError, match=message):
+        run_dag(steps, tmp_path / "pipeline.json")
+    assert not (tmp_path / "pipeline.json").exists()
+
+
+def test_failure_blocks_downstream_only(tmp_path):
+    ran = []
+
+    def step(name, code=0):
+        def fn() -> int:
+            ran.append(name)
+            if code == "raise":
+                raise RuntimeError("boom")
+            return code
+        return fn
+
+    steps = [
+        Step("validate", step("validate", 3)),
+        Step("train", step("train"), deps=["validate"]),
+        Step("eval", step("eval"), deps=["train"]),
+        Step("profile", step("profile")),
+        Step("report", step("report", "raise"), deps=["profile"]),
+    ]
+    result = run_dag(steps, tmp_path / "pipeline.json", max_workers=2)
+    status = {name: r["status"] for name, r in result["steps"].items()}
+    assert status == {"validate": "failed", "train": "blocked", "eval": "blocked", "profile": "ok", "report": "failed"}
+    assert sorted(ran) == ["profile", "report", "validate"]
+    assert result["exit_code"] in (3, 1)
+    assert result["steps"]["report"]["error"] == "RuntimeError: boom"
+
+    # Failed steps are never cached: the rerun retries them and skips the step that succeeded
+    ran.clear()
+    steps[0].fn = step("validate")
+    result = run_dag(steps, tmp_path / "pipeline.json")
+    assert result["steps"]["profile"]["status"] == "cached" and result["steps"]["eval"]["status"] == "ok"
+    assert sorted(ran) == ["eval", "report", "train", "validate"] and result["exit_code"] == 1
@@ -0,0 +1,79 @@
+"""
+Tests for the eval result cache: hits skip the eval entrypoint, and the key changes with the bundle inputs, eval data,
+the model's eval/feature code and the config sections that shape eval results; --force recomputes.
+"""
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from foundation.core import runner
+from foundation.core.config import load_config
+from foundation.core.registry import Registry
+from foundation.eval import harness
+from foundation.eval.cache import eval_cache_key
+
+pytestmark = pytest.mark.filterwarnings("ignore:X does not have valid feature names")
+
+EVAL_CSV = _REPO_ROOT / "data" / "eval.csv"
+
+
+def test_hit_miss_and_force(bundle, tmp_path, monkeypatch):
+    calls = []
+    real_eval = harness.run_eval
+
+    def counting_eval(**kwargs):
+        calls.append(kwargs["eval_data_path"])
+        return real_eval(**kwargs)
+
+    monkeypatch.setattr(harness, "run_eval", counting_eval)
+    registry = Registry(uri=str(tmp_path / "registry"))
+    config = load_config("fraud_detector")
+
+    def evaluate(data=EVAL_CSV, cfg=config, force=False):
+        return harness.run_harness("fraud_detector", bundle, str(data), cfg, registry=registry, force=force)
+
+    first = evaluate()
+    assert not first["cached"] and len(calls) == 1
+    second = evaluate()
+    assert second["cached"] and second["metrics"] == first["metrics"] and len(calls) == 1
+    assert not evaluate(force=True)["cached"] and len(calls) == 2
+    assert evaluate()["cached"] and len(calls) == 2
+
+    data = tmp_path / "eval.csv"
+    shutil.copy(EVAL_CSV, data)
+    assert evaluate(data)["cached"]  # same bytes, same key
+    data.write_text(EVAL_CSV.read_text() + EVAL_CSV.read_text().splitlines()[1] + "\n")
+    assert not evaluate(data)["cached"] and len(calls) == 3
+
+    changed = load_config("fraud_detector")
+    changed["compact"] = {**changed.get("compact", {}), "metric": "f1"}
+    assert not evaluate(cfg=changed)["cached"] and len(calls) == 4
+
+
+def test_key_tracks_code_and_config_sections(bundle, tmp_path, monkeypatch):
+    config = load_config("fraud_detector")
+    models = tmp_path / "models"
+    shutil.copytree(_REPO_ROOT / "models" / "fraud_detector", models / "fraud_detector", ignore=shutil.ignore_patterns("tests", "__pycache__"))
+    monkeypatch.setattr(runner, "_MODELS_ROOT", models)
+
+    def key(cfg=config):
+        return eval_cache_key("fraud_detector", bundle, EVAL_CSV, cfg)
+
+    base = key()
+    assert key() == base
+    for name in ("eval.py", "features.py"):
+        source = models / "fraud_detector" / name
+        original = source.read_text()
+        source.write_text(original + "\n# changed\n")
+        assert key() != base
+        source.write_text(original)
+        assert key() == base
+    for section, value in (("feature_store", {"enabled": True}), ("compact", {"report_in_eval": False}), ("eval", {"cache": True, "x": 1})):
+        assert key({**config, section: value}) != base
+    assert key({**config, "deploy": {"variant": "compact"}}) == base  # unrelated sections do not invalidate
@@ -0,0 +1,100 @@
+"""
+Tests for the feature store: point-in-time aggregates match brute force (no leakage), late events, online
+lookups, and fraud_detector train/predict with store features enabled.
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from foundation.core.config import load_config
+from foundation.core.runner import run_predict, run_train
+from foundation.data.feature_store import FeatureStore, feature_names
+
+pytestmark = pytest.mark.filterwarnings("ignore:X does not have valid feature names")
+
+T0 = 1_700_000_000.0
+WINDOWS = {"1h": 3600, "24h": 86400}
+
+
+def _events(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "timestamp": T0 + np.sort(rng.uniform(0, 3 * 86400, n)).round(),
+        "merchant_id": rng.choice(["m_a", "m_b", "m_c"], n),
+        "amount": rng.uniform(1, 500, n).round(2),
+    })
+
+
+def _brute(events, merchant, t, seconds):
+    mask = (events["merchant_id"] == merchant) & (events["timestamp"] < t) & (events["timestamp"] > t - seconds)
+    return mask.sum(), events.loc[mask, "amount"].sum()
+
+
+def test_point_in_time_matches_brute_force_without_leakage(tmp_path):
+    events = _events()
+    store = FeatureStore(tmp_path / "fs.sqlite", windows=WINDOWS)
+    store.ingest(events)
+    joined = store.point_in_time(events)  # each row only sees strictly earlier events
+    for i in range(0, len(events), 37):
+        row = events.iloc[i]
+        for w, seconds in WINDOWS.items():
+            count, total = _brute(events, row["merchant_id"], row["timestamp"], seconds)
+            assert joined[f"amount_count_{w}_by_merchant_id"].iloc[i] == count
+            assert joined[f"amount_sum_{w}_by_merchant_id"].iloc[i] == pytest.approx(total)
+        assert store.features_at(row.to_dict(), row["timestamp"]) == pytest.approx(
+            {c: joined[c].iloc[i] for c in feature_names(store.spec)}
+        )
+
+
+def test_late_events_and_online_lookup(tmp_path):
+    events = _events(seed=1)
+    store = FeatureStore(tmp_path / "fs.sqlite", windows=WINDOWS)
+    store.ingest(events.iloc[::2])
+    store.ingest(events.iloc[1::2])  # interleaved, mostly older than what is stored
+    probe = events.iloc[[50, 300]]
+    reference = FeatureStore(tmp_path / "ref.sqlite", windows=WINDOWS)
+    reference.ingest(events)
+    pd.testing.assert_frame_equal(store.point_in_time(probe), reference.point_in_time(probe))
+
+    now = events["timestamp"].max() + 60
+    store.materialize(as_of=now)
+    online = store.online_features({"merchant_id": "m_b"})
+    count, total = _brute(events, "m_b", now, 86400)
+    assert online["amount_count_24h_by_merchant_id"] == count
+    assert online["amount_mean_24h_by_merchant_id"] == pytest.approx(total / count)
+    assert set(store.online_features({"merchant_id": "unknown"}).values()) == {0.0}
+    with pytest.raises(ValueError):
+        FeatureStore(tmp_path / "fs.sqlite", windows={"5m": 300})  # layout mismatch
+
+
+def test_train_and_predict_with_store_features(tmp_path):
+    events = _events(n=300, seed=2)
+    events["is_fraud"] = (events["amount"] > 400).astype(int)
+    events["timestamp"] = pd.to_datetime(events["timestamp"], unit="s").dt.strftime("%Y-%m-%dT%H:%M:%S")
+    train_csv = tmp_path / "train.csv"
+    events.to_csv(train_csv, index=False)
+
+    config = load_config("fraud_detector")
+    config["feature_store"] = {**config["feature_store"], "enabled": True, "path": str(tmp_path / "fs.sqlite"), "windows": WINDOWS}
+    store = FeatureStore.from_config(config)
+    store.ingest(events)
+    store.materialize(as_of=time.time())
+
+    out = tmp_path / "artifact"
+    run_train("fraud_detector", config, str(train_csv), str(out), run_id="fs")
+    from foundation.core.artifacts import load_bundle
+
+    _, meta = load_bundle(out)
+    assert set(feature_names(config["feature_store"])) <= set(meta["feature_columns"])
+    row = {"amount": 450.0, "merchant_id": "m_a", "hour": 3}
+    single = run_predict("fraud_detector", str(out), row)
+    batch = run_predict("fraud_detector", str(out), pd.DataFrame([row]))  # no timestamp -> online values
+    assert single["probability"] == pytest.approx(batch["probability"].iloc[0])
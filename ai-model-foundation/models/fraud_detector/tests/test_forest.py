@@ -0,0 +1,109 @@
+"""
+Tests for compiled forest inference: probabilities must match sklearn exactly, including after save/load, on
+large batches and on inputs with NaN; engine="auto" routes large batches to sklearn.
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from foundation.core.artifacts import load_bundle
+from foundation.core.forest import COMPILED_FILE, COMPILED_MAX_ROWS, CompiledForest, use_compiled
+from models.fraud_detector.features import transform
+from models.fraud_detector import predict as predict_mod
+from models.fraud_detector.predict import run_predict
+
+pytestmark = pytest.mark.filterwarnings("ignore:X does not have valid feature names")
+
+
+def test_bundle_contains_compiled_forest(bundle):
+    assert (bundle / COMPILED_FILE).exists()
+    model, _ = load_bundle(bundle, prefer_compiled=True)
+    assert isinstance(model, CompiledForest)
+
+
+def test_fraud_model_parity(bundle):
+    model, metadata = load_bundle(bundle)
+    compiled, _ = load_bundle(bundle, prefer_compiled=True)
+    df = transform(pd.read_csv(_REPO_ROOT / "data" / "eval.csv"))
+    X = pd.get_dummies(df[["amount", "merchant_id", "hour"]], columns=["merchant_id"])
+    X = X.reindex(columns=metadata["feature_columns"], fill_value=0)
+    assert np.array_equal(model.predict_proba(X), compiled.predict_proba(X))
+    assert np.array_equal(model.predict(X), compiled.predict(X))
+
+
+def test_predict_engines_agree(bundle):
+    df = pd.read_csv(_REPO_ROOT / "data" / "eval.csv")
+    pd.testing.assert_frame_equal(run_predict(str(bundle), df), run_predict(str(bundle), df, engine="sklearn"))
+
+
+def test_deep_forest_parity_and_roundtrip(tmp_path):
+    from sklearn.ensemble import RandomForestClassifier
+
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(2000, 8))
+    y = rng.integers(0, 3, size=2000)  # noise labels -> deep, unbalanced trees
+    model = RandomForestClassifier(n_estimators=25, random_state=0).fit(X, y)
+    compiled = CompiledForest.from_model(model)
+    X_test = rng.normal(size=(500, 8))
+    assert np.array_equal(model.predict_proba(X_test), compiled.predict_proba(X_test))
+    loaded = CompiledForest.load(compiled.save(tmp_path / COMPILED_FILE))
+    assert np.array_equal(model.predict_proba(X_test), loaded.predict_proba(X_test))
+    assert np.array_equal(model.predict(X_test), loaded.predict(X_test))
+
+
+def test_non_forest_not_compiled():
+    from sklearn.linear_model import LogisticRegression
+
+    model = LogisticRegression().fit(np.array([[0.0], [1.0]]), [0, 1])
+    assert CompiledForest.from_model(model) is None
+
+
+def test_large_batch_parity_and_engine_cutoff(bundle, monkeypatch):
+    df = pd.read_csv(_REPO_ROOT / "data" / "eval.csv")
+    big = pd.concat([df] * (COMPILED_MAX_ROWS // len(df) + 2), ignore_index=True)
+    assert len(big) > COMPILED_MAX_ROWS
+    assert use_compiled("auto", 1) and not use_compiled("auto", len(big)) and use_compiled("compiled", len(big))
+    assert not use_compiled("sklearn", 1) and use_compiled("auto", len(df), max_rows=len(df))
+    with pytest.raises(ValueError):
+        use_compiled("fast")
+
+    loaded = []
+
+    def spy(*args, **kwargs):
+        model, metadata = load_bundle(*args, **kwargs)
+        loaded.append(type(model).__name__)
+        return model, metadata
+
+    monkeypatch.setattr(predict_mod, "load_bundle", spy)
+    auto = run_predict(str(bundle), big)
+    small = run_predict(str(bundle), big, compiled_max_rows=len(big))
+    assert loaded == ["RandomForestClassifier", "CompiledForest"]
+    pd.testing.assert_frame_equal(auto, small)
+    pd.testing.assert_frame_equal(auto, run_predict(str(bundle), big, engine="sklearn"))
+
+
+def test_nan_inputs_follow_sklearn_routing(tmp_path):
+    from sklearn.ensemble import RandomForestClassifier
+
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(2000, 5))
+    y = (X[:, 0] + X[:, 1] > 0).astype(int)
+    X_test = rng.normal(size=(500, 5))
+    X_test[rng.uniform(size=X_test.shape) < 0.2] = np.nan
+    X_nan = X.copy()
+    X_nan[rng.uniform(size=X.shape) < 0.1] = np.nan
+    # Trained without NaN (missing rows go to the larger child) and with NaN (learned direction)
+    for X_train in (X, X_nan):
+        model = RandomForestClassifier(n_estimators=15, random_state=0).fit(X_train, y)
+        compiled = CompiledForest.load(CompiledForest.from_model(model).save(tmp_path / COMPILED_FILE))
+        assert np.array_equal(model.predict_proba(X_test), compiled.predict_proba(X_test))
+    legacy = CompiledForest({k: v for k, v in compiled.arrays.items() if k != "missing_left"})
+    with pytest.raises(ValueError, match="missing-value"):
+        legacy.predict_proba(X_test)
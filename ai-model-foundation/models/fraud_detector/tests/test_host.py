@@ -0,0 +1,106 @@
+"""
+Tests for the multi-model host: lazy loading, per-model queue isolation, LRU eviction under a memory budget
+that counts every loaded bundle (resident rollback versions included) and follows hot reloads.
+"""
+import shutil
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from foundation.core.config import load_config
+from foundation.deploy.host import HostOverloaded, ModelHost
+
+pytestmark = pytest.mark.filterwarnings("ignore:X does not have valid feature names")
+
+ROW = {"amount": 600.0, "merchant_id": "m_c", "hour": 2}
+MODELS = ("fraud_detector", "example_classifier")
+
+
+@pytest.fixture(scope="module")
+def root(tmp_path_factory, train_bundle):
+    root = tmp_path_factory.mktemp("embedded")
+    for name in MODELS:
+        shutil.copytree(train_bundle(name), root / name)
+    return root
+
+
+def _host(root, **host_cfg):
+    config = load_config()
+    config["serving"] = {"host": {"max_concurrency": 1, "max_queue": 1, **host_cfg}}
+    return ModelHost(root, config=config)
+
+
+def test_lazy_load_and_per_model_stats(root):
+    host = _host(root)
+    assert host.available_models() == sorted(MODELS)
+    assert host.loaded_models() == []
+    assert host.predict("fraud_detector", ROW)["score"] in (0, 1)
+    assert host.loaded_models() == ["fraud_detector"]
+    assert host.predict("example_classifier", ROW)["score"] in (0, 1)
+    stats = host.stats()["models"]
+    assert stats["fraud_detector"]["prediction_count"] == 1 and "latency_p50" in stats["fraud_detector"]
+    host.close()
+
+
+def test_slow_model_does_not_starve_others(root):
+    host = _host(root)
+    host.predict("fraud_detector", ROW)
+    release = threading.Event()
+    predictor = host._slots["fraud_detector"].predictor
+    predictor._active = (predictor.version, lambda row: release.wait(5) and {"score": 0})
+    running = host.submit("fraud_detector", ROW)
+    queued = host.submit("fraud_detector", ROW)
+    with pytest.raises(HostOverloaded):
+        host.submit("fraud_detector", ROW)  # 1 running + 1 queued is the limit
+    assert host.predict("example_classifier", ROW, timeout=5)["score"] in (0, 1)
+    release.set()
+    assert running.result(5) == queued.result(5) == {"score": 0}
+    assert host.stats()["models"]["fraud_detector"]["rejected"] == 1
+    host.close()
+
+
+def test_idle_model_evicted_over_budget(root):
+    host = _host(root, memory_budget_mb=1e-6)  # any two models exceed the budget
+    host.predict("fraud_detector", ROW)
+    host.predict("example_classifier", ROW)
+    assert host.loaded_models() == ["example_classifier"]
+    assert host.evictions == 1
+    host.predict("fraud_detector", ROW)  # reloads on demand
+    assert host.stats()["models"]["fraud_detector"]["loads"] == 2
+    host.close()
+
+
+def test_budget_counts_resident_versions_after_hot_reload(root, tmp_path, monkeypatch):
+    from foundation.deploy import serving
+
+    monkeypatch.setattr(serving, "_deployments_root", lambda: tmp_path)
+    config = load_config()
+    for name in MODELS:
+        serving.deploy_to_embedded(name, "v1", str(root / name), config=config)
+    embedded = tmp_path / "deployments" / "embedded"
+    bundle = {name: sum(p.stat().st_size for p in (embedded / name).iterdir() if p.name != "deploy_meta.json") for name in MODELS}
+    # Both models fit once; the fraud model with one resident rollback version does not
+    budget_mb = (sum(bundle.values()) + 4096) / 1024 / 1024
+    host = _host(embedded, memory_budget_mb=budget_mb)
+    host.config["serving"]["rollback"] = {"keep_versions": 1, "prewarm": False}
+    host.predict("example_classifier", ROW)
+    host.predict("fraud_detector", ROW)
+    assert host.loaded_models() == ["example_classifier", "fraud_detector"] and host.evictions == 0
+    single = host.stats()["models"]["fraud_detector"]["resident_bytes"]
+    assert single == host._slots["fraud_detector"].predictor.footprint_bytes() > 0
+
+    serving.deploy_to_embedded("fraud_detector", "v2", str(root / "fraud_detector"), config=config)
+    host.predict("fraud_detector", ROW)  # hot reload: v1 stays resident for rollback
+    predictor = host._slots["fraud_detector"].predictor
+    assert predictor.version == "v2" and predictor.resident_versions() == ["v1"]
+    stats = host.stats()
+    assert stats["models"]["fraud_detector"]["resident_bytes"] == predictor.footprint_bytes() == 2 * single
+    assert host.loaded_models() == ["fraud_detector"] and host.evictions == 1
+    assert stats["resident_bytes"] == 2 * single
+    host.close()
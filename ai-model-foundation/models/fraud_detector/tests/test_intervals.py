@@ -0,0 +1,70 @@
+"""
+Tests for eval confidence intervals: DeLong against the pairwise variance definition, bootstrap reproducibility
+per seed, serial and process-pool resampling agreeing exactly, and bootstrap gates deciding on the CI lower bound.
+"""
+import sys
+from pathlib import Path
+from statistics import NormalDist
+
+import numpy as np
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from foundation.eval.intervals import bootstrap_intervals, delong_interval, metric_intervals
+from foundation.eval.metrics import compute_gate_result
+
+
+def _scores(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    y = rng.uniform(size=n) < 0.3
+    score = np.round(np.clip(0.3 * y + rng.normal(0.4, 0.2, size=n), 0, 1), 2)  # rounded: ties across classes
+    return y, score
+
+
+def test_delong_matches_pairwise_variance():
+    y, score = _scores()
+    pos, neg = score[y], score[~y]
+    # psi[i, j] = P(positive i ranks above negative j), ties 1/2 (DeLong et al. 1988)
+    psi = (pos[:, None] > neg[None, :]) + 0.5 * (pos[:, None] == neg[None, :])
+    auc = psi.mean()
+    var = psi.mean(axis=1).var(ddof=1) / len(pos) + psi.mean(axis=0).var(ddof=1) / len(neg)
+    z = NormalDist().inv_cdf(0.975)
+    out = delong_interval(y, score)
+    assert out["auc"] == pytest.approx(auc)
+    assert out["ci_low"] == pytest.approx(auc - z * np.sqrt(var))
+    assert out["ci_high"] == pytest.approx(auc + z * np.sqrt(var))
+    assert delong_interval([1, 0, 0], [0.9, 0.1, 0.2]) == {}  # fewer than two of a class
+
+
+def test_bootstrap_is_deterministic_per_seed():
+    y, score = _scores()
+    first = bootstrap_intervals(y, score, n_resamples=300, seed=7)
+    assert first == bootstrap_intervals(y, score, n_resamples=300, seed=7)
+    assert first != bootstrap_intervals(y, score, n_resamples=300, seed=8)
+    assert set(first) == {"accuracy", "auc"} and first["auc"]["n_resamples"] == 300
+    assert first["auc"]["ci_low"] < first["auc"]["value"] < first["auc"]["ci_high"]
+
+
+def test_parallel_and_serial_resampling_agree():
+    y, score = _scores()
+    serial = bootstrap_intervals(y, score, n_resamples=200, seed=3, chunk_size=25)
+    assert serial == bootstrap_intervals(y, score, n_resamples=200, seed=3, chunk_size=25, n_jobs=2)
+
+
+def test_bootstrap_gate_uses_lower_bound():
+    y, score = _scores(n=120, seed=1)
+    config = {"eval": {"gate_mode": "bootstrap", "ci": {"n_resamples": 400, "seed": 0}}}
+    intervals = metric_intervals({"y_true": y, "y_score": score}, ["auc"], config)
+    value, low = intervals["auc"]["value"], intervals["auc"]["ci_low"]
+    baseline = {"auc": (value + low) / 2}  # beaten by the point estimate, not by the lower bound
+    passed, _ = compute_gate_result({"auc": value}, baseline, ["auc"], config)
+    assert passed
+    passed, details = compute_gate_result({"auc": value}, baseline, ["auc"], config, intervals=intervals)
+    assert not passed and details["auc"]["ci_low"] == low and details["auc"]["delta"] == pytest.approx(low - baseline["auc"])
+
+    config["eval"]["ci"]["method"] = "delong"
+    delong = metric_intervals({"y_true": y, "y_score": score}, ["auc"], config)["auc"]
+    assert delong["method"] == "delong" and delong["ci_low"] == delong_interval(y, score)["ci_low"]
@@ -0,0 +1,44 @@
+"""
+Tests for run-all job orchestration: prefixed streaming, dependency blocking, exit-code aggregation.
+"""
+import asyncio
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from foundation.cli import EVAL_GATE_FAIL_EXIT_CODE
+from foundation.core.jobs import _run_all, aggregate_exit_code, run_models
+
+
+def test_validate_all_models_streams_prefixed_output():
+    out = io.StringIO()
+    result = run_models(steps=("validate",), jobs=2, out=out, cwd=_REPO_ROOT)
+    assert result["exit_code"] == 0
+    assert {"fraud_detector", "example_classifier"} <= set(result["models"])
+    assert "_template_model" not in result["models"]
+    assert "[fraud_detector:validate] Validation passed." in out.getvalue().splitlines()
+
+
+def test_failed_dependency_blocks_dependents():
+    out = io.StringIO()
+    models = {"missing_model": {}, "fraud_detector": {"depends_on": ["missing_model"]}}
+    results = asyncio.run(_run_all(models, ("validate",), 2, "t", out, _REPO_ROOT))
+    assert results["missing_model"]["status"] == "failed"
+    assert results["fraud_detector"]["status"] == "blocked"
+    assert results["fraud_detector"]["steps"] == {}
+    assert aggregate_exit_code(results) == 1
+
+
+@pytest.mark.parametrize("statuses,code", [
+    (["ok", "ok"], 0),
+    (["ok", "gate_failed", "blocked"], EVAL_GATE_FAIL_EXIT_CODE),
+    (["gate_failed", "failed"], 1),
+])
+def test_exit_code_aggregation(statuses, code):
+    assert aggregate_exit_code({str(i): {"status": s} for i, s in enumerate(statuses)}) == code
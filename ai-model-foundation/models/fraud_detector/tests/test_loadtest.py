@@ -0,0 +1,135 @@
+"""
+Tests for the load generator: coordinated-omission correction (open loop and paced closed loop), contract rows,
+the HTTP target against a local server, baseline gates, and --save-baseline re-baselining without gating.
+"""
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from foundation.core.config import load_contract
+from foundation.data.validate import validate_row
+from foundation.deploy.loadtest import (
+    LatencyRecorder,
+    compare_to_baseline,
+    http_target,
+    in_process_target,
+    load_rows,
+    run_loadtest,
+    synthetic_rows,
+)
+
+pytestmark = pytest.mark.filterwarnings("ignore:X does not have valid feature names")
+
+
+def _stalls_once(stall_sec, service_sec=0.001):
+    calls = {"n": 0}
+
+    def call(row):
+        calls["n"] += 1
+        time.sleep(stall_sec if calls["n"] == 1 else service_sec)
+        return {"score": 0}
+
+    return call
+
+
+def test_recorder_backfills_missed_intervals():
+    rec = LatencyRecorder()
+    rec.record(0.105, expected_interval=0.01)  # one 105ms stall of a client due every 10ms
+    assert rec.count == 10 and rec.max == pytest.approx(0.105)
+    assert rec.summary_ms()["p50"] == pytest.approx(50, rel=0.2)
+
+
+def test_open_loop_counts_queueing_behind_a_stall():
+    result = run_loadtest(_stalls_once(0.5), [{"x": 1}], mode="open", rps=100, duration_sec=1.0, warmup_requests=0, max_in_flight=1)
+    assert result["requests"] == 100 and result["errors"] == 0
+    # Requests due during the stall waited for it; measured from send time they look instant
+    assert result["latency_ms"]["p90"] > 200
+    assert result["service_ms"]["p90"] < 20
+
+
+def test_paced_closed_loop_backfills_stall():
+    result = run_loadtest(_stalls_once(0.3), [{"x": 1}], mode="closed", rps=50, concurrency=1, duration_sec=1.0, warmup_requests=0)
+    assert result["latency_ms"]["count"] > result["service_ms"]["count"] + 10  # ~15 sends skipped during the stall
+    assert result["latency_ms"]["p90"] > 50 > result["service_ms"]["p90"]
+
+
+def test_synthetic_and_csv_rows_conform_to_contract():
+    contract = load_contract("fraud_detector")
+    rows = synthetic_rows(contract, n=200)
+    assert len(rows) == 200 and len({r["transaction_id"] for r in rows}) == 200
+    assert all(validate_row({**r, "is_fraud": 0}, contract) == [] for r in rows)
+    csv_rows = load_rows(_REPO_ROOT / "data" / "eval.csv", contract)
+    assert csv_rows and set(csv_rows[0]) == {"amount", "merchant_id", "hour", "transaction_id"}
+
+
+def test_http_target_against_local_server(train_bundle):
+    artifact = train_bundle()
+    scorer = in_process_target("fraud_detector", artifact)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            row = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            body = json.dumps(scorer(row)).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        rows = load_rows("synthetic", load_contract("fraud_detector"), n=50)
+        call = http_target(f"http://127.0.0.1:{server.server_port}/predict")
+        assert call(rows[0]) == scorer(rows[0])
+        result = run_loadtest(call, rows, mode="closed", concurrency=2, duration_sec=0.5, warmup_requests=5)
+    finally:
+        server.shutdown()
+    assert result["errors"] == 0 and result["throughput_rps"] > 0
+    assert sum(b["count"] for b in result["histogram_ms"]) == result["latency_ms"]["count"]
+
+
+def test_baseline_gates():
+    base = run_loadtest(lambda row: time.sleep(0.002), [{"x": 1}], mode="closed", concurrency=2, duration_sec=0.3)
+    passed, details = compare_to_baseline(base, None)
+    assert passed and details["baseline"]["reason"] == "no_baseline"
+    slower = run_loadtest(lambda row: time.sleep(0.01), [{"x": 1}], mode="closed", concurrency=2, duration_sec=0.3)
+    passed, details = compare_to_baseline(slower, base)
+    assert not passed and not details["latency_p99_ms"]["passed"] and not details["throughput_rps"]["passed"]
+    assert compare_to_baseline(base, base)[0]
+    with pytest.raises(ValueError):
+        compare_to_baseline({**base, "mode": "open", "rps": 100}, base)
+
+
+def test_save_baseline_skips_comparison(tmp_path, monkeypatch):
+    import argparse
+
+    from foundation import cli
+    from foundation.deploy import loadtest as lt
+
+    (tmp_path / "deployments" / "embedded" / "fraud_detector").mkdir(parents=True)
+    monkeypatch.setattr(cli, "_REPO_ROOT", tmp_path)
+    monkeypatch.setattr(lt, "in_process_target", lambda model_name, model_path: lambda row: {"score": 0})
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"mode": "open", "rps": 50, "concurrency": None, "latency_ms": {}}))
+    args = argparse.Namespace(
+        model="fraud_detector", run_id=None, url=None, data="synthetic", mode="closed", rps=None, concurrency=2,
+        duration=0.2, baseline=str(baseline), save_baseline=False, out=str(tmp_path / "out.json"),
+    )
+    assert cli.cmd_loadtest(args) == 1  # closed loop vs an open-loop baseline: not comparable
+    args.save_baseline = True
+    assert cli.cmd_loadtest(args) == 0
+    saved = json.loads(baseline.read_text())
+    assert saved["mode"] == "closed" and saved["concurrency"] == 2
+    assert json.loads((tmp_path / "out.json").read_text())["gate_passed"] is None
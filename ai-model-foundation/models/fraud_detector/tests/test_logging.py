@@ -0,0 +1,83 @@
+"""
+Tests for structured logging: async batched output matches sync, sampling and drop counters, and the CLI and
+serving host applying runner.log_level and the logging: section at startup.
+"""
+import io
+import json
+import logging
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from foundation.core import logging as flog
+
+
+@pytest.fixture(autouse=True)
+def restore_root_logger():
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield
+    flog.shutdown_logging()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def _emit(**configure) -> list[dict]:
+    out = io.StringIO()
+    flog.configure_logging(stream=out, **configure)
+    for i in range(500):
+        flog.log_structured(logging.INFO, "prediction", event="prediction", score=i % 2, path=Path("x"))
+    flog.log_structured(logging.WARNING, "deploy", version="v1")
+    flog.shutdown_logging()
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_async_output_matches_sync():
+    sync = _emit()
+    assert len(sync) == 501 and sync[-1] == {"message": "deploy", "version": "v1"}
+    async_lines = _emit(async_mode=True, batch_size=64)
+    assert [{**r, "path": "x"} for r in sync] == [{**r, "path": "x"} for r in async_lines]
+
+
+def test_sampling_per_event_and_drops():
+    before = flog.logging_stats()
+    lines = _emit(async_mode=True, sample_rates={"prediction": 0.0})
+    assert lines == [{"message": "deploy", "version": "v1"}]  # other events unaffected
+    assert flog.logging_stats()["sampled_out"] - before["sampled_out"] == 500
+
+    release = threading.Event()
+
+    class BlockedStream(io.StringIO):
+        def write(self, text):
+            release.wait(5)  # stdout stalled
+            return super().write(text)
+
+    flog.configure_logging(stream=BlockedStream(), async_mode=True, queue_size=1, flush_interval_sec=0.01)
+    before = flog.logging_stats()
+    for _ in range(10):
+        flog.log_structured(logging.INFO, "prediction")
+    dropped = flog.logging_stats()["dropped"] - before["dropped"]
+    release.set()
+    assert 8 <= dropped <= 9  # never blocks the caller: 1 queued (+1 being written), the rest dropped
+
+
+def test_cli_and_host_apply_logging_config(tmp_path, monkeypatch):
+    from foundation import cli
+    from foundation.deploy.host import ModelHost
+
+    config = {"runner": {"log_level": "ERROR"}, "logging": {"structured": False}}
+    monkeypatch.setattr(cli, "_load_config", lambda model_name: config)
+    monkeypatch.setattr(sys, "argv", ["foundation", "validate", "--model", "fraud_detector", "--data", str(_REPO_ROOT / "data" / "eval.csv")])
+    assert cli.main() == 0
+    root = logging.getLogger()
+    assert root.level == logging.ERROR and flog._LISTENER is None
+    assert root.handlers[-1].formatter._fmt == "%(levelname)s %(name)s %(message)s"
+
+    ModelHost(tmp_path, config={"runner": {"log_level": "DEBUG"}, "logging": {"async": True, "sample_rates": {"prediction": 0.5}}})
+    assert root.level == logging.DEBUG and flog._LISTENER is not None and flog._SAMPLE_RATES == {"prediction": 0.5}
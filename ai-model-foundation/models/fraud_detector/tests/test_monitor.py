@@ -0,0 +1,68 @@
+"""
+Tests for time-windowed Monitor KPIs: bucket rollups, window queries, sketch accuracy, bounded memory.
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from foundation.observability import Monitor
+from foundation.observability.windows import LogHistogram, WindowedStats
+
+T0 = 1_700_000_000.0  # epoch-aligned to the hour
+
+
+def _fill(stats: WindowedStats, seconds: int, error_every: int = 10) -> None:
+    for i in range(seconds):
+        now = T0 + i
+        if i % error_every == 0:
+            stats.record_error(now=now)
+        else:
+            stats.record_latency(0.001 * (1 + i % 100), now=now)
+
+
+def test_windows_roll_up_without_losing_events():
+    stats = WindowedStats()
+    _fill(stats, 3 * 3600)
+    now = T0 + 3 * 3600 - 1
+    total = stats.query(7 * 24 * 3600, now=now)
+    assert total["request_count"] == 3 * 3600
+    assert abs(total["error_rate"] - 0.1) < 1e-9
+    last_5m = stats.query(300, now=now)
+    assert 300 <= last_5m["request_count"] <= 360  # rounded out to whole 1m buckets
+    last_hour = stats.query(3600, now=now)
+    assert 3600 <= last_hour["request_count"] <= 3660
+    assert len(stats._closed[0]) == 60  # finest ring is bounded
+
+
+def test_latency_quantiles_within_sketch_accuracy():
+    rng = np.random.default_rng(0)
+    values = rng.lognormal(mean=-5, sigma=1, size=20000)
+    hist = LogHistogram(relative_accuracy=0.01)
+    for v in values:
+        hist.add(v)
+    for q in (0.5, 0.9, 0.99):
+        exact = np.quantile(values, q, method="lower")
+        assert abs(hist.quantile(q) - exact) / exact < 0.03
+    assert len(hist.bins) < 1000
+
+
+def test_monitor_window_kpis():
+    clock = [T0]
+    monitor = Monitor()
+    monitor.windowed.clock = lambda: clock[0]
+    for i in range(120):
+        clock[0] = T0 + i
+        monitor.record_latency(0.01)
+        monitor.record_prediction(0.25)
+        monitor.record_cache(i % 4 == 0)
+    monitor.record_error(RuntimeError("boom"))
+    kpis = monitor.window_kpis(60)
+    assert kpis["error_count"] == 1
+    assert abs(kpis["latency_p99"] - 0.01) / 0.01 < 0.02
+    assert kpis["prediction_mean"] == 0.25
+    assert monitor.window_kpis(3600)["cache_hit_rate"] == 0.25
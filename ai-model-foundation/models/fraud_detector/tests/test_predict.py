@@ -0,0 +1,63 @@
+"""
+Tests for fraud_detector predict: the pandas-free row path must match the DataFrame path exactly, including
+timestamps that are not ISO formatted.
+"""
+import sys
+import warnings
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from models.fraud_detector.features import hour_from_timestamp, transform
+from models.fraud_detector.predict import load_scorer, run_predict
+
+ROWS = [
+    {"amount": 11.0, "merchant_id": "m_a", "hour": 15},
+    {"amount": 600.0, "merchant_id": "m_c", "hour": 2},
+    {"amount": 200.0, "merchant_id": "m_b", "hour": 0},
+    {"amount": 75.5, "merchant_id": "m_unseen", "hour": 12},  # unseen merchant -> all one-hot columns 0
+    {"amount": 320.0, "merchant_id": "m_c", "timestamp": "2024-01-01 03:30:00"},  # hour derived from timestamp
+    {"amount": 9.0, "merchant_id": "m_a", "timestamp": "not a timestamp"},  # unparseable -> hour 0
+    {"amount": 450.0, "merchant_id": "m_c", "timestamp": "01/15/2024 13:00"},  # non-ISO -> pandas parse
+    {"amount": 600.0, "merchant_id": "m_c", "timestamp": "Jan 15 2024 2:05AM"},
+]
+
+
+@pytest.mark.parametrize("row", ROWS)
+def test_row_path_matches_dataframe_path(bundle, row):
+    frame = run_predict(bundle, pd.DataFrame([row]))
+    expected = {"score": int(frame["score"][0]), "probability": float(frame["probability"][0])}
+    assert run_predict(bundle, row) == expected
+    assert load_scorer(bundle)(row) == expected
+
+
+def test_tuple_input_in_contract_order(bundle):
+    scorer = load_scorer(bundle)
+    assert scorer((600.0, "m_c", 2)) == scorer({"amount": 600.0, "merchant_id": "m_c", "hour": 2})
+
+
+def test_eval_csv_parity(bundle):
+    df = pd.read_csv(_REPO_ROOT / "data" / "eval.csv")
+    frame = run_predict(bundle, df)
+    scorer = load_scorer(bundle)
+    rows = [scorer(r) for r in df.to_dict("records")]
+    assert [r["score"] for r in rows] == frame["score"].tolist()
+    assert [r["probability"] for r in rows] == frame["probability"].tolist()
+
+
+def test_non_iso_timestamps_match_transform():
+    stamps = ["01/15/2024 13:00", "Jan 15 2024 2:05AM", "2024-01-15T23:59:00", "garbage", None]
+    expected = [transform(pd.DataFrame({"timestamp": [t]}))["hour"][0] for t in stamps]
+    assert [hour_from_timestamp(t) for t in stamps] == expected == [13, 2, 23, 0, 0]
+
+
+def test_row_path_scopes_its_warning_filter(bundle):
+    scorer = load_scorer(bundle, engine="sklearn")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")  # the row path silences sklearn's name check itself, nothing escapes
+        scorer(ROWS[0])
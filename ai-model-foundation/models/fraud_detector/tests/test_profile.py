@@ -0,0 +1,86 @@
+"""
+Tests for the data profiler: chunked/parallel profiles equal a single pass, sketch accuracy, saved profile.json.
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from foundation.core.config import load_contract
+from foundation.data.profile import HyperLogLog, SpaceSaving, load_profile, profile_file, write_profile
+
+
+@pytest.fixture(scope="module")
+def data(tmp_path_factory):
+    rng = np.random.default_rng(0)
+    n = 20000
+    df = pd.DataFrame({
+        "transaction_id": np.arange(n),
+        "amount": rng.lognormal(3, 1.5, n).round(2),
+        "merchant_id": [f"m_{i}" for i in rng.zipf(1.5, n) % 500],
+        "hour": rng.integers(0, 24, n),
+        "is_fraud": (rng.random(n) < 0.05).astype(int),
+    })
+    df.loc[rng.random(n) < 0.02, "amount"] = np.nan
+    path = tmp_path_factory.mktemp("profile") / "big.csv"
+    df.to_csv(path, index=False)
+    return df, path
+
+
+def test_chunked_parallel_profile_matches_single_pass(data):
+    df, path = data
+    contract = load_contract("fraud_detector")
+    whole = profile_file(path, contract, {"chunk_rows": len(df)}).to_dict()
+    chunked = profile_file(path, contract, {"chunk_rows": 1500, "workers": 3}).to_dict()
+    assert chunked["rows"] == whole["rows"] == len(df)
+    amount, ref = chunked["fields"]["amount"], whole["fields"]["amount"]
+    assert amount["null_count"] == df["amount"].isna().sum()
+    assert amount["mean"] == pytest.approx(df["amount"].mean(), rel=1e-12)
+    assert amount["std"] == pytest.approx(df["amount"].std(), rel=1e-9)
+    assert (amount["min"], amount["max"]) == (df["amount"].min(), df["amount"].max())
+    assert amount["distinct_approx"] == ref["distinct_approx"]  # HLL merge is exact (register max)
+    assert amount["histogram"] == ref["histogram"]
+    hour = chunked["fields"]["hour"]["histogram"]
+    assert hour["counts"] == df["hour"].value_counts().sort_index().tolist()  # one bin per hour
+
+
+def test_top_k_and_distinct_are_accurate(data):
+    df, path = data
+    profile = profile_file(path, load_contract("fraud_detector"), {"chunk_rows": 1000, "top_k": 5, "top_k_capacity": 50})
+    merchant = profile.to_dict()["fields"]["merchant_id"]
+    exact = df["merchant_id"].value_counts()
+    assert [t["value"] for t in merchant["top_k"]] == exact.index[:5].tolist()
+    for t in merchant["top_k"]:
+        assert t["count"] - t["error"] <= exact[t["value"]] <= t["count"]
+    assert merchant["distinct_approx"] == pytest.approx(df["merchant_id"].nunique(), rel=0.05)
+
+
+def test_sketches_merge():
+    a, b = HyperLogLog(12), HyperLogLog(12)
+    a.update_hashes(pd.util.hash_array(np.arange(0, 60000)))
+    b.update_hashes(pd.util.hash_array(np.arange(40000, 100000)))
+    a.merge(b)
+    assert a.estimate() == pytest.approx(100000, rel=0.05)
+
+    s = SpaceSaving(capacity=10)
+    s.update_counts(pd.Series({"x": 5, "y": 3}))
+    other = SpaceSaving(capacity=10)
+    other.update_counts(pd.Series({"y": 4, "z": 1}))
+    s.merge(other)
+    assert s.counts == {"x": 5, "y": 7, "z": 1} and set(s.errors.values()) == {0}  # exact below capacity
+
+
+def test_profile_saved_next_to_run(data, tmp_path):
+    _, path = data
+    profile = profile_file(path, load_contract("fraud_detector"))
+    out = write_profile(profile, tmp_path / "runs" / "r1", source=str(path))
+    assert out.name == "profile.json"
+    saved = load_profile(tmp_path / "runs" / "r1")
+    assert saved["source"] == str(path) and set(saved["fields"]) == {"amount", "merchant_id", "hour", "is_fraud"}
+    assert load_profile(tmp_path / "missing") is None
@@ -0,0 +1,77 @@
+"""
+Tests for MLflow logging of fraud_detector runs: async vs sync (file-based tracking URI, no server) and a real
+training result through the mlflow backend (a strict stand-in for the mlflow module when it is not installed).
+"""
+import contextlib
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from foundation.core import registry as registry_mod
+from foundation.core.registry import Registry
+from foundation.core.runner import run_train
+
+
+class _StrictMlflow:
+    """The mlflow calls Registry.log_run makes, rejecting non-numeric metrics the way MLflow does."""
+
+    def __init__(self):
+        self.metrics, self.params = {}, {}
+
+    def set_tracking_uri(self, uri):
+        pass
+
+    @contextlib.contextmanager
+    def start_run(self, run_name=None):
+        yield SimpleNamespace(info=SimpleNamespace(run_id=f"mlflow-{run_name}"))
+
+    def log_params(self, params):
+        self.params.update(params)
+
+    def log_metrics(self, metrics):
+        for k, v in metrics.items():
+            if isinstance(v, bool) or not isinstance(v, (int, float)):
+                raise TypeError(f"Got invalid value {v!r} for metric {k!r} (expected a number)")
+        self.metrics.update(metrics)
+
+    def log_artifacts(self, local_dir, artifact_path=None):
+        pass
+
+
+def test_train_result_logs_through_mlflow_backend(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    fake = _StrictMlflow()
+    monkeypatch.setattr(registry_mod, "_load_mlflow", lambda: fake)
+    result = run_train("fraud_detector", {}, str(_REPO_ROOT / "data" / "train.csv"), str(tmp_path / "artifact"), run_id="r1")
+    reg = Registry(backend="mlflow", uri="http://mlflow.invalid")
+    assert reg.log_run("fraud_detector", "r1", metrics=result["metrics"], params=result["params"]) == "mlflow-r1"
+    assert {"accuracy", "auc", "train_wall_sec"} <= set(fake.metrics)
+    assert fake.params["train_metrics_mode"] == "full"  # 10 rows: below sample_rows
+    assert json.loads((tmp_path / "artifact" / "metadata.json").read_text())["train_metrics_rows"] == 10
+
+
+def test_async_log_run_matches_sync(tmp_path, monkeypatch):
+    mlflow = pytest.importorskip("mlflow")
+    monkeypatch.chdir(tmp_path)  # mlflow backend keeps its local index in ./registry
+    artifact = tmp_path / "artifact"
+    artifact.mkdir()
+    (artifact / "metadata.json").write_text(json.dumps({"run_id": "r1"}))
+    reg = Registry(backend="mlflow", uri=(tmp_path / "mlruns").as_uri(), async_logging=True)
+    mlflow_run_id = reg.log_run(
+        "fraud_detector", "r1", metrics={"accuracy": 0.9, "auc": 0.8}, params={"n": 10}, artifact_path=str(artifact)
+    )
+    assert reg.flush(timeout=30)
+    reg.close()
+
+    run = mlflow.tracking.MlflowClient(tracking_uri=(tmp_path / "mlruns").as_uri()).get_run(mlflow_run_id)
+    assert run.data.metrics == {"accuracy": 0.9, "auc": 0.8}
+    assert run.data.params == {"n": "10"}
+    assert run.info.status == "FINISHED"
+    assert reg.get_run("fraud_detector", "r1")["mlflow_run_id"] == mlflow_run_id
@@ -0,0 +1,124 @@
+"""
+Tests for instant rollback: previous versions stay resident and switching needs no reload.
+"""
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+import foundation.core.runner as runner
+from foundation.core.config import load_config
+from foundation.core.registry import Registry
+from foundation.deploy import serving
+from foundation.deploy.predictor import Predictor
+from foundation.deploy.rollback import rollback_instant
+
+pytestmark = pytest.mark.filterwarnings("ignore:X does not have valid feature names")
+
+ROW = {"amount": 600.0, "merchant_id": "m_c", "hour": 2}
+
+
+@pytest.fixture(scope="module")
+def artifacts(train_bundle):
+    return {version: train_bundle(run_id=version) for version in ("v1", "v2", "v3")}
+
+
+def _deploy(model_dir: Path, artifact: Path, version: str) -> None:
+    model_dir.mkdir(exist_ok=True)
+    for name in ("model.bin", "metadata.json"):
+        shutil.copy2(artifact / name, model_dir / name)
+    meta = {"model_name": "fraud_detector", "version": version, "artifact_path": str(artifact)}
+    (model_dir / "deploy_meta.json").write_text(json.dumps(meta))
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    calls = []
+    real = runner.load_scorer
+
+    def counting(model_name, model_path, **kwargs):
+        calls.append(model_path)
+        return real(model_name, model_path, **kwargs)
+
+    monkeypatch.setattr(runner, "load_scorer", counting)
+    return calls
+
+
+def _predictor(model_dir: Path, keep: int) -> Predictor:
+    config = load_config("fraud_detector")
+    config["serving"] = {"rollback": {"keep_versions": keep, "prewarm": False}}
+    return Predictor("fraud_detector", model_dir, config=config)
+
+
+def test_outgoing_version_stays_resident(tmp_path, artifacts, loads):
+    model_dir = tmp_path / "embedded"
+    _deploy(model_dir, artifacts["v1"], "v1")
+    predictor = _predictor(model_dir, keep=1)
+    expected = predictor.predict(ROW)
+    _deploy(model_dir, artifacts["v2"], "v2")
+    predictor.predict(ROW)
+    assert predictor.version == "v2" and predictor.resident_versions() == ["v1"]
+    assert len(loads) == 2
+
+    timings = predictor.switch_to("v1")
+    assert timings["previous"] == "v2" and timings["time_to_rollback_ms"] >= 0
+    assert json.loads((model_dir / "deploy_meta.json").read_text())["version"] == "v2"  # disk untouched until synced
+    assert predictor.predict(ROW) == expected
+    assert len(loads) == 2  # no reload: pointer switch only
+    assert predictor.resident_versions() == ["v2"]  # and rolling forward is instant too
+
+    _deploy(model_dir, artifacts["v1"], "v1")  # files synced afterwards: same bundle, still no reload
+    predictor.predict(ROW)
+    assert len(loads) == 2
+
+
+def test_other_process_never_serves_stale_files_under_new_version(tmp_path, artifacts, loads, monkeypatch):
+    monkeypatch.setattr(serving, "_deployments_root", lambda: tmp_path)
+    model_dir = tmp_path / "deployments" / "embedded" / "fraud_detector"
+    serving.deploy_to_embedded("fraud_detector", "v1", str(artifacts["v1"]))
+    live, other = _predictor(model_dir, keep=1), _predictor(model_dir, keep=0)
+    v1 = live.predict(ROW)
+    serving.deploy_to_embedded("fraud_detector", "v2", str(artifacts["v2"]))
+    live.predict(ROW)
+    other.predict(ROW)
+    assert other.version == "v2"
+
+    rollback_instant(live, "v1", registry=_registry(tmp_path, artifacts), config=load_config("fraud_detector"))
+    assert live.version == "v1" and other.predict(ROW) == v1 and other.version == "v1"
+    meta = json.loads((model_dir / "deploy_meta.json").read_text())
+    assert meta["version"] == "v1" and meta["artifact_path"] == str(artifacts["v1"])
+    n = len(loads)
+    live.predict(ROW)
+    assert len(loads) == n  # the synced files are the bundle live already serves
+
+    # Same version label, different files (e.g. re-deployed from a rebuilt artifact): reloaded
+    shutil.copy(artifacts["v3"] / "model.bin", model_dir / "model.bin")
+    (model_dir / "deploy_meta.json").write_text(json.dumps({"model_name": "fraud_detector", "version": "v1"}))
+    live.predict(ROW)
+    assert len(loads) == n + 1 and loads[-1] == str(model_dir)
+
+
+def _registry(tmp_path, artifacts):
+    registry = Registry(uri=str(tmp_path / "registry"))
+    for version, path in artifacts.items():
+        registry.log_run("fraud_detector", version, artifact_path=str(path))
+    return registry
+
+
+def test_prewarm_from_registry(tmp_path, artifacts, loads):
+    registry = _registry(tmp_path, artifacts)
+    model_dir = tmp_path / "embedded"
+    _deploy(model_dir, artifacts["v3"], "v3")
+    predictor = _predictor(model_dir, keep=2)
+    predictor.predict(ROW)
+    assert predictor.prewarm(registry=registry) == ["v1", "v2"]
+    predictor.switch_to("v1")
+    assert predictor.version == "v1" and predictor.resident_versions() == ["v2", "v3"]
+    with pytest.raises(KeyError):
+        predictor.switch_to("missing")
@@ -0,0 +1,85 @@
+"""
+Tests for the runner's entrypoint registry: import once, reload on source change, preload timings, discovery
+following entrypoints added or removed inside model directories.
+"""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from foundation.core import runner
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    runner.clear_entrypoint_cache()
+    yield
+    runner.clear_entrypoint_cache()
+
+
+def test_entrypoint_imported_once_and_module_state_kept():
+    fn = runner.load_model_module("fraud_detector", "predict")
+    mod = runner.entrypoint_module("fraud_detector", "predict")
+    mod._probe = object()
+    assert runner.load_model_module("fraud_detector", "predict") is fn
+    assert runner.entrypoint_module("fraud_detector", "predict")._probe is mod._probe
+    assert sys.modules["models.fraud_detector.predict"] is mod
+    assert runner.load_model_module("fraud_detector", "missing") is None
+
+
+def test_changed_source_is_reimported():
+    path = _REPO_ROOT / "models" / "fraud_detector" / "predict.py"
+    before = runner.entrypoint_module("fraud_detector", "predict")
+    st = path.stat()
+    try:
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        after = runner.entrypoint_module("fraud_detector", "predict")
+    finally:
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert after is not before
+    assert callable(after.run_predict)
+
+
+def test_preload_reports_import_time_per_model():
+    models = runner.discover_models()
+    assert "fraud_detector" in models and "_template_model" not in models
+    assert set(models["fraud_detector"]) == {"train", "predict", "eval"}
+    assert runner.discover_models() is models  # cached
+
+    timings = runner.preload(entrypoints=("predict", "eval"))
+    assert set(timings) == set(models)
+    assert set(timings["fraud_detector"]) == {"predict", "eval"}
+    assert all(sec > 0 for per_model in timings.values() for sec in per_model.values())
+
+
+def test_discovery_follows_changes_inside_model_dirs(tmp_path, monkeypatch):
+    monkeypatch.setattr(runner, "_MODELS_ROOT", tmp_path)
+    toy, draft = tmp_path / "toy", tmp_path / "draft"
+    for d in (toy, draft):
+        d.mkdir()
+    for name in ("__init__.py", "train.py"):
+        (toy / name).write_text("")
+    tick = [tmp_path.stat().st_mtime_ns]
+
+    def touch(d):  # distinct mtimes even on coarse-grained filesystems
+        tick[0] += 1_000_000_000
+        os.utime(d, ns=(tick[0], tick[0]))
+
+    touch(toy)
+    touch(draft)
+    assert runner.discover_models() == {"toy": ["train"]}
+    (toy / "predict.py").write_text("")  # models/ itself is unchanged
+    touch(toy)
+    assert runner.discover_models() == {"toy": ["train", "predict"]}
+    (draft / "__init__.py").write_text("")
+    touch(draft)
+    assert runner.discover_models() == {"draft": [], "toy": ["train", "predict"]}
+    (toy / "train.py").unlink()
+    touch(toy)
+    models = runner.discover_models()
+    assert models["toy"] == ["predict"] and runner.discover_models() is models
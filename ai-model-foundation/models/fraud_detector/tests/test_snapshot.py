@@ -0,0 +1,67 @@
+"""
+Tests for persisted monitor snapshots: binary roundtrip, fleet merge, restore after restart.
+"""
+import sys
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from foundation.observability import Monitor
+from foundation.observability.snapshot import SnapshotWriter, StatsSnapshot, merge_snapshots
+
+T0 = 1_700_000_000.0
+
+
+def _replica(seconds: int, latency: float, offset: int = 0) -> Monitor:
+    monitor = Monitor()
+    clock = [T0]
+    monitor.windowed.clock = lambda: clock[0]
+    for i in range(seconds):
+        clock[0] = T0 + offset + i
+        monitor.record_latency(latency)
+        monitor.record_prediction(0.5)
+        if i % 20 == 0:
+            monitor.record_error(RuntimeError("x"))
+    monitor.record_cache(True)
+    return monitor
+
+
+def test_roundtrip_is_exact_and_compact():
+    monitor = _replica(2 * 3600, 0.004)
+    snap = StatsSnapshot.from_monitor(monitor, source="a")
+    data = snap.to_bytes()
+    back = StatsSnapshot.from_bytes(data)
+    now = T0 + 2 * 3600
+    for window in (60, 300, 3600, 7200):
+        assert back.query(window, now=now) == snap.query(window, now=now) == monitor.windowed.query(window, now=now)
+    assert back.sources == ["a"] and back.counters == {"cache_hits": 1, "cache_misses": 0}
+    assert len(data) < 20_000  # 7200 events, 3 resolutions
+
+
+def test_fleet_merge_equals_sum_of_replicas(tmp_path):
+    a = _replica(3600, 0.002)
+    b = _replica(1800, 0.050, offset=1500)  # different activity span and latency profile
+    for name, monitor in (("a", a), ("b", b)):
+        StatsSnapshot.from_monitor(monitor, source=name).write(tmp_path / f"fraud_detector.{name}.monsnap")
+    fleet = merge_snapshots(tmp_path, name="fraud_detector")
+    now = T0 + 3600
+    for window in (300, 3600, 86400):
+        qa, qb, qf = (s.query(window, now=now) for s in (a.windowed, b.windowed, fleet))
+        assert qf["request_count"] == qa["request_count"] + qb["request_count"]
+        assert qf["error_count"] == qa["error_count"] + qb["error_count"]
+    fleet_hour = fleet.query(3600, now=now)
+    assert fleet_hour["latency_p50"] < 0.01 < fleet_hour["latency_p99"]  # mix of both replicas
+    assert sorted(fleet.sources) == ["a", "b"] and fleet.counters["cache_hits"] == 2
+
+
+def test_writer_restores_after_restart(tmp_path):
+    first = _replica(600, 0.01)
+    SnapshotWriter(first, tmp_path, name="fraud_detector", replica_id="pod-0", interval_sec=3600).start().stop()
+    restarted = Monitor()
+    restarted.windowed.clock = lambda: T0 + 600
+    writer = SnapshotWriter(restarted, tmp_path, name="fraud_detector", replica_id="pod-0", interval_sec=3600).start()
+    assert restarted.window_kpis(3600)["request_count"] == first.windowed.query(3600, now=T0 + 600)["request_count"]
+    writer.stop()
+    assert writer.writes == 1
@@ -0,0 +1,64 @@
+"""
+Tests for the async MLflow tracker worker with a stub client: batching, and bad payloads that are recorded and
+skipped without ending the worker thread.
+"""
+import sys
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from foundation.core.tracking import AsyncTracker
+
+
+class _StubClient:
+    def __init__(self):
+        self.batches, self.terminated = [], []
+
+    def log_batch(self, run_id, metrics=(), params=()):
+        self.batches.append((run_id, {m.key: m.value for m in metrics}, {p.key: p.value for p in params}))
+
+    def set_terminated(self, run_id, status):
+        self.terminated.append((run_id, status))
+
+    def log_artifacts(self, run_id, local_dir, artifact_path=None):
+        raise OSError("artifact store unreachable")
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    # mlflow.entities stand-in (only Metric / Param records are built from it)
+    entities = ModuleType("mlflow.entities")
+    entities.Metric = lambda key, value, timestamp, step: SimpleNamespace(key=key, value=value)
+    entities.Param = lambda key, value: SimpleNamespace(key=key, value=value)
+    monkeypatch.setitem(sys.modules, "mlflow", sys.modules.get("mlflow") or ModuleType("mlflow"))
+    monkeypatch.setitem(sys.modules, "mlflow.entities", entities)
+    client = _StubClient()
+    t = AsyncTracker("stub://", client=client, max_retries=0, retry_backoff_sec=0)
+    yield t, client
+    t.close(timeout=5)
+
+
+def test_bad_payloads_are_recorded_and_worker_survives(tracker):
+    t, client = tracker
+    t.log_metrics("r1", {"accuracy": 0.9, "mode": "full", "rows": None})
+    t._put(("metrics", "r1"))  # malformed item
+    t.log_artifacts("r1", "/nonexistent")
+    assert t.flush(timeout=5)
+    assert t._worker.is_alive()
+
+    t.log_params("r1", {"n": 10})
+    t.log_metrics("r1", {"auc": 0.8})
+    t.end_run("r1")
+    assert t.flush(timeout=5)
+    assert t._worker.is_alive()
+    logged = {k: v for _, metrics, _ in client.batches for k, v in metrics.items()}
+    assert logged == {"accuracy": 0.9, "auc": 0.8}
+    assert any(params == {"n": "10"} for _, _, params in client.batches)
+    assert client.terminated == [("r1", "FINISHED")]
+    assert t.stats["failures"] == 2  # malformed item + artifact upload
+    assert sum("non-numeric" in e for e in t.errors) == 2
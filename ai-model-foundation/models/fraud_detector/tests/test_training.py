@@ -0,0 +1,103 @@
+"""
+Tests for training resources (config precedence, seeded fits independent of n_jobs, usage metrics, fit-time
+n_jobs kept out of saved and loaded models) and single-pass training metrics (full, stratified sample, out-of-bag).
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from foundation.core.artifacts import load_bundle
+from foundation.core.config import load_config
+from foundation.core.runner import run_train
+from foundation.core.training import _stratified_sample, estimator_params, train_resources, training_metrics
+
+pytestmark = pytest.mark.filterwarnings("ignore:X does not have valid feature names")
+
+TRAIN_CSV = str(_REPO_ROOT / "data" / "train.csv")
+
+
+def test_model_train_section_overrides_runner_defaults():
+    config = load_config("fraud_detector")
+    config["runner"]["train"] = {"n_jobs": 4, "max_threads": 1, "seed": 7, "estimator": {"max_depth": 3}}
+    config["train"] = {"n_jobs": 2, "estimator": {"n_estimators": 50}}
+    res = train_resources(config)
+    assert (res["n_jobs"], res["max_threads"], res["seed"]) == (2, 1, 7)
+    params = estimator_params(res, n_estimators=10, min_samples_leaf=2)
+    assert params == {"n_estimators": 50, "max_depth": 3, "min_samples_leaf": 2, "n_jobs": 2, "random_state": 7, "oob_score": True}
+
+
+def test_fit_is_identical_for_any_n_jobs(tmp_path):
+    probas = []
+    for n_jobs in (1, 2):
+        config = load_config("fraud_detector")
+        config["train"] = {"n_jobs": n_jobs, "max_threads": 1, "estimator": {"n_estimators": 16}}
+        out = tmp_path / f"jobs{n_jobs}"
+        result = run_train("fraud_detector", config, TRAIN_CSV, str(out), run_id="t")
+        model, meta = load_bundle(out)
+        assert model.n_jobs is None and len(model.estimators_) == 16  # fit-time workers are not serving workers
+        X = np.zeros((4, len(meta["feature_columns"])))
+        X[:, 0] = [1.0, 50.0, 400.0, 900.0]
+        probas.append(model.predict_proba(X))
+        metrics = result["metrics"]
+        assert metrics["train_n_jobs"] == n_jobs
+        assert metrics["train_wall_sec"] > 0 and metrics["train_cpu_sec"] >= 0
+        assert metrics["train_cpu_utilization"] >= 0
+    np.testing.assert_array_equal(probas[0], probas[1])
+
+
+def test_saved_and_loaded_models_predict_single_threaded(tmp_path):
+    import joblib
+
+    config = load_config("fraud_detector")
+    config["train"] = {"n_jobs": -1}
+    run_train("fraud_detector", config, TRAIN_CSV, str(tmp_path), run_id="t")
+    assert joblib.load(tmp_path / "model.bin").n_jobs is None
+    # A bundle written before n_jobs was reset still predicts single-threaded
+    model = joblib.load(tmp_path / "model.bin").set_params(n_jobs=-1)
+    joblib.dump(model, tmp_path / "model.bin")
+    assert load_bundle(tmp_path)[0].n_jobs is None
+
+
+def _fitted(mode, n=3000, **metrics_cfg):
+    from sklearn.ensemble import RandomForestClassifier
+
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(n, 4))
+    y = (X[:, 0] + rng.normal(scale=0.5, size=n) > 1.2).astype(int)  # imbalanced
+    res = train_resources({"train": {"n_jobs": 1, "metrics": {"mode": mode, **metrics_cfg}}})
+    model = RandomForestClassifier(**estimator_params(res, n_estimators=20)).fit(X, y)
+    return model, X, y, res
+
+
+def test_full_mode_matches_predict_and_predict_proba():
+    from sklearn.metrics import accuracy_score, roc_auc_score
+
+    model, X, y, res = _fitted("full")
+    m, info = training_metrics(model, X, y, res)
+    assert m["accuracy"] == accuracy_score(y, model.predict(X))
+    assert m["auc"] == roc_auc_score(y, model.predict_proba(X)[:, 1])
+    assert info == {"train_metrics_mode": "full", "train_metrics_rows": len(y)}
+
+
+def test_sample_mode_is_stratified_and_close_to_full():
+    model, X, y, res = _fitted("sample", sample_rows=500)
+    m, info = training_metrics(model, X, y, res)
+    full, _ = training_metrics(model, X, y, {**res, "metrics": {"mode": "full"}})
+    assert info["train_metrics_mode"] == "sample" and abs(info["train_metrics_rows"] - 500) <= 2
+    assert abs(m["accuracy"] - full["accuracy"]) < 0.02
+    idx = _stratified_sample(y, 500, 42)
+    assert abs(y[idx].mean() - y.mean()) < 0.01
+
+
+def test_oob_mode_uses_out_of_bag_predictions():
+    model, X, y, res = _fitted("oob")
+    assert model.oob_score
+    m, info = training_metrics(model, X, y, res)
+    assert info["train_metrics_mode"] == "oob" and info["train_metrics_rows"] <= len(y)
+    assert abs(m["accuracy"] - model.oob_score_) < 0.01  # honest estimate, below the in-sample score
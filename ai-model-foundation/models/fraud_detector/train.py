@@ -7,6 +7,8 @@ import uuid
 from pathlib import Path
 
 from foundation.core.artifacts import save_bundle
+from foundation.core.training import estimator_params, resource_usage, thread_limits, train_resources, training_metrics
+from foundation.eval.calibration import fit_decision
 
 # Import from same package
 from . import features as feat_mod
@@ -21,27 +23,24 @@ def run_train(
     """Train model and save bundle. Returns run_id and metrics."""
     import pandas as pd
     from sklearn.ensemble import RandomForestClassifier
-    from sklearn.metrics import accuracy_score, roc_auc_score
 
     df = pd.read_csv(data_path)
-    df = feat_mod.transform(df)
-    cols = feat_mod.get_feature_columns()
+    df = feat_mod.transform(df, config)
+    cols = feat_mod.get_feature_columns(config)
     X = pd.get_dummies(df[cols], columns=["merchant_id"] if "merchant_id" in cols else [])
     y = df[config.get("data_contract", {}).get("target", {}).get("name", "is_fraud")]
 
-    model = RandomForestClassifier(n_estimators=10, random_state=42)
-    model.fit(X, y)
-    pred = model.predict(X)
-    proba = model.predict_proba(X)[:, 1] if hasattr(model, "predict_proba") else pred
+    resources = train_resources(config)
+    model = RandomForestClassifier(**estimator_params(resources, n_estimators=10))
+    with resource_usage(resources) as usage, thread_limits(resources["max_threads"]):
+        model.fit(X, y)
 
-    metrics = {
-        "accuracy": float(accuracy_score(y, pred)),
-        "auc": float(roc_auc_score(y, proba)) if len(set(y)) > 1 else 0.0,
-    }
+    train_metrics, metrics_info = training_metrics(model, X, y, resources)
+    metrics = {**train_metrics, **usage}
     run_id = kwargs.get("run_id") or str(uuid.uuid4())[:8]
-    save_bundle(
-        output_path,
-        model,
-        metadata={"run_id": run_id, "metrics": metrics, "feature_columns": list(X.columns)},
-    )
-    return {"run_id": run_id, "metrics": metrics}
+    metadata = {"run_id": run_id, "metrics": metrics, "feature_columns": list(X.columns), **metrics_info}
+    metadata.update(fit_decision(model, X, y, config, frame=df))  # calibration + cost-optimal score_threshold
+    if config.get("feature_store", {}).get("enabled", False):
+        metadata["feature_store"] = config["feature_store"]  # predict reads the same store
+    save_bundle(output_path, model, metadata=metadata)
+    return {"run_id": run_id, "metrics": metrics, "params": metrics_info}
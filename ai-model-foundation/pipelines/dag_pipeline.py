@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+DAG pipeline: validate + profile (train + eval data, concurrently) -> train -> eval -> deploy, with step caching.
+Config is parsed once (foundation.core.config) and shared by all steps. Re-run with the same --run-id to reuse unchanged steps;
+timing and cache status are written to runs/<run_id>/pipeline.json.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+# Config sections that do not affect the trained artifact (changing them must not retrain)
+_NON_TRAIN_KEYS = ("eval", "deploy", "serving", "observability", "profile", "depends_on", "compact", "loadtest")
+
+
+def build_steps(model: str, config: dict, run_id: str, target: str | None, dataset: str) -> list:
+    """Define pipeline nodes for one model run."""
+    import json
+    from datetime import datetime
+
+    from foundation.cli import EVAL_GATE_FAIL_EXIT_CODE
+    from foundation.core.dag import Step
+    from foundation.core.registry import Registry
+
+    model_dir = _REPO_ROOT / "models" / model
+    train_path = Path(config.get("data", {}).get("train_path", "data/train.csv"))
+    eval_path = Path(config.get("data", {}).get("eval_path", "data/eval.csv"))
+    runs_root = Path(config.get("runs", {}).get("root") or config.get("artifacts", {}).get("root", "./runs"))
+    run_dir = runs_root / run_id
+    artifact = run_dir / "artifact"
+    reg_cfg = config.get("registry", {})
+    reg = Registry(
+        backend=reg_cfg.get("backend", "local"),
+        uri=reg_cfg.get("uri", "./registry"),
+        async_logging=reg_cfg.get("async_logging", False),
+        log_queue_size=reg_cfg.get("log_queue_size", 1000),
+        log_retries=reg_cfg.get("log_retries", 3),
+    )
+    contract_dict = config.get("data_contract", {})
+
+    def validate(data_path: Path):
+        def fn() -> int:
+            import pandas as pd
+            from foundation.core.config import load_contract
+            from foundation.data.validate import validate_dataframe
+            contract = load_contract(model)
+            if contract is None:
+                print(f"[validate {data_path}] No data_contract in model config", file=sys.stderr)
+                return 1
+            errors = validate_dataframe(pd.read_csv(data_path), contract)
+            for e in errors:
+                print(f"[validate {data_path}] {e}", file=sys.stderr)
+            return 1 if errors else 0
+        return fn
+
+    def profile() -> int:
+        from foundation.core.config import load_contract
+        from foundation.data.profile import profile_file, write_profile
+        contract = load_contract(model)
+        if contract is None:
+            return 0  # validate_train reports the missing contract
+        write_profile(profile_file(train_path, contract, config.get("profile", {})), run_dir, source=str(train_path))
+        return 0
+
+    def train() -> int:
+        from foundation.core.runner import run_train
+        artifact.mkdir(parents=True, exist_ok=True)
+        result = run_train(
+            model_name=model,
+            config=config,
+            data_path=str(train_path),
+            output_path=str(artifact),
+            run_id=run_id,
+            dataset=dataset,
+        )
+        metrics = result.get("metrics") or {}
+        params = {"model": model, "dataset": dataset, "data_path": str(train_path), "run_id": run_id, **(result.get("params") or {})}
+        meta = {"run_id": run_id, "model_name": model, "dataset": dataset, "artifact_path": str(artifact)}
+        meta["timestamp"] = datetime.now().isoformat()
+        (run_dir / "metrics.json").write_text(json.dumps(metrics, indent=2))
+        (run_dir / "params.json").write_text(json.dumps(params, indent=2))
+        (run_dir / "meta.json").write_text(json.dumps(meta, indent=2))
+        reg.log_run(model, run_id, metrics=metrics, params=params, artifact_path=str(artifact))
+        return 0
+
+    def evaluate() -> int:
+        from foundation.eval.harness import run_harness
+        result = run_harness(
+            model_name=model,
+            model_path=str(artifact),
+            eval_data_path=str(eval_path),
+            config=config,
+            registry=reg,
+        )
+        print(f"[eval] cached={result['cached']} gate_passed={result['gate_passed']} metrics={result['metrics']}")
+        return 0 if result["gate_passed"] else EVAL_GATE_FAIL_EXIT_CODE
+
+    def deploy() -> int:
+        from foundation.deploy.serving import deploy_to_target
+        metrics = reg.get_run(model, run_id).get("metrics")
+        deploy_to_target(model, run_id, str(artifact), target=target, metrics=metrics, config=config)
+        return 0
+
+    sources = sorted(model_dir.glob("*.py"))
+    train_params = {k: v for k, v in config.items() if k not in _NON_TRAIN_KEYS}
+    steps = [
+        Step("validate_train", validate(train_path), inputs=[train_path], params={"data_contract": contract_dict}),
+        Step("validate_eval", validate(eval_path), inputs=[eval_path], params={"data_contract": contract_dict}),
+        Step(
+            "profile",
+            profile,
+            inputs=[train_path],
+            outputs=[run_dir / "profile.json"],
+            params={"profile": config.get("profile", {}), "data_contract": contract_dict},
+        ),
+        Step(
+            "train",
+            train,
+            inputs=[train_path, *sources],
+            outputs=[artifact],
+            params={"config": train_params, "run_id": run_id, "dataset": dataset},
+            deps=["validate_train"],
+        ),
+        Step(
+            "eval",
+            evaluate,
+            inputs=[artifact, eval_path, _REPO_ROOT / "baselines" / f"{model}.json", *sources],
+            params={"eval": config.get("eval", {}), "data_contract": contract_dict},
+            deps=["train", "validate_eval"],
+        ),
+    ]
+    if target:
+        from foundation.deploy.serving import _deployments_root
+        steps.append(Step(
+            "deploy",
+            deploy,
+            inputs=[artifact],
+            outputs=[_deployments_root() / "deployments" / "embedded" / model],
+            params={"deploy": config.get("deploy", {}), "target": target, "run_id": run_id},
+            deps=["eval"],
+        ))
+    return steps
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model", required=True)
+    parser.add_argument("--run-id", default=None, help="Reuse a run ID to skip unchanged steps (default: model_YYYYMMDD_HHMMSS)")
+    parser.add_argument("--dataset", default="default")
+    parser.add_argument("--target", default=None, choices=["staging", "prod"], help="Deploy after eval gates pass")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--force", action="store_true", help="Ignore step cache and re-run everything")
+    args = parser.parse_args()
+
+    from datetime import datetime
+    from foundation.core.config import load_config
+    from foundation.core.dag import run_dag
+
+    if not (_REPO_ROOT / "models" / args.model / "model.yaml").exists():
+        print(f"Missing models/{args.model}/model.yaml", file=sys.stderr)
+        return 1
+    config = load_config(args.model)
+    run_id = args.run_id or f"{args.model}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    runs_root = Path(config.get("runs", {}).get("root") or config.get("artifacts", {}).get("root", "./runs"))
+    steps = build_steps(args.model, config, run_id, args.target, args.dataset)
+    result = run_dag(steps, runs_root / run_id / "pipeline.json", max_workers=args.workers, force=args.force)
+
+    print(f"Run ID: {run_id}")
+    for step in steps:
+        name, rec = step.name, result["steps"][step.name]
+        print(f"  {name:<16} {rec['status']:<8} {rec['duration_sec']:.3f}s")
+    print(f"Total: {result['duration_sec']:.3f}s (state: {runs_root / run_id / 'pipeline.json'})")
+    return result["exit_code"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
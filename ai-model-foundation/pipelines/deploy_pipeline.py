@@ -21,19 +21,12 @@ def main() -> int:
     parser.add_argument("--rollback", action="store_true")
     args = parser.parse_args()
 
-    import yaml
+    from foundation.core.config import load_config
     from foundation.core.registry import Registry
     from foundation.deploy.serving import deploy_to_target
     from foundation.deploy.rollback import rollback_to_version
 
-    config_path = _REPO_ROOT / "models" / args.model / "model.yaml"
-    config = yaml.safe_load(config_path.read_text()) or {} if config_path.exists() else {}
-    defaults = _REPO_ROOT / "foundation" / "config" / "defaults.yaml"
-    if defaults.exists():
-        def_cfg = yaml.safe_load(defaults.read_text()) or {}
-        for k, v in def_cfg.items():
-            if k not in config:
-                config[k] = v
+    config = load_config(args.model)
 
     if args.rollback:
         rollback_to_version(args.model, args.version, config=config)
@@ -18,20 +18,14 @@ def main() -> int:
     parser.add_argument("--model", required=True)
     parser.add_argument("--run-id", required=True)
     parser.add_argument("--eval-data", default=None)
+    parser.add_argument("--force", action="store_true", help="Recompute even if a cached eval result matches")
     args = parser.parse_args()
 
-    import yaml
+    from foundation.core.config import load_config
     from foundation.core.registry import Registry
     from foundation.eval.harness import run_harness
 
-    config_path = _REPO_ROOT / "models" / args.model / "model.yaml"
-    config = yaml.safe_load(config_path.read_text()) or {} if config_path.exists() else {}
-    defaults = _REPO_ROOT / "foundation" / "config" / "defaults.yaml"
-    if defaults.exists():
-        def_cfg = yaml.safe_load(defaults.read_text()) or {}
-        for k, v in def_cfg.items():
-            if k not in config:
-                config[k] = v
+    config = load_config(args.model)
 
     runs_root = Path(config.get("runs", {}).get("root") or config.get("artifacts", {}).get("root", "./runs"))
     reg = Registry(uri=config.get("registry", {}).get("uri", "./registry"))
@@ -44,9 +38,14 @@ def main() -> int:
         model_path=model_path,
         eval_data_path=eval_data,
         config=config,
+        registry=reg,
+        force=args.force,
     )
+    print("cached:", result["cached"])
     print("gate_passed:", result["gate_passed"])
     print("metrics:", result["metrics"])
+    if "intervals" in result:
+        print("intervals:", result["intervals"])
     print("gate_details:", result["gate_details"])
     return 0 if result["gate_passed"] else 1
 
@@ -20,7 +20,7 @@ def main() -> int:
     parser.add_argument("--run-id", default=None)
     args = parser.parse_args()
 
-    import yaml
+    from foundation.core.config import load_config
     from foundation.core.runner import run_train
     from foundation.core.registry import Registry
 
@@ -28,13 +28,7 @@ def main() -> int:
     if not config_path.exists():
         print(f"Missing {config_path}", file=sys.stderr)
         return 1
-    config = yaml.safe_load(config_path.read_text()) or {}
-    defaults = _REPO_ROOT / "foundation" / "config" / "defaults.yaml"
-    if defaults.exists():
-        def_cfg = yaml.safe_load(defaults.read_text()) or {}
-        for k, v in def_cfg.items():
-            if k not in config:
-                config[k] = v
+    config = load_config(args.model)
 
     data_path = args.data_path or config.get("data", {}).get("train_path", "data/train.csv")
     runs_root = Path(config.get("runs", {}).get("root") or config.get("artifacts", {}).get("root", "./runs"))
@@ -55,7 +49,7 @@ def main() -> int:
     run_id = result.get("run_id", run_id)
     (run_dir / "metrics.json").write_text(json.dumps(result.get("metrics") or {}, indent=2))
     reg = Registry(uri=config.get("registry", {}).get("uri", "./registry"))
-    reg.log_run(args.model, run_id, metrics=result.get("metrics"), artifact_path=str(output_path))
+    reg.log_run(args.model, run_id, metrics=result.get("metrics"), params=result.get("params"), artifact_path=str(output_path))
     print(f"Run ID: {run_id}")
     print("Metrics:", result.get("metrics"))
     return 0
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark compiled forest inference (foundation.core.forest) against sklearn predict_proba across batch sizes.
+Trains a fraud_detector-shaped forest on synthetic data unless --model-path points at a bundle.
+Run from repo root:  python scripts/bench_forest.py [--model-path runs/<run_id>/artifact] [--repeats 5]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+BATCH_SIZES = (1, 10, 100, 1_000, 10_000, 100_000)
+
+
+def best_ms(fn, X, repeats: int) -> float:
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn(X)
+        times.append((time.perf_counter() - t0) * 1000)
+    return min(times)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model-path", default=None, help="Bundle directory (default: train a synthetic forest)")
+    parser.add_argument("--n-estimators", type=int, default=100)
+    parser.add_argument("--max-depth", type=int, default=10)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    import numpy as np
+    from foundation.core.forest import CompiledForest
+
+    rng = np.random.default_rng(0)
+    if args.model_path:
+        from foundation.core.artifacts import load_bundle
+        model, _ = load_bundle(args.model_path)
+    else:
+        from sklearn.ensemble import RandomForestClassifier
+        X_train = rng.normal(size=(5000, 12))
+        y_train = (X_train[:, 0] + X_train[:, 1] * X_train[:, 2] > 0.5).astype(int)
+        model = RandomForestClassifier(n_estimators=args.n_estimators, max_depth=args.max_depth, random_state=42)
+        model.fit(X_train, y_train)
+    compiled = CompiledForest.from_model(model)
+    if compiled is None:
+        print("Model is not a supported forest", file=sys.stderr)
+        return 1
+
+    n_features = compiled.n_features_in_
+    X_all = rng.normal(size=(max(BATCH_SIZES), n_features)).astype(np.float32)
+    print(f"trees={len(compiled.roots)} max_depth={compiled.max_depth} features={n_features}")
+    print(f"{'batch':>8} {'sklearn ms':>12} {'compiled ms':>12} {'speedup':>8}")
+    for n in BATCH_SIZES:
+        X = X_all[:n]
+        if not np.array_equal(model.predict_proba(X), compiled.predict_proba(X)):
+            print(f"Parity check failed at batch size {n}", file=sys.stderr)
+            return 1
+        repeats = args.repeats if n < 10_000 else max(1, args.repeats // 2)
+        sk = best_ms(model.predict_proba, X, repeats)
+        cf = best_ms(compiled.predict_proba, X, repeats)
+        print(f"{n:>8} {sk:>12.3f} {cf:>12.3f} {sk / cf:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Per-call overhead of foundation.core.logging.log_structured: sync vs async (queue + batched writer) vs sampled.
+Writes to /dev/null, then to a sink that costs 50us per write (a blocking stdout), timing the logging thread.
+Run from repo root:  python scripts/bench_logging.py [--calls 100000]
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+class SlowSink:
+    """Stand-in for a blocking stdout (pipe to a busy collector): each write costs write_us."""
+
+    def __init__(self, write_us: float):
+        self.write_us = write_us
+
+    def write(self, text: str) -> int:
+        deadline = time.perf_counter() + self.write_us / 1e6
+        while time.perf_counter() < deadline:
+            pass
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+def per_call_us(calls: int, sink=None, **configure) -> tuple[float, dict]:
+    from foundation.core import logging as flog
+
+    with open(os.devnull, "w") as devnull:
+        flog.configure_logging(stream=sink or devnull, **configure)
+        before = flog.logging_stats()
+        t0 = time.perf_counter()
+        for i in range(calls):
+            flog.log_structured(logging.INFO, "prediction", event="prediction", model="fraud_detector", score=i % 2, probability=0.25, latency_ms=1.5)
+        elapsed = time.perf_counter() - t0
+        flog.shutdown_logging()
+        after = flog.logging_stats()
+    return elapsed / calls * 1e6, {k: after[k] - before[k] for k in after}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=100_000)
+    args = parser.parse_args()
+
+    cases = [
+        ("sync", {}),
+        ("async", {"async_mode": True, "queue_size": args.calls}),
+        ("async, small queue (drops)", {"async_mode": True, "queue_size": 1000}),
+        ("sync, 1% sampled", {"sample_rates": {"prediction": 0.01}}),
+        ("async, 1% sampled", {"async_mode": True, "sample_rates": {"prediction": 0.01}}),
+        ("level above INFO", {"level": "WARNING"}),
+        ("sync, slow stdout", {"sink": SlowSink(50)}),
+        ("async, slow stdout", {"async_mode": True, "queue_size": args.calls, "sink": SlowSink(50)}),
+    ]
+    print(f"{'mode':<28} {'us/call':>8}  counters")
+    for name, cfg in cases:
+        us, stats = per_call_us(args.calls, **cfg)
+        print(f"{name:<28} {us:>8.2f}  {stats}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmark for the foundation CLI and SDK packages (python -X importtime based).
+Fails (exit 1) when the import budget is exceeded or a heavy dependency is imported eagerly.
+Run from repo root:  python scripts/bench_startup.py [--budget-ms 50] [--runs 5]
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Importing the SDK packages (what `foundation --help` and small commands like deploy pay for)
+IMPORT_TARGETS = "import foundation.cli, foundation.core, foundation.data, foundation.deploy, foundation.eval, foundation.observability"
+# Must stay deferred until a command actually needs them
+HEAVY_MODULES = ("mlflow", "sklearn", "pandas", "joblib", "numpy", "scipy")
+
+
+def import_profile() -> list[tuple[str, int, int, bool]]:
+    """Run -X importtime in a fresh interpreter. Returns [(module, self_us, cumulative_us, top_level)]."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_TARGETS],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:"):].split("|")
+        # Nested imports are indented under their importer; top-level entries have one leading space
+        rows.append((name.strip(), int(self_us), int(cum_us), not name.startswith("  ")))
+    return rows
+
+
+def cli_wall_ms(argv: list[str], runs: int) -> float:
+    """Median wall time (ms) of `python foundation/cli.py <argv>` over runs."""
+    times = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, "foundation/cli.py", *argv], cwd=REPO_ROOT, capture_output=True)
+        times.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(times)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark foundation import/startup time")
+    parser.add_argument("--budget-ms", type=float, default=50.0, help="Max cumulative import time of the SDK packages")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="Show the N slowest imports")
+    args = parser.parse_args()
+
+    profiles = [import_profile() for _ in range(args.runs)]
+    totals = [sum(cum for name, _, cum, top in rows if top and name.startswith("foundation")) for rows in profiles]
+    import_ms = statistics.median(totals) / 1000
+    rows = profiles[-1]
+    heavy = sorted({name.split(".")[0] for name, _, _, _ in rows if name.split(".")[0] in HEAVY_MODULES})
+
+    print(f"SDK import time (median of {args.runs}): {import_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    print("Slowest imports (cumulative):")
+    for name, _, cum, _ in sorted(rows, key=lambda r: r[2], reverse=True)[: args.top]:
+        print(f"  {cum / 1000:8.2f} ms  {name}")
+    print(f"`foundation --help` wall time: {cli_wall_ms(['--help'], args.runs):.1f} ms (includes interpreter startup)")
+
+    failed = False
+    if heavy:
+        print(f"FAIL: heavy modules imported at startup: {', '.join(heavy)}", file=sys.stderr)
+        failed = True
+    if import_ms > args.budget_ms:
+        print(f"FAIL: import time {import_ms:.1f} ms exceeds budget {args.budget_ms:.0f} ms", file=sys.stderr)
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -33,7 +33,9 @@ def main():
         print(f"Embedded model: {meta.get('model_name')} (version: {meta.get('version')}, stage: {meta.get('stage')})")
         print()
 
-    from foundation.core.runner import run_predict
+    from foundation.deploy.predictor import Predictor
+
+    predictor = Predictor(args.model, embedded_dir)
 
     # Example inputs (same schema as fraud_detector: amount, merchant_id, hour)
     examples = [
@@ -44,7 +46,7 @@ def main():
     print("Predictions (score=1 means fraud, probability in [0,1]):")
     print("-" * 50)
     for i, row in enumerate(examples, 1):
-        out = run_predict(args.model, str(embedded_dir), row)
+        out = predictor.predict(row)
         if isinstance(out, dict):
             print(f"  {i}. amount={row['amount']}, merchant={row['merchant_id']}, hour={row['hour']}")
             print(f"     -> score={out.get('score')}, probability={out.get('probability', 0):.3f}")